@@ -24,10 +24,10 @@ a2: (10, m)     → Softmax sonrası (olasılıklar)
 """
 
 import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.model_selection import train_test_split
-import pandas as pd
 
 # Tekrarlanabilirlik için seed
 np.random.seed(42)
@@ -37,20 +37,21 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TRAIN_CSV = os.path.join(SCRIPT_DIR, "fashion-mnist_train.csv")
 TEST_CSV = os.path.join(SCRIPT_DIR, "fashion-mnist_test.csv")
 
+# CSV okuyucu neural_networks/data paketinde (binary cache)
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "neural_networks"))
+from data import load_fashion_mnist
+
 class_names = ['T-shirt/top', 'Trouser', 'Pullover', 'Dress', 'Coat',
                'Sandal', 'Shirt', 'Sneaker', 'Bag', 'Ankle boot']
 
-train_data = pd.read_csv(TRAIN_CSV)
-#print(f"Train CSV boyutu: {train_data.shape}")
-
-test_data = pd.read_csv(TEST_CSV)
-#print(f"Test CSV boyutu: {test_data.shape}")
-
-y_train = train_data.iloc[:,0].values
-X_train = train_data.iloc[:,1:].values
+# İlk çalıştırmada CSV bir kez uint8 .npy dosyalarına çevrilir; sonraki
+# çalıştırmalar onları memory-map ile milisaniyede açar (CSV değişirse
+# cache yeniden oluşturulur)
+X_train, y_train = load_fashion_mnist(TRAIN_CSV)   # (60000, 784) uint8, (60000,)
+#print(f"Train boyutu: {X_train.shape}")
 
-y_test = test_data.iloc[:,0].values
-X_test = test_data.iloc[:,1:].values
+X_test, y_test = load_fashion_mnist(TEST_CSV)
+#print(f"Test boyutu: {X_test.shape}")
 
 # print(f"\nEğitim seti:")
 # print(f"  X_train: {X_train.shape}  → (örnek sayısı, piksel sayısı)")
@@ -79,8 +80,7 @@ X_test = test_data.iloc[:,1:].values
 # plt.show()
 
 # 0 - 255 arasını -> 0-1 aralığına sıkıştıralım (normalizasyon)
-X_train = X_train / 255.0
-X_test = X_test / 255.0
+# Pikseller uint8 kalır; normalizasyon her parça için ayrı yapılır (to_float)
 
 """
 X_train: (60000, 784) → (m, n_x)
@@ -96,10 +96,34 @@ W: (n_h, n_x)  →  (128, 784)
 X: (n_x, m)    →  (784, 60000)  ← Transpose gerekli!
 z: (n_h, m)    →  (128, 60000)
 Transpose ile her sütun bir örneği temsil eder
+
+Tüm veriyi float64'e çevirmek 60000 × 784 × 8 byte = 376 MB demek
+(uint8 hali 47 MB). Bu yüzden X uint8 ve ardışık (784, m) olarak tutulur;
+forward/backward CHUNK_SIZE örneklik parçalar üzerinde yapılır ve her
+parça kullanılmadan hemen önce float64'e çevrilip normalize edilir
+(to_float). Bellekte aynı anda sadece bir parçanın float64 kopyası olur.
 """
 
-X_train = X_train.T
-X_test = X_test.T
+X_train = np.ascontiguousarray(X_train.T)   # (784, 60000) uint8
+X_test = np.ascontiguousarray(X_test.T)     # (784, 10000) uint8
+
+# Bir seferde float64'e çevrilen örnek sayısı: 10000 × 784 × 8 byte ≈ 63 MB
+CHUNK_SIZE = 10000
+
+
+def to_float(X):
+    """
+    uint8 piksel parçasını [0, 1] aralığında float64'e çevir
+
+    Parametreler:
+        X: uint8 pikseller (784, m) - genelde X_train[:, başlangıç:bitiş]
+
+    Returns:
+        X_float: normalize edilmiş ardışık float64 kopya (784, m)
+    """
+    X_float = X.astype(np.float64)
+    X_float /= 255.0
+    return X_float
 
 
 def one_hot_encode(y, num_classes=10):
@@ -299,7 +323,7 @@ def forward_propagation(X, parameters):
     return a2, cache
 
 # İlk 5 örnek üzerinde test
-X_sample = X_train[:, :5]  # (784, 5)
+X_sample = to_float(X_train[:, :5])  # (784, 5)
 print(f"Test input boyutu: {X_sample.shape}")
 
 # Forward pass
@@ -449,7 +473,7 @@ def compute_accuracy(X, Y, parameters):
         4. Yüzde hesapla
     
     Parametreler:
-        X: input verisi (784, m)
+        X: uint8 input verisi (784, m) - CHUNK_SIZE'lık parçalarla işlenir
         Y: gerçek etiketler one-hot (10, m)
         parameters: W1, b1, W2, b2
     
@@ -457,17 +481,21 @@ def compute_accuracy(X, Y, parameters):
         accuracy: yüzde olarak doğruluk (0-100)
     """
     
-    # Forward pass
-    a2, _ = forward_propagation(X, parameters)
-    
-    # Tahmin edilen sınıflar (her sütunda en yüksek değerin indeksi)
-    predictions = np.argmax(a2, axis=0)    # (m,)
-    
-    # Gerçek sınıflar (one-hot'tan geri çevir)
-    labels = np.argmax(Y, axis=0)          # (m,)
-    
-    # Doğru tahmin sayısı
-    correct = np.sum(predictions == labels)
+    correct = 0
+    for start in range(0, X.shape[1], CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        
+        # Forward pass (sadece bu parça float64'e çevrilir)
+        a2, _ = forward_propagation(to_float(X[:, start:stop]), parameters)
+        
+        # Tahmin edilen sınıflar (her sütunda en yüksek değerin indeksi)
+        predictions = np.argmax(a2, axis=0)    # (parça,)
+        
+        # Gerçek sınıflar (one-hot'tan geri çevir)
+        labels = np.argmax(Y[:, start:stop], axis=0)
+        
+        # Doğru tahmin sayısı
+        correct += np.sum(predictions == labels)
     
     # Toplam örnek sayısı
     total = Y.shape[1]
@@ -477,19 +505,62 @@ def compute_accuracy(X, Y, parameters):
     
     return accuracy
 
+def get_learning_rate(epoch, learning_rate, num_epochs, lr_schedule='constant',
+                      step_size=50, gamma=0.5, min_lr=0.0):
+    """
+    Epoch'a göre öğrenme oranını hesapla
+    
+    Planlar:
+        'constant': α sabit
+        'step':     her step_size epoch'ta α × gamma
+        'cosine':   α'dan min_lr'ye kosinüs eğrisiyle iner
+                    α_t = min_lr + (α - min_lr) × (1 + cos(π × t / T)) / 2
+    
+    Parametreler:
+        epoch: 0'dan başlayan epoch numarası
+        learning_rate: başlangıç öğrenme oranı (α)
+        num_epochs: toplam epoch sayısı (cosine için T)
+        lr_schedule: 'constant', 'step' veya 'cosine'
+    
+    Returns:
+        lr: bu epoch'ta kullanılacak öğrenme oranı
+    """
+    
+    if lr_schedule == 'constant':
+        return learning_rate
+    if lr_schedule == 'step':
+        return learning_rate * gamma ** (epoch // step_size)
+    if lr_schedule == 'cosine':
+        return min_lr + (learning_rate - min_lr) * (1 + np.cos(np.pi * epoch / num_epochs)) / 2
+    raise ValueError(f"Bilinmeyen lr_schedule: {lr_schedule}")
+
 def train(X_train, Y_train, X_test, Y_test,
           n_h=128, learning_rate=0.1, num_epochs=100,
-          print_interval=10):
+          print_interval=10, X_val=None, Y_val=None,
+          lr_schedule='constant', patience=None):
     """
     Tam eğitim döngüsü
     
+    Early stopping: X_val, Y_val ve patience verilirse her epoch doğrulama
+    doğruluğu ölçülür. patience epoch boyunca iyileşme olmazsa eğitim durur
+    ve en iyi doğrulama doğruluğunu veren parametrelere geri dönülür.
+    Boşa giden epoch'lar hiç koşulmaz.
+    
+    Her epoch tam batch gradient descent'tir: gradyan CHUNK_SIZE'lık
+    parçalarda hesaplanır ve parça boyutuyla ağırlıklandırılarak toplanır.
+    Sonuç tüm veri üzerinde tek bir backward ile aynıdır, ama aynı anda
+    sadece bir parçanın float64 kopyası ve ara değerleri bellekte durur.
+    
     Parametreler:
-        X_train, Y_train: eğitim verisi
+        X_train, Y_train: eğitim verisi (X: uint8 (784, m))
         X_test, Y_test: test verisi
         n_h: hidden layer nöron sayısı
-        learning_rate: öğrenme oranı (α)
-        num_epochs: epoch sayısı
+        learning_rate: başlangıç öğrenme oranı (α)
+        num_epochs: en fazla epoch sayısı
         print_interval: kaç epoch'ta bir sonuç yazdır
+        X_val, Y_val: doğrulama verisi (early stopping için)
+        lr_schedule: 'constant', 'step' veya 'cosine' (get_learning_rate)
+        patience: iyileşme olmadan beklenecek epoch sayısı (None: kapalı)
     
     Returns:
         parameters: eğitilmiş parametreler
@@ -501,6 +572,7 @@ def train(X_train, Y_train, X_test, Y_test,
     # Ağ boyutları
     n_x = X_train.shape[0]  # 784
     n_y = Y_train.shape[0]  # 10
+    m = X_train.shape[1]
     
     # 1. PARAMETRELERİ BAŞLAT
     parameters = initialize_parameters(n_x, n_h, n_y)
@@ -510,11 +582,20 @@ def train(X_train, Y_train, X_test, Y_test,
     train_accuracies = []
     test_accuracies = []
     
+    # Early stopping durumu
+    early_stopping = patience is not None and X_val is not None
+    best_val_acc = -np.inf
+    best_epoch = 0
+    best_parameters = None
+    
     # Hiperparametreleri göster
     print(f"\nHiperparametreler:")
     print(f"  Hidden layer:  {n_h} nöron")
-    print(f"  Learning rate: {learning_rate}")
+    print(f"  Learning rate: {learning_rate} ({lr_schedule})")
     print(f"  Epochs:        {num_epochs}")
+    if early_stopping:
+        print(f"  Patience:      {patience}")
+        print(f"  Val örnekleri:   {X_val.shape[1]}")
     print(f"  Train örnekleri: {X_train.shape[1]}")
     print(f"  Test örnekleri:  {X_test.shape[1]}")
     
@@ -525,20 +606,42 @@ def train(X_train, Y_train, X_test, Y_test,
     # 2. EĞİTİM DÖNGÜSÜ
     for epoch in range(num_epochs):
         
-        # ===== A. FORWARD PASS =====
-        a2, cache = forward_propagation(X_train, parameters)
-        
-        # ===== B. LOSS HESAPLA =====
-        loss = compute_loss(a2, Y_train)
+        loss = 0.0
+        gradients = {'dW1': 0.0, 'db1': 0.0, 'dW2': 0.0, 'db2': 0.0}
+        for start in range(0, m, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, m)
+            X_chunk = to_float(X_train[:, start:stop])
+            Y_chunk = Y_train[:, start:stop]
+            
+            # ===== A. FORWARD PASS =====
+            a2, cache = forward_propagation(X_chunk, parameters)
+            
+            # ===== B. LOSS HESAPLA =====
+            # compute_loss parça ortalaması: parça boyutuyla ağırlıklandır
+            loss += compute_loss(a2, Y_chunk) * (stop - start) / m
+            
+            # ===== C. BACKPROPAGATION =====
+            chunk_gradients = backward_propagation(X_chunk, Y_chunk, parameters, cache)
+            for key, grad in chunk_gradients.items():
+                gradients[key] = gradients[key] + grad * ((stop - start) / m)
         train_losses.append(loss)
         
-        # ===== C. BACKPROPAGATION =====
-        gradients = backward_propagation(X_train, Y_train, parameters, cache)
-        
         # ===== D. GRADIENT DESCENT (UPDATE) =====
-        parameters = update_parameters(parameters, gradients, learning_rate)
+        lr = get_learning_rate(epoch, learning_rate, num_epochs, lr_schedule)
+        parameters = update_parameters(parameters, gradients, lr)
+        
+        # ===== E. EARLY STOPPING =====
+        stop = False
+        if early_stopping:
+            val_acc = compute_accuracy(X_val, Y_val, parameters)
+            if val_acc > best_val_acc:
+                best_val_acc = val_acc
+                best_epoch = epoch + 1
+                # update_parameters yeni diziler döndürür, kopya gerekmez
+                best_parameters = dict(parameters)
+            stop = (epoch + 1) - best_epoch >= patience
         
-        # ===== E. ACCURACY HESAPLA VE LOGLA =====
+        # ===== F. ACCURACY HESAPLA VE LOGLA =====
         if (epoch + 1) % print_interval == 0 or epoch == 0:
             train_acc = compute_accuracy(X_train, Y_train, parameters)
             test_acc = compute_accuracy(X_test, Y_test, parameters)
@@ -547,19 +650,35 @@ def train(X_train, Y_train, X_test, Y_test,
             test_accuracies.append(test_acc)
             
             print(f"{epoch+1:>6} | {loss:>10.4f} | {train_acc:>9.2f}% | {test_acc:>9.2f}%")
+        
+        if stop:
+            print(f"Early stopping: {patience} epoch boyunca doğrulama iyileşmedi")
+            break
     
     print(f"{'='*60}")
     print(f"Eğitim tamamlandı!")
     
+    if best_parameters is not None:
+        parameters = best_parameters
+        print(f"En iyi doğrulama: {best_val_acc:.2f}% (epoch {best_epoch}), bu parametreler döndürülüyor")
+    
     return parameters, train_losses, train_accuracies, test_accuracies
 
+# Eğitim setinin son 5000 örneği doğrulama için ayrılır (early stopping)
+VAL_SIZE = 5000
+X_val, Y_val = X_train[:, -VAL_SIZE:], Y_train[:, -VAL_SIZE:]
+X_fit, Y_fit = X_train[:, :-VAL_SIZE], Y_train[:, :-VAL_SIZE]
+
 parameters, train_losses, train_accs, test_accs = train(
-    X_train, Y_train,
+    X_fit, Y_fit,
     X_test, Y_test,
     n_h=128,
     learning_rate=0.1,
     num_epochs=200,
-    print_interval=10
+    print_interval=10,
+    X_val=X_val, Y_val=Y_val,
+    lr_schedule='cosine',
+    patience=20
 )
 
 def plot_training_history(train_losses, train_accs, test_accs, print_interval):
@@ -635,7 +754,7 @@ def plot_predictions(X, Y, parameters, class_names, num_samples=10):
     indices = np.random.choice(m, num_samples, replace=False)
     
     # Tahminleri al
-    a2, _ = forward_propagation(X[:, indices], parameters)
+    a2, _ = forward_propagation(to_float(X[:, indices]), parameters)
     predictions = np.argmax(a2, axis=0)
     true_labels = np.argmax(Y[:, indices], axis=0)
     
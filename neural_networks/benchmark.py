@@ -0,0 +1,1809 @@
+"""
+Performans Benchmarklari
+========================
+Framework'un hiz kritik parcalarini olcer ve eski/yeni versiyonlari karsilastirir.
+
+Her benchmark once sonuclarin referans implementasyonla ayni oldugunu kontrol
+eder, sonra sureleri olcer.
+
+Kullanim:
+    python benchmark.py              # tum benchmarklar
+    python benchmark.py col2im       # sadece secilen benchmark
+"""
+
+import os
+import sys
+import time
+import tempfile
+import resource
+import threading
+import tracemalloc
+import multiprocessing as mp
+import numpy as np
+
+from layers import autotune, Dense, ReLU, Softmax, Flatten, get_default_dtype
+from layers.conv import col2im, Conv2D, DepthwiseConv2D, PointwiseConv2D, MaxPool2D
+from models import Sequential
+from losses import CrossEntropyLoss, SoftmaxCrossEntropy
+from optimizers import SGD, Momentum, Nesterov, RMSProp, Adam, AdamW, DynamicLossScaler
+from optimizers import StepLR, CosineAnnealingLR, OneCycleLR, ReduceLROnPlateau, EarlyStopping
+from data import DataLoader, load_fashion_mnist
+from data.fashion_mnist import cache_paths, read_csv_uint8
+
+
+# ============== YARDIMCI FONKSIYONLAR ==============
+BENCHMARKS = {}
+
+
+SEED = 0
+
+
+def benchmark(name):
+    """
+    Fonksiyonu BENCHMARKS sozlugune kaydeden decorator.
+
+    Kayitli fonksiyon her calistirmadan once global RNG'yi SEED ile baslatir:
+    agirliklar ve rastgele girdiler hangi benchmark'larin once kostugundan
+    bagimsizdir, dogruluk kontrolleri her calistirmada ayni veriyle yapilir.
+    """
+    def register(fn):
+        def run():
+            np.random.seed(SEED)
+            return fn()
+        BENCHMARKS[name] = run
+        return fn
+    return register
+
+
+def measure(fn, repeat=5):
+    """fn'i repeat kez calistir, en iyi sureyi (saniye) dondur."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_interleaved(fns, repeat=10):
+    """
+    fns'i sirayla repeat tur calistir, her biri icin en iyi sureyi dondur.
+
+    Tek cekirdekte ardisik olcumler arka plan yukunden farkli etkilenir;
+    turlar icinde sirayla olcmek karsilastirmayi dengeler.
+    """
+    best = [float('inf')] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            start = time.perf_counter()
+            fn()
+            best[i] = min(best[i], time.perf_counter() - start)
+    return best
+
+
+def step_allocation(fn):
+    """fn calisirken ayrilan tepe bellek (byte, tracemalloc ile olculur)."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - base
+
+
+def run_isolated(fn, *args):
+    """
+    fn(*args)'i ayri bir process'te calistir ve sonucunu dondur.
+
+    Tepe RSS (ru_maxrss) process basina tutuldugu icin farkli varyantlar
+    ayri process'lerde olculmeli.
+    """
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(1) as pool:
+        return pool.apply(_seeded_call, (fn,) + args)
+
+
+def _seeded_call(fn, *args):
+    """Yeni process'te global RNG'yi SEED ile baslatip fn(*args)'i cagir."""
+    np.random.seed(SEED)
+    return fn(*args)
+
+
+def peak_rss_mb():
+    """Bu process'in su ana kadarki tepe RSS degeri (MB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def print_header(title):
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+# ============== col2im ==============
+def col2im_loop(col, x_shape, kH, kW, stride=1, padding=0):
+    """Eski col2im: her cikti konumu (H_out x W_out) icin Python dongusu."""
+    m, C, H, W = x_shape
+    H_padded = H + 2 * padding
+    W_padded = W + 2 * padding
+    H_out = (H_padded - kH) // stride + 1
+    W_out = (W_padded - kW) // stride + 1
+
+    col_reshaped = col.reshape(C, kH, kW, H_out, W_out, m).transpose(5, 0, 1, 2, 3, 4)
+    x_padded = np.zeros((m, C, H_padded, W_padded))
+
+    for i in range(H_out):
+        for j in range(W_out):
+            h_start = i * stride
+            w_start = j * stride
+            x_padded[:, :, h_start:h_start+kH, w_start:w_start+kW] += col_reshaped[:, :, :, :, i, j]
+
+    if padding > 0:
+        return x_padded[:, :, padding:-padding, padding:-padding]
+    return x_padded
+
+
+@benchmark('col2im')
+def bench_col2im():
+    print_header("col2im: konum dongusu vs kernel ofseti dongusu")
+
+    # (m, C, H, W), kernel, stride, padding
+    configs = [
+        ((256, 16, 28, 28), 3, 1, 0),   # test_cnn_fashion_mnist.py ilk katman
+        ((256, 32, 13, 13), 3, 1, 1),
+        ((128, 8, 28, 28), 5, 2, 2),
+        ((64, 16, 32, 32), 7, 3, 3),
+    ]
+
+    print(f"{'x_shape':>20} | {'k':>2} | {'s':>2} | {'p':>2} | {'eski':>10} | {'yeni':>10} | {'hiz':>7}")
+    print("-" * 70)
+
+    for x_shape, k, stride, padding in configs:
+        m, C, H, W = x_shape
+        H_out = (H + 2 * padding - k) // stride + 1
+        W_out = (W + 2 * padding - k) // stride + 1
+        col = np.random.randn(C * k * k, H_out * W_out * m)
+
+        expected = col2im_loop(col, x_shape, k, k, stride, padding)
+        result = col2im(col, x_shape, k, k, stride, padding)
+        assert np.allclose(result, expected), f"col2im sonucu farkli: {x_shape}"
+
+        t_old = measure(lambda: col2im_loop(col, x_shape, k, k, stride, padding))
+        t_new = measure(lambda: col2im(col, x_shape, k, k, stride, padding))
+
+        print(f"{str(x_shape):>20} | {k:>2} | {stride:>2} | {padding:>2} | "
+              f"{t_old*1000:>8.2f}ms | {t_new*1000:>8.2f}ms | {t_old/t_new:>6.1f}x")
+
+
+# ============== MaxPool2D ==============
+def maxpool_loop_forward(x, pool_size, stride):
+    """Eski MaxPool2D.forward: her cikti konumu icin Python dongusu."""
+    m, C, H, W = x.shape
+    H_out = (H - pool_size) // stride + 1
+    W_out = (W - pool_size) // stride + 1
+
+    out = np.zeros((m, C, H_out, W_out))
+    for i in range(H_out):
+        for j in range(W_out):
+            h_start, w_start = i * stride, j * stride
+            x_slice = x[:, :, h_start:h_start+pool_size, w_start:w_start+pool_size]
+            out[:, :, i, j] = np.max(x_slice, axis=(2, 3))
+    return out
+
+
+def maxpool_loop_backward(x, dout, pool_size, stride):
+    """Eski MaxPool2D.backward: her pencerede max ve maske yeniden hesaplanir."""
+    _, _, H_out, W_out = dout.shape
+
+    dx = np.zeros_like(x)
+    for i in range(H_out):
+        for j in range(W_out):
+            h_start, w_start = i * stride, j * stride
+            x_slice = x[:, :, h_start:h_start+pool_size, w_start:w_start+pool_size]
+            mask = (x_slice == np.max(x_slice, axis=(2, 3), keepdims=True))
+            dx[:, :, h_start:h_start+pool_size, w_start:w_start+pool_size] += mask * dout[:, :, i, j][:, :, None, None]
+    return dx
+
+
+@benchmark('maxpool')
+def bench_maxpool():
+    print_header("MaxPool2D: konum dongusu vs pencere view + argmax")
+
+    # (m, C, H, W), pool_size, stride
+    configs = [
+        ((256, 16, 26, 26), 2, 2),   # test_cnn_fashion_mnist.py
+        ((256, 32, 13, 13), 3, 2),   # ortusen pencereler
+        ((128, 16, 27, 27), 2, 2),   # tek boyut - kenar artigi
+    ]
+
+    print(f"{'x_shape':>20} | {'p':>2} | {'s':>2} | {'eski f+b':>10} | {'yeni f+b':>10} | {'hiz':>7}")
+    print("-" * 70)
+
+    for x_shape, pool_size, stride in configs:
+        x = np.random.randn(*x_shape)
+        pool = MaxPool2D(pool_size, stride)
+
+        out = pool.forward(x)
+        dout = np.random.randn(*out.shape)
+        assert np.allclose(out, maxpool_loop_forward(x, pool_size, stride)), f"forward farkli: {x_shape}"
+        # Rastgele girdide esit maksimum yok, iki backward ayni olmali
+        assert np.allclose(pool.backward(dout), maxpool_loop_backward(x, dout, pool_size, stride)), \
+            f"backward farkli: {x_shape}"
+
+        def old():
+            maxpool_loop_forward(x, pool_size, stride)
+            maxpool_loop_backward(x, dout, pool_size, stride)
+
+        def new():
+            pool.forward(x)
+            pool.backward(dout)
+
+        t_old = measure(old, repeat=3)
+        t_new = measure(new, repeat=3)
+
+        print(f"{str(x_shape):>20} | {pool_size:>2} | {stride:>2} | "
+              f"{t_old*1000:>8.2f}ms | {t_new*1000:>8.2f}ms | {t_old/t_new:>6.1f}x")
+
+
+@benchmark('maxpool_tiled')
+def bench_maxpool_tiled():
+    print_header("MaxPool2D 2x2: pencere view yolu vs ofset dilimli hizli yol")
+
+    # Fashion-MNIST CNN'deki 26x26 -> 13x13 durumu, buyuk batch'ler
+    # Bellegi sinirli tutmak icin 8 kanal kullaniliyor. 'conv' duzeni
+    # Conv2D NCHW ciktisi gibi (C, H, W, m) bellegi uzerinde bir view'dur.
+    rng = np.random.default_rng(0)
+    C, H, W = 8, 26, 26
+    print(f"{'batch':>8} | {'duzen':>7} | {'genel f+b':>10} | {'hizli f+b':>10} | {'hiz':>7} | {'forward bellek':>16}")
+    print("-" * 75)
+
+    for m in [1000, 5000, 10000]:
+        for layout in ('ardisik', 'conv'):
+            if layout == 'conv':
+                x = rng.standard_normal((C, H, W, m)).transpose(3, 0, 1, 2)
+            else:
+                x = rng.standard_normal((m, C, H, W))
+
+            fast = MaxPool2D(pool_size=2)
+            general = MaxPool2D(pool_size=2)
+            general._is_tiling = lambda H, W: False  # hizli yolu kapat
+
+            out = fast.forward(x)
+            dout = rng.standard_normal(out.shape)
+            assert np.array_equal(out, general.forward(x))
+            assert np.array_equal(fast.backward(dout), general.backward(dout))
+
+            def run(pool):
+                pool.forward(x)
+                pool.backward(dout)
+
+            t_general = measure(lambda: run(general), repeat=3)
+            t_fast = measure(lambda: run(fast), repeat=3)
+
+            # Hizli forward'in ayirdigi bellek: cikti, argmax ve maskeler
+            # (girdinin ~1/3'u); girdi kopyalansaydi girdi kadar daha olurdu
+            allocated = step_allocation(lambda: fast.forward(x))
+            print(f"{m:>8} | {layout:>7} | {t_general*1000:>8.1f}ms | {t_fast*1000:>8.1f}ms | "
+                  f"{t_general/t_fast:>6.1f}x | {allocated / x.nbytes:>5.2f} x girdi")
+            assert allocated < x.nbytes / 2, "hizli yol girdiyi kopyaladi"
+
+
+# ============== Conv2D WORKSPACE ==============
+def conv_training_steps(use_workspace, x_shape, out_channels, kernel_size, padding, steps):
+    """Ayri process'te Conv2D forward+backward adimlari calistir."""
+    np.random.seed(0)
+    x = np.random.randn(*x_shape)
+    conv = Conv2D(x_shape[1], out_channels, kernel_size, padding=padding,
+                  use_workspace=use_workspace, algorithm='im2col')
+
+    out = conv.forward(x)
+    dout = np.random.randn(*out.shape)
+
+    def step():
+        conv.forward(x)
+        conv.backward(dout)
+
+    step()  # isinma: workspace burada dolar
+    step_time = measure(step, repeat=steps)
+    allocated = step_allocation(step)
+    return step_time, allocated, peak_rss_mb()
+
+
+@benchmark('conv_workspace')
+def bench_conv_workspace():
+    print_header("Conv2D: her adimda ayirma vs kalici workspace buffer'lari")
+
+    # (m, C_in, H, W), C_out, kernel, padding
+    configs = [
+        ((1000, 1, 28, 28), 16, 3, 0),   # test_cnn_fashion_mnist.py ilk katman
+        ((500, 16, 13, 13), 32, 3, 1),
+    ]
+
+    print(f"{'x_shape':>18} | {'workspace':>9} | {'adim':>9} | {'adim basi ayirma':>16} | {'tepe RSS':>9}")
+    print("-" * 75)
+
+    for x_shape, C_out, k, padding in configs:
+        for use_workspace in (False, True):
+            step_time, allocated, rss = run_isolated(
+                conv_training_steps, use_workspace, x_shape, C_out, k, padding, 5)
+            print(f"{str(x_shape):>18} | {str(use_workspace):>9} | {step_time*1000:>7.1f}ms | "
+                  f"{allocated/2**20:>13.1f} MB | {rss:>6.0f} MB")
+
+
+# ============== WINOGRAD ==============
+def conv_step_time(conv, x, dout):
+    """Tek bir forward+backward adiminin suresi."""
+    def step():
+        conv.forward(x)
+        conv.backward(dout)
+    step()
+    return measure(step, repeat=3)
+
+
+def tolerance(dtype):
+    """Algoritma karsilastirmalari icin (rtol, atol): float32'de yuvarlama daha buyuk."""
+    if np.dtype(dtype) == np.float32:
+        return 1e-4, 1e-5
+    return 1e-7, 1e-9
+
+
+def assert_close(actual, expected, dtype, message):
+    """
+    actual ~ expected; atol dizinin buyuklugune gore olceklenir.
+
+    Toplamlarin (dW: m*H_out*W_out terim) ve FFT/Winograd donusumlerinin
+    yuvarlama hatasi tek tek elemana degil dizinin en buyuk degerine
+    orantilidir: float32'de olculen hata max|expected|'in ~1e-6'sidir,
+    toplanan terim sayisindan (1e3 - 3e5) bagimsiz. Sabit atol sifira yakin
+    elemanlarda bu hatanin ancak birkac katidir; atol * max(1, max|expected|)
+    ise payi ~10x'te tutar. Olcek 1'in altina inmez (tolerans daralmaz).
+    """
+    rtol, atol = tolerance(dtype)
+    scale = max(1.0, float(np.max(np.abs(expected), initial=0.0)))
+    assert np.allclose(actual, expected, rtol=rtol, atol=atol * scale), message
+
+
+def compare_conv(reference, candidate, x):
+    """
+    Iki Conv2D'nin (ayni agirliklarla) forward ve backward sonuclarini karsilastir.
+
+    Tolerans katmanin dtype'ina gore secilir (bkz. assert_close).
+
+    Returns:
+        dout: Karsilastirmada kullanilan rastgele cikti gradyani
+    """
+    dtype = reference.W.dtype
+    candidate.W = reference.W.copy()
+    candidate.b = reference.b.copy()
+
+    out_ref = reference.forward(x).copy()
+    assert_close(candidate.forward(x), out_ref, dtype, "forward farkli")
+
+    dout = np.random.randn(*out_ref.shape)
+    dx_ref = reference.backward(dout).copy()
+    assert_close(candidate.backward(dout), dx_ref, dtype, "dx farkli")
+    assert_close(candidate.dW, reference.dW, dtype, "dW farkli")
+    assert_close(candidate.db, reference.db, dtype, "db farkli")
+
+    return dout
+
+
+@benchmark('winograd')
+def bench_winograd():
+    print_header("Conv2D 3x3 stride=1: im2col vs Winograd F(2x2, 3x3)")
+
+    # (m, C_in, H, W), C_out, padding
+    configs = [
+        ((500, 1, 28, 28), 16, 0),     # test_cnn_fashion_mnist.py ilk katman
+        ((128, 32, 16, 16), 32, 1),
+        ((64, 64, 16, 16), 64, 1),
+        ((32, 128, 14, 14), 128, 1),
+        ((16, 256, 8, 8), 256, 1),
+    ]
+
+    print(f"{'x_shape':>18} | {'C_out':>5} | {'im2col':>9} | {'winograd':>9} | {'hiz':>6} | {'goruntu/s (W)':>13}")
+    print("-" * 75)
+
+    for x_shape, C_out, padding in configs:
+        x = np.random.randn(*x_shape)
+        reference = Conv2D(x_shape[1], C_out, 3, padding=padding, algorithm='im2col')
+        winograd = Conv2D(x_shape[1], C_out, 3, padding=padding, algorithm='winograd')
+
+        # Sayisal tolerans kontrolu: forward, dx, dW ve db im2col ile ayni olmali
+        dout = compare_conv(reference, winograd, x)
+
+        t_im2col = conv_step_time(reference, x, dout)
+        t_winograd = conv_step_time(winograd, x, dout)
+
+        print(f"{str(x_shape):>18} | {C_out:>5} | {t_im2col*1000:>7.1f}ms | {t_winograd*1000:>7.1f}ms | "
+              f"{t_im2col/t_winograd:>5.2f}x | {x_shape[0]/t_winograd:>13.0f}")
+
+
+# ============== FFT ==============
+@benchmark('fft')
+def bench_fft():
+    print_header("Conv2D buyuk kernel: im2col vs FFT")
+
+    # (m, C_in, H, W), C_out, kernel (padding = kernel // 2)
+    configs = [
+        ((64, 1, 28, 28), 16, 7),
+        ((64, 3, 64, 64), 16, 7),
+        ((64, 3, 64, 64), 16, 11),
+        ((32, 16, 32, 32), 32, 7),
+        ((32, 8, 64, 64), 8, 11),
+    ]
+
+    print(f"{'x_shape':>17} | {'k':>2} | {'im2col':>9} | {'fft':>9} | {'hiz':>6} | "
+          f"{'bellek im2col':>13} | {'bellek fft':>10}")
+    print("-" * 85)
+
+    for x_shape, C_out, k in configs:
+        x = np.random.randn(*x_shape)
+        # Bellek karsilastirmasi icin workspace kapali: adim basi ayrilan tepe bellek
+        reference = Conv2D(x_shape[1], C_out, k, padding=k // 2, algorithm='im2col', use_workspace=False)
+        fft = Conv2D(x_shape[1], C_out, k, padding=k // 2, algorithm='fft', use_workspace=False)
+
+        dout = compare_conv(reference, fft, x)
+
+        t_im2col = conv_step_time(reference, x, dout)
+        t_fft = conv_step_time(fft, x, dout)
+        mem_im2col = step_allocation(lambda: (reference.forward(x), reference.backward(dout)))
+        mem_fft = step_allocation(lambda: (fft.forward(x), fft.backward(dout)))
+
+        print(f"{str(x_shape):>17} | {k:>2} | {t_im2col*1000:>7.1f}ms | {t_fft*1000:>7.1f}ms | "
+              f"{t_im2col/t_fft:>5.2f}x | {mem_im2col/2**20:>10.0f} MB | {mem_fft/2**20:>7.0f} MB")
+
+    # Kernel spektrumu cache'i: agirliklar degismezse forward'da yeniden hesaplanmaz
+    print("\nKernel spektrumu cache etkisi (forward, 256 kanal -> 256 kanal, 7x7):")
+    x = np.random.randn(4, 256, 16, 16)
+    fft = Conv2D(256, 256, 7, padding=3, algorithm='fft')
+    fft.forward(x)
+
+    def forward_without_cache():
+        fft._fft_cache = None
+        fft.forward(x)
+
+    t_miss = measure(forward_without_cache)
+    t_hit = measure(lambda: fft.forward(x))
+    print(f"  cache yok: {t_miss*1000:.1f}ms | cache var: {t_hit*1000:.1f}ms")
+
+
+# ============== AUTOTUNE ==============
+@benchmark('autotune')
+def bench_autotune():
+    print_header("Conv2D autotune: olcumle secilen algoritma vs sabit algoritmalar")
+
+    # (m, C_in, H, W), C_out, kernel (padding = kernel // 2)
+    configs = [
+        ((1000, 1, 28, 28), 16, 3),
+        ((16, 256, 8, 8), 256, 3),
+        ((64, 3, 64, 64), 16, 7),
+    ]
+
+    cache_file = os.path.join(tempfile.mkdtemp(), 'autotune.json')
+    autotune.set_cache_file(cache_file)
+    autotune.clear_cache()
+
+    for x_shape, C_out, k in configs:
+        x = np.random.randn(*x_shape)
+        tuned = Conv2D(x_shape[1], C_out, k, padding=k // 2)
+
+        start = time.perf_counter()
+        out = tuned.forward(x)
+        tuning_time = time.perf_counter() - start
+        chosen = tuned.cache['algorithm']
+        dout = np.random.randn(*out.shape)
+
+        print(f"\n{x_shape}, C_out={C_out}, {k}x{k}: secilen = {chosen} "
+              f"(ilk cagri + olcum: {tuning_time:.2f}s)")
+
+        for name in tuned._candidate_algorithms():
+            forced = Conv2D(x_shape[1], C_out, k, padding=k // 2, algorithm=name)
+            forced.W, forced.b = tuned.W, tuned.b
+            print(f"  {name:>9}: {conv_step_time(forced, x, dout)*1000:>8.1f}ms")
+
+    # Yeni process gibi: bellek cache'i bos, sonuc disk cache'inden okunur
+    autotune.clear_cache()
+    x_shape, C_out, k = configs[-1]
+    x = np.random.randn(*x_shape)
+    fresh = Conv2D(x_shape[1], C_out, k, padding=k // 2)
+    start = time.perf_counter()
+    fresh.forward(x)
+    print(f"\nDisk cache'inden ilk cagri: {time.perf_counter() - start:.2f}s "
+          f"(secilen = {fresh.cache['algorithm']})")
+
+    autotune.set_cache_file(None)
+
+
+# ============== NHWC ==============
+def fashion_cnn(data_format, conv_filters=16, algorithm='im2col'):
+    """test_cnn_fashion_mnist.py mimarisi, verilen tensor duzeniyle."""
+    flatten_size = conv_filters * 13 * 13
+    return Sequential([
+        Conv2D(1, conv_filters, 3, algorithm=algorithm, data_format=data_format),
+        ReLU(),
+        MaxPool2D(2, data_format=data_format),
+        Flatten(),
+        Dense(flatten_size, 64),
+        ReLU(),
+        Dense(64, 10),
+        Softmax(),
+    ])
+
+
+def layer_times(model, x, dout, repeat=3):
+    """Her katmanin forward ve backward sureleri (saniye, en iyi olcum)."""
+    n = len(model.layers)
+    forward, backward = [float('inf')] * n, [float('inf')] * n
+    for _ in range(repeat):
+        out = x
+        for i, layer in enumerate(model.layers):
+            start = time.perf_counter()
+            out = layer.forward(out)
+            forward[i] = min(forward[i], time.perf_counter() - start)
+
+        grad = dout
+        for i in reversed(range(n)):
+            start = time.perf_counter()
+            grad = model.layers[i].backward(grad)
+            backward[i] = min(backward[i], time.perf_counter() - start)
+    return forward, backward
+
+
+@benchmark('nhwc')
+def bench_nhwc():
+    print_header("Fashion-MNIST CNN: NCHW vs NHWC (forward + backward)")
+
+    m = 500
+    x_nchw = np.random.rand(m, 1, 28, 28)
+    x_nhwc = np.ascontiguousarray(x_nchw.transpose(0, 2, 3, 1))
+    dout = np.random.randn(10, m)
+
+    nchw = fashion_cnn('NCHW')
+    nhwc = fashion_cnn('NHWC')
+
+    # Ayni agirliklar. Flatten NHWC'de ozellikleri (H, W, C) sirasiyla verir,
+    # bu yuzden ilk Dense'in sutunlari ayni siraya getirilir.
+    nhwc.layers[0].W, nhwc.layers[0].b = nchw.layers[0].W, nchw.layers[0].b
+    dense_nchw, dense_nhwc = nchw.layers[4], nhwc.layers[4]
+    dense_nhwc.W = np.ascontiguousarray(
+        dense_nchw.W.reshape(64, 16, 13, 13).transpose(0, 2, 3, 1).reshape(64, -1))
+    dense_nhwc.b = dense_nchw.b
+    nhwc.layers[6].W, nhwc.layers[6].b = nchw.layers[6].W, nchw.layers[6].b
+
+    # Dogruluk: cikti, giris gradyani ve Conv2D gradyanlari ayni olmali
+    dtype = nchw.layers[0].W.dtype
+    out_ref = nchw.forward(x_nchw).copy()
+    assert_close(nhwc.forward(x_nhwc), out_ref, dtype, "forward farkli")
+    dx_ref = nchw.backward(dout).copy()
+    dx = nhwc.backward(dout)
+    assert_close(dx.transpose(0, 3, 1, 2), dx_ref, dtype, "dx farkli")
+    assert_close(nhwc.layers[0].dW, nchw.layers[0].dW, dtype, "conv dW farkli")
+    assert_close(nhwc.layers[0].db, nchw.layers[0].db, dtype, "conv db farkli")
+
+    print(f"batch = {m}, Conv2D algoritmasi = im2col\n")
+    print(f"{'katman':>10} | {'NCHW fwd':>9} | {'NHWC fwd':>9} | {'NCHW bwd':>9} | {'NHWC bwd':>9}")
+    print("-" * 58)
+
+    fwd_nchw, bwd_nchw = layer_times(nchw, x_nchw, dout)
+    fwd_nhwc, bwd_nhwc = layer_times(nhwc, x_nhwc, dout)
+    for i, layer in enumerate(nchw.layers):
+        print(f"{type(layer).__name__:>10} | {fwd_nchw[i]*1000:>7.1f}ms | {fwd_nhwc[i]*1000:>7.1f}ms | "
+              f"{bwd_nchw[i]*1000:>7.1f}ms | {bwd_nhwc[i]*1000:>7.1f}ms")
+
+    t_nchw = measure(lambda: (nchw.forward(x_nchw), nchw.backward(dout)), repeat=3)
+    t_nhwc = measure(lambda: (nhwc.forward(x_nhwc), nhwc.backward(dout)), repeat=3)
+    print("-" * 58)
+    print(f"{'toplam':>10} | NCHW: {t_nchw*1000:.1f}ms | NHWC: {t_nhwc*1000:.1f}ms | "
+          f"hiz: {t_nchw/t_nhwc:.2f}x")
+
+    # Tek Conv2D (im2col): kanal sayisi arttikca duzenin etkisi. Girdi
+    # katman dtype'inda verilir (donusum suresi olcume karismaz).
+    print(f"\nConv2D 3x3 (im2col), forward / backward:")
+    print(f"{'girdi':>19} -> {'C_out':>5} | {'NCHW fwd':>9} | {'NHWC fwd':>9} | {'NCHW bwd':>9} | {'NHWC bwd':>9}")
+    print("-" * 75)
+    dtype = get_default_dtype()
+    for x_shape, C_out, padding in [((500, 1, 28, 28), 16, 0), ((128, 16, 13, 13), 32, 1),
+                                    ((64, 32, 14, 14), 64, 1), ((32, 64, 7, 7), 128, 1)]:
+        x = np.random.randn(*x_shape).astype(dtype)
+        conv_nchw = Conv2D(x_shape[1], C_out, 3, padding=padding, algorithm='im2col')
+        conv_nhwc = Conv2D(x_shape[1], C_out, 3, padding=padding, algorithm='im2col', data_format='NHWC')
+        conv_nhwc.W, conv_nhwc.b = conv_nchw.W, conv_nchw.b
+
+        dout = np.random.randn(*conv_nchw.forward(x).shape).astype(dtype)
+        x_last = np.ascontiguousarray(x.transpose(0, 2, 3, 1))
+        dout_last = np.ascontiguousarray(dout.transpose(0, 2, 3, 1))
+
+        times = []
+        for conv, x_in, dout_in in ((conv_nchw, x, dout), (conv_nhwc, x_last, dout_last)):
+            conv.forward(x_in)
+            conv.backward(dout_in)
+            times.append(measure(lambda: conv.forward(x_in), repeat=5))
+            times.append(measure(lambda: conv.backward(dout_in), repeat=5))
+        assert_close(conv_nhwc.dW, conv_nchw.dW, conv_nchw.W.dtype, "dW farkli")
+        f_nchw, b_nchw, f_nhwc, b_nhwc = (t * 1000 for t in times)
+        print(f"{str(x_shape):>19} -> {C_out:>5} | {f_nchw:>7.1f}ms | {f_nhwc:>7.1f}ms | "
+              f"{b_nchw:>7.1f}ms | {b_nhwc:>7.1f}ms")
+    print("\nNHWC backward'da col2im_nhwc'nin ic dongusu C uzunlugundadir; az/orta kanalda")
+    print("NCHW col2im'den yavastir. Modelde NHWC kazanci agirlikla ReLU ve MaxPool2D'den gelir.")
+
+
+# ============== GRUPLU / DEPTHWISE-SEPARABLE ==============
+def grouped_conv_loop(conv, x):
+    """Referans: her grubu ayri bir Conv2D ile hesapla (Python dongusu)."""
+    G = conv.groups
+    C_in_g, C_out_g = conv.in_channels // G, conv.out_channels // G
+    outs = []
+    for g in range(G):
+        single = Conv2D(C_in_g, C_out_g, conv.kernel_size, conv.stride, conv.padding, algorithm='im2col')
+        single.W = conv.W[g * C_out_g:(g + 1) * C_out_g]
+        single.b = conv.b[g * C_out_g:(g + 1) * C_out_g]
+        outs.append(single.forward(x[:, g * C_in_g:(g + 1) * C_in_g]).copy())
+    return np.concatenate(outs, axis=1)
+
+
+def conv_macs(conv, out_shape):
+    """Forward'daki carpma-toplama sayisi."""
+    kH, kW = conv.kernel_size
+    return int(np.prod(out_shape)) * (conv.in_channels // conv.groups) * kH * kW
+
+
+@benchmark('separable')
+def bench_separable():
+    print_header("Standart Conv2D vs Depthwise + Pointwise (MobileNet blogu)")
+
+    # (m, C_in, H, W), C_out
+    configs = [
+        ((64, 32, 28, 28), 64),
+        ((64, 64, 14, 14), 128),
+        ((32, 128, 14, 14), 128),
+    ]
+
+    print(f"{'x_shape':>17} | {'C_out':>5} | {'MAC std':>8} | {'MAC sep':>8} | "
+          f"{'standart':>9} | {'separable':>9} | {'hiz':>6}")
+    print("-" * 82)
+
+    for x_shape, C_out in configs:
+        m, C_in = x_shape[:2]
+        x = np.random.randn(*x_shape)
+
+        standard = Conv2D(C_in, C_out, 3, padding=1, algorithm='im2col')
+        depthwise = DepthwiseConv2D(C_in, 3, padding=1)
+        pointwise = PointwiseConv2D(C_in, C_out)
+
+        # Gruplu yol, grup basina ayri konvolusyonla ayni sonucu vermeli
+        out_dw = depthwise.forward(x)
+        assert np.allclose(out_dw, grouped_conv_loop(depthwise, x)), "depthwise farkli"
+        out_pw = pointwise.forward(out_dw)
+
+        dout_std = np.random.randn(*standard.forward(x).shape)
+        dout_pw = np.random.randn(*out_pw.shape)
+
+        def separable_step():
+            pointwise.forward(depthwise.forward(x))
+            depthwise.backward(pointwise.backward(dout_pw))
+
+        t_standard = conv_step_time(standard, x, dout_std)
+        t_separable = measure(separable_step, repeat=3)
+
+        macs_std = conv_macs(standard, dout_std.shape)
+        macs_sep = conv_macs(depthwise, out_dw.shape) + conv_macs(pointwise, out_pw.shape)
+
+        print(f"{str(x_shape):>17} | {C_out:>5} | {macs_std/1e9:>6.2f}G | {macs_sep/1e9:>6.2f}G | "
+              f"{t_standard*1000:>7.1f}ms | {t_separable*1000:>7.1f}ms | {t_standard/t_separable:>5.2f}x")
+
+    # Gruplu konvolusyon: ayni C_in/C_out, groups arttikca maliyet duser
+    print("\nConv2D(64, 64, 3) groups etkisi, x = (64, 64, 14, 14):")
+    x = np.random.randn(64, 64, 14, 14)
+    for groups in (1, 2, 4, 8, 64):
+        conv = Conv2D(64, 64, 3, padding=1, algorithm='im2col', groups=groups)
+        dout = np.random.randn(*conv.forward(x).shape)
+        if groups in (4, 64):
+            assert np.allclose(conv.forward(x), grouped_conv_loop(conv, x)), "gruplu konvolusyon farkli"
+        print(f"  groups={groups:>2}: {conv_step_time(conv, x, dout)*1000:>7.1f}ms")
+
+
+# ============== MIKRO-BATCH (memory_budget) ==============
+def conv_budget_steps(memory_budget, x_shape, out_channels, data_format):
+    """Ayri process'te memory_budget'li Conv2D adimi: sure ve tepe RSS."""
+    np.random.seed(0)
+    x = np.random.randn(*x_shape)
+    if data_format == 'NHWC':
+        x = np.ascontiguousarray(x.transpose(0, 2, 3, 1))
+    conv = Conv2D(x_shape[1], out_channels, 3, algorithm='im2col',
+                  data_format=data_format, memory_budget=memory_budget)
+    dout = np.random.randn(*conv.forward(x).shape)
+    step_time = conv_step_time(conv, x, dout)
+    return step_time, peak_rss_mb()
+
+
+@benchmark('memory_budget')
+def bench_memory_budget():
+    print_header("Conv2D memory_budget: tek parca vs mikro-batch im2col")
+
+    # Parcali sonuc: cikti, dx ve db bit bit ayni, dW yuvarlama duzeyinde
+    for data_format in ('NCHW', 'NHWC'):
+        x = np.random.randn(200, 3, 20, 20)
+        if data_format == 'NHWC':
+            x = np.ascontiguousarray(x.transpose(0, 2, 3, 1))
+        reference = Conv2D(3, 8, 3, padding=1, algorithm='im2col', data_format=data_format)
+        chunked = Conv2D(3, 8, 3, padding=1, algorithm='im2col', data_format=data_format,
+                         memory_budget=2**20)
+        chunked.W = reference.W.copy()
+
+        out_ref = reference.forward(x).copy()
+        assert np.array_equal(chunked.forward(x), out_ref), "forward farkli"
+        assert chunked.cache['chunked']
+
+        dout = np.random.randn(*out_ref.shape)
+        dx_ref = reference.backward(dout).copy()
+        assert np.array_equal(chunked.backward(dout), dx_ref), "dx farkli"
+        assert_close(chunked.dW, reference.dW, reference.W.dtype, "dW farkli")
+        assert np.array_equal(chunked.db, reference.db), "db farkli"
+
+    # test_cnn_fashion_mnist.py ilk katmani; x_col = 9 x 676 x m x itemsize byte
+    x_shape, C_out = (4000, 1, 28, 28), 16
+    x_col_mb = 9 * 26 * 26 * x_shape[0] * get_default_dtype().itemsize / 2**20
+    print(f"x = {x_shape}, Conv2D(1, {C_out}, 3), tam x_col = {x_col_mb:.0f} MB\n")
+
+    print(f"{'format':>6} | {'butce':>8} | {'adim':>9} | {'tepe RSS':>9}")
+    print("-" * 43)
+    for data_format in ('NCHW', 'NHWC'):
+        for budget_mb in (None, 64, 16, 4):
+            budget = None if budget_mb is None else budget_mb * 2**20
+            step_time, rss = run_isolated(conv_budget_steps, budget, x_shape, C_out, data_format)
+            label = 'yok' if budget_mb is None else f"{budget_mb} MB"
+            print(f"{data_format:>6} | {label:>8} | {step_time*1000:>7.1f}ms | {rss:>6.0f} MB")
+
+
+# ============== DILATED KONVOLUSYON ==============
+def dilated_reference(conv):
+    """Dilated conv ile ayni sonucu veren, sifir eklenmis yogun kernel'li Conv2D."""
+    d = conv.dilation
+    kH, kW = conv.kernel_size
+    dense = Conv2D(conv.in_channels, conv.out_channels, (d * (kH - 1) + 1, d * (kW - 1) + 1),
+                   padding=conv.padding, algorithm='im2col')
+    dense.W = np.zeros_like(dense.W)
+    dense.W[:, :, ::d, ::d] = conv.W
+    dense.b = conv.b.copy()
+    return dense
+
+
+@benchmark('dilation')
+def bench_dilation():
+    print_header("Dilated 3x3 konvolusyon: yogun 3x3 ve ayni alani goren yogun kernel ile")
+
+    x = np.random.randn(64, 16, 28, 28)
+    C_out = 32
+
+    print(f"{'kernel':>14} | {'alan':>5} | {'im2col':>9} | {'winograd':>9} | {'fft':>9}")
+    print("-" * 60)
+
+    for k, d in ((3, 1), (3, 2), (5, 1), (3, 4), (9, 1)):
+        span = d * (k - 1) + 1
+        padding = span // 2
+        times = {}
+        for algorithm in ('im2col', 'winograd', 'fft'):
+            if algorithm == 'winograd' and k != 3:
+                continue
+            conv = Conv2D(16, C_out, k, padding=padding, algorithm=algorithm, dilation=d)
+            dout = np.random.randn(*conv.forward(x).shape)
+
+            if d > 1:
+                # Ayni sonuc: sifir eklenmis yogun kernel (forward, dx, dW)
+                dense = dilated_reference(conv)
+                assert_close(conv.forward(x), dense.forward(x), conv.W.dtype, "forward farkli")
+                dx = conv.backward(dout).copy()
+                assert_close(dx, dense.backward(dout), conv.W.dtype, "dx farkli")
+                assert_close(conv.dW, dense.dW[:, :, ::d, ::d], conv.W.dtype, "dW farkli")
+
+            times[algorithm] = conv_step_time(conv, x, dout)
+
+        cells = [f"{times[a]*1000:>7.1f}ms" if a in times else f"{'-':>9}"
+                 for a in ('im2col', 'winograd', 'fft')]
+        print(f"{f'{k}x{k} d={d}':>14} | {f'{span}x{span}':>5} | " + " | ".join(cells))
+
+
+# ============== DTYPE POLITIKASI ==============
+def float_arrays(obj, path):
+    """obj icindeki (dict/list/attribute) tum ondalikli dizileri (yol, dizi) olarak dolas."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in 'fc':
+            yield path, obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from float_arrays(value, f"{path}[{key!r}]")
+    elif isinstance(obj, (list, tuple)):
+        for i, value in enumerate(obj):
+            yield from float_arrays(value, f"{path}[{i}]")
+
+
+def dtype_audit(model, dtype, x, y):
+    """
+    Bir egitim adimindan sonra modelde dtype'i farkli dizileri listele.
+
+    Parametreler, gradyanlar, cache ve workspace buffer'lari taranir. Karmasik
+    diziler (FFT spektrumlari) dtype'in karmasik karsiligi olmali.
+    """
+    dtype = np.dtype(dtype)
+    complex_dtype = np.result_type(dtype, np.complex64)
+
+    found = []
+    loss_fn = CrossEntropyLoss()
+
+    # Katman katman: bir sonraki katmanin geri cevirdigi ara diziler de gorunsun
+    out = x
+    for i, layer in enumerate(model.layers):
+        out = layer.forward(out)
+        found.append((f"{i}:{type(layer).__name__} forward", out))
+
+    found.append(('loss', np.asarray(loss_fn.forward(out, y))))
+    grad = loss_fn.backward()
+    found.append(('loss backward', grad))
+
+    for i in reversed(range(len(model.layers))):
+        grad = model.layers[i].backward(grad)
+        found.append((f"{i}:{type(model.layers[i]).__name__} backward", grad))
+
+    SGD(model, lr=np.float64(0.01)).step()    # NumPy skaler lr de yukseltmemeli
+
+    for i, layer in enumerate(model.layers):
+        found += float_arrays(vars(layer), f"{i}:{type(layer).__name__}")
+
+    return [(path, a.dtype) for path, a in found
+            if a.dtype != (complex_dtype if a.dtype.kind == 'c' else dtype)]
+
+
+def mlp_step_time(dtype, m, steps):
+    """Ayri process'te test_fashion_mnist.py MLP'sinin egitim adimi suresi."""
+    from layers import set_default_dtype
+    set_default_dtype(dtype)
+    np.random.seed(0)
+    model = Sequential([Dense(784, 128), ReLU(), Dense(128, 10), Softmax()])
+    x = np.random.rand(784, m).astype(dtype)
+    y = np.eye(10, dtype=dtype)[:, np.random.randint(0, 10, m)]
+    return training_step_time(model, x, y, steps)
+
+
+def cnn_step_time(dtype, m, steps):
+    """Ayri process'te test_cnn_fashion_mnist.py CNN'inin egitim adimi suresi."""
+    from layers import set_default_dtype
+    set_default_dtype(dtype)
+    np.random.seed(0)
+    model = fashion_cnn('NCHW')
+    x = np.random.rand(m, 1, 28, 28).astype(dtype)
+    y = np.eye(10, dtype=dtype)[:, np.random.randint(0, 10, m)]
+    return training_step_time(model, x, y, steps)
+
+
+def training_step_time(model, x, y, steps):
+    """forward + loss + backward + SGD adiminin en iyi suresi."""
+    loss_fn = CrossEntropyLoss()
+    optimizer = SGD(model, lr=0.01)
+
+    def step():
+        loss_fn.forward(model.forward(x), y)
+        model.backward(loss_fn.backward())
+        optimizer.step()
+
+    step()
+    return measure(step, repeat=steps)
+
+
+@benchmark('dtype')
+def bench_dtype():
+    print_header("Dtype politikasi: float32 vs float64 egitim adimi")
+
+    # Denetim: float64 girdi/etiket verilse de model kendi dtype'inda kalmali
+    for dtype in (np.float32, np.float64):
+        for algorithm in ('im2col', 'winograd', 'fft'):
+            for data_format in ('NCHW', 'NHWC'):
+                model = fashion_cnn(data_format, algorithm=algorithm)
+                model.set_dtype(dtype)
+                x = np.random.rand(32, 1, 28, 28)
+                if data_format == 'NHWC':
+                    x = x.transpose(0, 2, 3, 1)
+                y = np.eye(10)[:, np.random.randint(0, 10, 32)]
+                mismatched = dtype_audit(model, dtype, x, y)
+                assert not mismatched, f"{np.dtype(dtype)} {algorithm} {data_format}: {mismatched}"
+    print(f"Denetim tamam: varsayilan dtype = {get_default_dtype()}, tum diziler model dtype'inda\n")
+
+    print(f"{'model':>6} | {'batch':>6} | {'float64':>9} | {'float32':>9} | {'hiz':>6} | {'ornek/s (f32)':>13}")
+    print("-" * 64)
+    for name, step_time, m in (('MLP', mlp_step_time, 10000), ('CNN', cnn_step_time, 1000)):
+        t64 = run_isolated(step_time, np.float64, m, 3)
+        t32 = run_isolated(step_time, np.float32, m, 3)
+        print(f"{name:>6} | {m:>6} | {t64*1000:>7.1f}ms | {t32*1000:>7.1f}ms | "
+              f"{t64/t32:>5.2f}x | {m/t32:>13.0f}")
+
+
+# ============== KARISIK HASSASIYET ==============
+def cache_bytes(model):
+    """Modelin backward icin sakladigi aktivasyonlarin toplam boyutu (byte)."""
+    return sum(a.nbytes for layer in model.layers for a in layer.cache.values()
+               if isinstance(a, np.ndarray))
+
+
+def step_bytes(model):
+    """
+    Cache + workspace buffer'larinin toplam boyutu (byte). Cache'teki
+    workspace buffer'lari ve view'lar bir kez sayilir.
+    """
+    arrays = {}
+    for layer in model.layers:
+        sources = [layer.cache] + list(getattr(layer, '_workspaces', {}).values())
+        for a in (a for d in sources for a in d.values()):
+            if isinstance(a, np.ndarray):
+                base = a if a.base is None else a.base
+                arrays[id(base)] = base.nbytes
+    return sum(arrays.values())
+
+
+def mixed_training(mixed_precision, m, steps):
+    """
+    Ayri process'te CNN egitimi: adim suresi, tepe RSS, cache boyutu,
+    cache + workspace boyutu ve loss egrisi.
+    """
+    np.random.seed(0)
+    model = fashion_cnn('NCHW')
+    if mixed_precision:
+        model.set_cache_dtype(np.float16)
+    scaler = DynamicLossScaler() if mixed_precision else None
+    loss_fn = CrossEntropyLoss(scaler=scaler)
+    optimizer = SGD(model, lr=0.05, scaler=scaler)
+
+    x = np.random.rand(m, 1, 28, 28).astype(np.float32)
+    y = np.eye(10, dtype=np.float32)[:, np.random.randint(0, 10, m)]
+
+    losses = []
+    times = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        losses.append(float(loss_fn.forward(model.forward(x), y)))
+        model.backward(loss_fn.backward())
+        optimizer.step()
+        times.append(time.perf_counter() - start)
+
+    return min(times[1:]), peak_rss_mb(), cache_bytes(model), step_bytes(model), losses
+
+
+@benchmark('mixed_precision')
+def bench_mixed_precision():
+    print_header("Karisik hassasiyet: float16 aktivasyon cache'i + loss scaling")
+
+    # Denetim: agirliklar ve gradyanlar float32 kalmali, cache float16 (ReLU: bool maske) olmali
+    model = Sequential([Dense(784, 64), ReLU(), Dense(64, 10), Softmax()], mixed_precision=True)
+    x = np.random.rand(784, 32)
+    model.forward(x)
+    for layer in model.layers[:-1]:
+        for key, a in layer.cache.items():
+            if not isinstance(a, np.ndarray):
+                continue
+            assert a.dtype in (np.float16, np.bool_), f"{type(layer).__name__}.cache['{key}']: {a.dtype}"
+    for layer in model.layers:
+        for key, p in layer.get_params().items():
+            assert p.dtype == np.float32, f"{type(layer).__name__}.{key}: {p.dtype}"
+
+    # Denetim: inf gradyanli adim atlanmali, olcek yariya inmeli
+    scaler = DynamicLossScaler(init_scale=1024.0)
+    loss_fn = CrossEntropyLoss(scaler=scaler)
+    optimizer = SGD(model, lr=0.1, scaler=scaler)
+    loss_fn.forward(model.forward(x), np.eye(10)[:, np.random.randint(0, 10, 32)])
+    model.backward(loss_fn.backward())
+    model.layers[0].dW[0, 0] = np.inf
+    W = model.layers[0].W.copy()
+    optimizer.step()
+    assert np.array_equal(W, model.layers[0].W) and scaler.scale == 512.0 and scaler.skipped_steps == 1
+    print(f"Denetim tamam: cache float16/bool, parametreler float32, inf adimi atlandi ({scaler})\n")
+
+    m, steps = 256, 20
+    f32 = run_isolated(mixed_training, False, m, steps)
+    f16 = run_isolated(mixed_training, True, m, steps)
+
+    # Ayni baslangictan loss egrileri yakin kalmali
+    drift = max(abs(a - b) for a, b in zip(f32[4], f16[4]))
+    assert drift < 1e-2 * f32[4][0], f"loss farki {drift}"
+    # float16 x_col kopyasi float32 dx_col buffer'inin yerini alir
+    assert f16[3] < f32[3], "cache + workspace kuculmedi"
+
+    print(f"CNN, batch={m}, {steps} adim")
+    print(f"{'mod':>8} | {'adim':>9} | {'tepe RSS':>9} | {'cache':>9} | {'+workspace':>10} | {'son loss':>9}")
+    print("-" * 69)
+    for name, (step_time, rss, cached, total, losses) in (('float32', f32), ('mixed', f16)):
+        print(f"{name:>8} | {step_time*1000:>7.1f}ms | {rss:>6.0f} MB | "
+              f"{cached/2**20:>6.1f} MB | {total/2**20:>7.1f} MB | {losses[-1]:>9.4f}")
+    print(f"\nAktivasyon cache'i {f32[2]/f16[2]:.2f}x, cache + workspace "
+          f"{f32[3]/f16[3]:.2f}x kucuk, en buyuk loss farki {drift:.2e}")
+
+
+# ============== ReLU ==============
+class ReLUFloatMask:
+    """Eski ReLU: z'yi saklar, backward'da float maske olusturur."""
+
+    def __init__(self):
+        self.cache = {}
+
+    def forward(self, z):
+        self.cache['z'] = z
+        return np.maximum(0, z)
+
+    def backward(self, dout):
+        z = self.cache['z']
+        return dout * (z > 0).astype(float)
+
+
+@benchmark('relu')
+def bench_relu():
+    print_header("ReLU: float z cache vs bool / packed maske, inplace")
+
+    dtype = get_default_dtype()
+    shape = (256, 16, 26, 26)   # CNN'de Conv2D ciktisi, batch=256
+    z = np.random.randn(*shape).astype(dtype)
+    dout = np.random.randn(*shape).astype(dtype)
+
+    variants = {
+        'eski (z cache)': ReLUFloatMask,
+        'bool maske': ReLU,
+        'inplace': lambda: ReLU(inplace=True),
+        'inplace+packed': lambda: ReLU(inplace=True, packed=True),
+    }
+
+    reference = ReLUFloatMask()
+    a_ref = reference.forward(z)
+    dz_ref = reference.backward(dout)
+
+    print(f"Girdi: {shape}, {np.dtype(dtype)}, {z.nbytes / 2**20:.0f} MB\n")
+    print(f"{'versiyon':>15} | {'cache':>8} | {'gecici':>8} | {'forward':>9} | {'backward':>9}")
+    print("-" * 62)
+    for name, make in variants.items():
+        layer = make()
+
+        # Dogruluk: inplace girdiyi bozdugu icin kopyalar uzerinde
+        a = layer.forward(z.copy())
+        dz = layer.backward(dout.copy())
+        assert a.dtype == dtype and dz.dtype == (np.float64 if make is ReLUFloatMask else dtype)
+        assert np.array_equal(a, a_ref) and np.allclose(dz, dz_ref), name
+
+        cached = sum(v.nbytes for v in layer.cache.values() if isinstance(v, np.ndarray))
+
+        # Inplace varyantlar her cagrida yeni kopya ister; kopya suresi ikisinden de cikarilir
+        z_copy, dout_copy = z.copy(), dout.copy()
+        t_copy = measure(lambda: np.copyto(z_copy, z))
+        t_forward = measure(lambda: (np.copyto(z_copy, z), layer.forward(z_copy))) - t_copy
+        t_backward = measure(lambda: (np.copyto(dout_copy, dout), layer.backward(dout_copy))) - t_copy
+
+        layer.forward(z_copy)
+        temporary = step_allocation(lambda: layer.backward(dout_copy))
+        temporary += step_allocation(lambda: layer.forward(z_copy))
+
+        print(f"{name:>15} | {cached / 2**20:>5.1f} MB | {temporary / 2**20:>5.0f} MB | "
+              f"{t_forward*1000:>7.2f}ms | {t_backward*1000:>7.2f}ms")
+
+
+# ============== SOFTMAX + CROSS-ENTROPY ==============
+@benchmark('softmax_ce')
+def bench_softmax_ce():
+    print_header("Softmax + CrossEntropyLoss vs SoftmaxCrossEntropy (logit + tam sayi etiket)")
+
+    dtype = get_default_dtype()
+    n_classes, m = 10, 60000   # Fashion-MNIST egitim seti
+    logits = np.random.randn(n_classes, m).astype(dtype)
+    labels = np.random.randint(0, n_classes, m).astype(np.uint8)
+    one_hot = np.zeros((n_classes, m))   # eski scriptlerdeki float64 one-hot
+    one_hot[labels, np.arange(m)] = 1
+
+    softmax, ce, fused = Softmax(), CrossEntropyLoss(), SoftmaxCrossEntropy()
+
+    def separate():
+        loss = ce.forward(softmax.forward(logits), one_hot)
+        return loss, softmax.backward(ce.backward())
+
+    def combined():
+        loss = fused.forward(logits, labels)
+        return loss, fused.backward()
+
+    loss_ref, dout_ref = separate()
+    loss, dout = combined()
+    rtol, atol = tolerance(dtype)
+    assert abs(loss - loss_ref) < 1e-3 * loss_ref, (loss, loss_ref)  # eski: log(p + 1e-8)
+    assert np.allclose(dout, dout_ref, rtol=rtol, atol=atol) and dout.dtype == dtype
+
+    print(f"logits: ({n_classes}, {m}) {np.dtype(dtype)}, loss {loss:.6f} (eski {loss_ref:.6f})\n")
+    print(f"{'versiyon':>22} | {'etiket':>9} | {'gecici':>9} | {'sure':>9}")
+    print("-" * 60)
+    for name, fn, y in (('Softmax + CE (one-hot)', separate, one_hot),
+                        ('SoftmaxCrossEntropy', combined, labels)):
+        t = measure(fn)
+        allocated = step_allocation(fn)
+        print(f"{name:>22} | {y.nbytes / 2**20:>6.2f} MB | {allocated / 2**20:>6.1f} MB | {t*1000:>7.2f}ms")
+    print(f"\nEtiket bellegi {one_hot.nbytes // labels.nbytes}x kucuk")
+
+
+# ============== CIKARIM MODU ==============
+def retained_bytes(model):
+    """Forward sonrasi cache'te tutulan dizilerin boyutu (byte)."""
+    return sum(a.nbytes for layer in model.layers for a in layer.cache.values()
+               if isinstance(a, np.ndarray))
+
+
+@benchmark('inference')
+def bench_inference():
+    print_header("Degerlendirme: forward (egitim modu) vs predict (cikarim modu)")
+
+    m = 10000
+    model = fashion_cnn('NCHW')
+    x = np.random.rand(m, 1, 28, 28).astype(get_default_dtype())
+
+    # Dogruluk: predict ciktisi/etiketleri egitim modundaki forward ile ayni
+    probs = model.forward(x)
+    labels = np.argmax(probs, axis=0)
+    rtol, atol = tolerance(probs.dtype)
+    assert np.allclose(model.predict(x, batch_size=1000), probs, rtol=rtol, atol=atol)
+    assert np.array_equal(model.predict(x, batch_size=1000, output='labels'), labels)
+    assert model.predict(x[:10], output='logits').shape == (10, 10)
+    assert all(layer.cache == {} for layer in model.layers) and model.training
+
+    # Son katman Dense: forward ciktisi sonraki forward'da degismemeli
+    logits_model = mlp()
+    with logits_model.no_grad():
+        l1 = logits_model.forward(x[:64].reshape(64, -1).T)
+        expected = l1.copy()
+        l2 = logits_model.forward(x[64:128].reshape(64, -1).T)
+    assert l1 is not l2 and np.array_equal(l1, expected)
+
+    variants = (
+        ('forward (eski)', lambda: np.argmax(model.forward(x), axis=0)),
+        ('predict', lambda: model.predict(x, output='labels')),
+        ('predict batch=1000', lambda: model.predict(x, batch_size=1000, output='labels')),
+    )
+
+    print(f"CNN, {m} ornek (test_cnn_fashion_mnist.py compute_accuracy)\n")
+    print(f"{'versiyon':>20} | {'tepe bellek':>11} | {'cache':>9} | {'sure':>9}")
+    print("-" * 60)
+    for name, fn in variants:
+        model.clear_cache().clear_workspace()
+        allocated = step_allocation(fn)
+        cached = retained_bytes(model)
+        t = measure(fn, repeat=3)
+        print(f"{name:>20} | {allocated / 2**20:>8.0f} MB | {cached / 2**20:>6.0f} MB | {t*1000:>7.0f}ms")
+
+
+# ============== DENSE ==============
+class DenseAllocating(Dense):
+    """Eski Dense: her adimda z, dW, db ve dx icin yeni diziler."""
+
+    def forward(self, x):
+        self.cache['x'] = x
+        return np.dot(self.W, x) + self.b
+
+    def backward(self, dout):
+        x = self.cache['x']
+        m = x.shape[1]
+        self.dW = (1 / m) * np.dot(dout, x.T)
+        self.db = (1 / m) * np.sum(dout, axis=1, keepdims=True)
+        return np.dot(self.W.T, dout)
+
+
+def heap_growth(step, steps=5):
+    """Isinmadan sonra steps adimda kalici bellek artisi ve adim basi gecici bellek (byte)."""
+    tracemalloc.start()
+    step()
+    step()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    for _ in range(steps):
+        step()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current - base, peak - base
+
+
+@benchmark('dense')
+def bench_dense():
+    print_header("Dense: yeni diziler vs workspace buffer'lari (out=)")
+
+    dtype = get_default_dtype()
+    m = 10000
+    x = np.random.rand(784, m).astype(dtype)
+    dout = np.random.randn(128, m).astype(dtype)
+
+    old, new = DenseAllocating(784, 128, seed=0), Dense(784, 128, seed=0)
+    z_ref, z = old.forward(x), new.forward(x).copy()
+    dx_ref, dx = old.backward(dout), new.backward(dout)
+    rtol, atol = tolerance(dtype)
+    assert np.allclose(z, z_ref, rtol=rtol, atol=atol) and np.allclose(dx, dx_ref, rtol=rtol, atol=atol)
+    assert np.allclose(new.dW, old.dW, rtol=rtol, atol=atol) and np.allclose(new.db, old.db, rtol=rtol, atol=atol)
+    assert new.dW.dtype == new.db.dtype == dx.dtype == z.dtype == dtype
+
+    print(f"Dense(784, 128), batch={m}, {np.dtype(dtype)}\n")
+    print(f"{'versiyon':>10} | {'forward':>9} | {'backward':>9} | {'adim basi ayrilan':>17}")
+    print("-" * 56)
+    t_forward = measure_interleaved([lambda: old.forward(x), lambda: new.forward(x)])
+    t_backward = measure_interleaved([lambda: old.backward(dout), lambda: new.backward(dout)])
+    for i, (name, layer) in enumerate((('eski', old), ('workspace', new))):
+        allocated = step_allocation(lambda: (layer.forward(x), layer.backward(dout)))
+        print(f"{name:>10} | {t_forward[i]*1000:>7.2f}ms | {t_backward[i]*1000:>7.2f}ms | "
+              f"{allocated / 2**20:>14.1f} MB")
+
+    # test_fashion_mnist.py egitim dongusu: kalici bellek artisi olmamali
+    model = Sequential([Dense(784, 128, seed=42), ReLU(inplace=True), Dense(128, 10, seed=42)])
+    labels = np.random.randint(0, 10, m).astype(np.uint8)
+    loss_fn = SoftmaxCrossEntropy()
+    optimizer = SGD(model, lr=0.1)
+
+    def step():
+        loss_fn.forward(model.forward(x), labels)
+        model.backward(loss_fn.backward())
+        optimizer.step()
+
+    growth, transient = heap_growth(step)
+    assert growth < 2**16, f"egitim dongusunde bellek artisi: {growth} byte"
+    print(f"\nMLP egitim dongusu (5 adim): kalici artis {growth / 1024:.1f} KB, "
+          f"adim basi gecici {transient / 2**20:.1f} MB (ReLU maskesi, loss, SGD)")
+
+
+# ============== PARAMETRE ARENASI ==============
+class SGDRebind(SGD):
+    """Eski SGD: katman katman dolasir, her adimda yeni W/b dizileri ayirir."""
+
+    def step(self):
+        lr = float(self.lr)
+        for layer in self.model.layers:
+            params, grads = layer.get_params(), layer.get_grads()
+            if params and grads:
+                layer.W = layer.W - lr * grads['dW']
+                layer.b = layer.b - lr * grads['db']
+
+
+@benchmark('arena')
+def bench_arena():
+    print_header("Optimizer adimi: katman katman (yeni diziler) vs parametre arenasi")
+
+    # Dogruluk: ayni baslangictan ayni agirliklar
+    x = np.random.rand(784, 64).astype(get_default_dtype())
+    labels = np.random.randint(0, 10, 64)
+    weights = []
+    for optimizer_class in (SGDRebind, SGD):
+        model = Sequential([Dense(784, 128, seed=1), ReLU(), Dense(128, 10, seed=2)])
+        loss_fn, optimizer = SoftmaxCrossEntropy(), optimizer_class(model, lr=0.1)
+        for _ in range(5):
+            loss_fn.forward(model.forward(x), labels)
+            model.backward(loss_fn.backward())
+            optimizer.step()
+        weights.append([layer.W.copy() for layer in model.layers if layer.get_params()])
+    assert all(np.array_equal(a, b) for a, b in zip(*weights))
+
+    params, grads = model.arena()
+    assert all(np.shares_memory(layer.W, params) and np.shares_memory(layer.dW, grads)
+               for layer in model.layers if layer.get_params())
+    print(f"Denetim tamam: ayni agirliklar, W/dW arena view'lari ({params.size} parametre)\n")
+
+    print(f"{'model':>10} | {'parametre':>9} | {'eski':>9} | {'arena':>9} | {'ayrilan (eski)':>14}")
+    print("-" * 64)
+    models = (
+        ('MLP', lambda: Sequential([Dense(784, 128), ReLU(), Dense(128, 10)])),
+        ('CNN', lambda: fashion_cnn('NCHW')),
+        ('MLP-genis', lambda: Sequential([Dense(784, 1024), ReLU(), Dense(1024, 1024), ReLU(),
+                                          Dense(1024, 10)])),
+    )
+    for name, make in models:
+        model = make()
+        for layer in model.layers:
+            for param, grad in zip(layer.get_params(), layer.get_grads()):
+                setattr(layer, grad, np.random.randn(*getattr(layer, param).shape).astype(get_default_dtype()) * 1e-3)
+
+        old, new = SGDRebind(model, lr=1e-3), SGD(model, lr=1e-3)
+        t_old = measure(old.step, repeat=20)
+        allocated = step_allocation(old.step)
+        t_new = measure(new.step, repeat=20)
+        assert step_allocation(new.step) < 1024
+        n_params = model.arena()[0].size
+        print(f"{name:>10} | {n_params:>9} | {t_old*1e6:>7.0f}us | {t_new*1e6:>7.0f}us | "
+              f"{allocated / 2**20:>11.2f} MB")
+
+
+# ============== OPTIMIZER'LAR ==============
+def synthetic_fashion(m, separation=0.15, seed=0):
+    """
+    Fashion-MNIST boyutlarinda sentetik veri: (784, m) float32, (m,) uint8.
+
+    Her sinifin rastgele bir prototipi vardir; ornekler prototip ile
+    gurultunun karisimidir (separation: prototipin payi).
+    """
+    rng = np.random.default_rng(seed)
+    prototypes = rng.random((10, 784))
+    labels = rng.integers(0, 10, m).astype(np.uint8)
+    x = prototypes[labels] * separation + rng.random((m, 784)) * (1 - separation)
+    return np.ascontiguousarray(x.T, dtype=get_default_dtype()), labels
+
+
+def epochs_to_accuracy(make_optimizer, x, labels, target, max_epochs):
+    """Tam batch egitimde egitim dogrulugu target'a ulasana kadar epoch sayisi ve sure."""
+    model = Sequential([Dense(784, 128, seed=42), ReLU(inplace=True), Dense(128, 10, seed=42)])
+    loss_fn = SoftmaxCrossEntropy()
+    optimizer = make_optimizer(model)
+
+    train_time = 0.0
+    accuracy = 0.0
+    for epoch in range(1, max_epochs + 1):
+        start = time.perf_counter()
+        loss_fn.forward(model.forward(x), labels)
+        model.backward(loss_fn.backward())
+        optimizer.step()
+        train_time += time.perf_counter() - start
+
+        accuracy = np.mean(model.predict(x, output='labels') == labels)
+        if accuracy >= target:
+            return epoch, train_time, accuracy
+    return None, train_time, accuracy
+
+
+@benchmark('optimizers')
+def bench_optimizers():
+    print_header("Optimizer'lar: hedef dogruluga kadar epoch ve sure (tam batch MLP)")
+
+    optimizers = (
+        ('SGD', lambda model: SGD(model, lr=0.1)),
+        ('Momentum', lambda model: Momentum(model, lr=0.01, momentum=0.9)),
+        ('Nesterov', lambda model: Nesterov(model, lr=0.01, momentum=0.9)),
+        ('RMSProp', lambda model: RMSProp(model, lr=0.001)),
+        ('Adam', lambda model: Adam(model, lr=0.001)),
+        ('AdamW', lambda model: AdamW(model, lr=0.001, weight_decay=0.01)),
+    )
+
+    # Adim basina ek bellek olmamali (durum buffer'lari ilk adimda ayrilir)
+    x, labels = synthetic_fashion(256)
+    for name, make in optimizers:
+        model = Sequential([Dense(784, 128), ReLU(inplace=True), Dense(128, 10)])
+        loss_fn, optimizer = SoftmaxCrossEntropy(), make(model)
+        loss_fn.forward(model.forward(x), labels)
+        model.backward(loss_fn.backward())
+        optimizer.step()
+        allocated = step_allocation(optimizer.step)
+        assert allocated < 1024, f"{name}: adim basina {allocated} byte"
+        assert all(buf.dtype == model.layers[0].W.dtype for bufs in optimizer.state.values() for buf in bufs)
+    print("Denetim tamam: optimizer adimlari yeni dizi ayirmiyor\n")
+
+    m, target, max_epochs = 5000, 0.90, 200
+    x, labels = synthetic_fashion(m)
+    print(f"Sentetik veri: (784, {m}), hedef egitim dogrulugu %{target*100:.0f}, en fazla {max_epochs} epoch")
+    print(f"{'optimizer':>10} | {'epoch':>6} | {'sure':>8} | {'epoch basi':>10} | {'dogruluk':>8}")
+    print("-" * 56)
+    for name, make in optimizers:
+        epochs, train_time, accuracy = epochs_to_accuracy(make, x, labels, target, max_epochs)
+        per_epoch = train_time / (epochs or max_epochs)
+        epochs_text = str(epochs) if epochs else f">{max_epochs}"
+        print(f"{name:>10} | {epochs_text:>6} | {train_time:>7.2f}s | {per_epoch*1000:>8.1f}ms | {accuracy*100:>7.1f}%")
+
+
+# ============== SCHEDULER / EARLY STOPPING ==============
+def scheduled_training(make_scheduler, patience, x, labels, x_val, val_labels, max_epochs):
+    """
+    Tam batch SGD egitimi; scheduler ve early stopping istege bagli.
+
+    Returns:
+        (kosulan epoch, sure, en iyi val dogrulugu, dondurulen modelin val dogrulugu)
+    """
+    model = Sequential([Dense(784, 128, seed=42), ReLU(inplace=True), Dense(128, 10, seed=42)])
+    loss_fn, optimizer = SoftmaxCrossEntropy(), SGD(model, lr=0.1)
+    scheduler = make_scheduler(optimizer) if make_scheduler else None
+    early_stopping = EarlyStopping(patience=patience) if patience else None
+
+    best = 0.0
+    start = time.perf_counter()
+    for epoch in range(1, max_epochs + 1):
+        loss_fn.forward(model.forward(x), labels)
+        model.backward(loss_fn.backward())
+        optimizer.step()
+
+        val_acc = np.mean(model.predict(x_val, output='labels') == val_labels)
+        best = max(best, val_acc)
+        if isinstance(scheduler, ReduceLROnPlateau):
+            scheduler.step(val_acc)
+        elif scheduler is not None:
+            scheduler.step()
+        if early_stopping is not None and early_stopping.step(val_acc, model):
+            break
+    train_time = time.perf_counter() - start
+
+    if early_stopping is not None:
+        early_stopping.restore(model)
+    final = np.mean(model.predict(x_val, output='labels') == val_labels)
+    return epoch, train_time, best, final
+
+
+@benchmark('schedulers')
+def bench_schedulers():
+    print_header("LR scheduler + early stopping: sabit epoch'a karsi kosulan epoch")
+
+    # Plan degerleri formullerle ayni olmali
+    class Holder:                  # scheduler'lar sadece .lr kullanir
+        lr = 0.1
+    lrs = lambda sched, n: [sched.step() for _ in range(n)]
+    assert np.allclose(lrs(StepLR(Holder(), step_size=2, gamma=0.5), 4), [0.1, 0.05, 0.05, 0.025])
+    cosine = lrs(CosineAnnealingLR(Holder(), T_max=4, min_lr=0.0), 4)
+    assert np.allclose(cosine, [0.1 * (1 + np.cos(np.pi * t / 4)) / 2 for t in range(1, 5)])
+    one_cycle = OneCycleLR(Holder(), max_lr=1.0, total_steps=100)
+    values = lrs(one_cycle, 99)
+    assert np.isclose(max(values), 1.0) and values[-1] < 1e-3
+    plateau = ReduceLROnPlateau(Holder(), factor=0.5, patience=2)
+    assert np.allclose([plateau.step(m) for m in (0.5, 0.5, 0.5, 0.5, 0.6)], [0.1, 0.1, 0.1, 0.05, 0.05])
+
+    # restore: durduktan sonra model en iyi epoch'un agirliklarina doner
+    model = Sequential([Dense(4, 3, seed=0)])
+    stopper = EarlyStopping(patience=1)
+    stopper.step(0.9, model)
+    best_W = model.layers[0].W.copy()
+    model.layers[0].W += 1.0
+    assert stopper.step(0.8, model)
+    stopper.restore(model)
+    assert np.array_equal(model.layers[0].W, best_W)
+
+    # fit: OneCycleLR (per_step) batch basina, digerleri epoch basina step() edilir
+    x_small, y_small = np.random.rand(4, 500), np.random.randint(0, 3, 500)
+    for make, expected_steps in ((lambda opt: OneCycleLR(opt, max_lr=0.5, total_steps=10), 10),
+                                 (lambda opt: StepLR(opt, step_size=1), 2)):
+        model = Sequential([Dense(4, 3, seed=0)])
+        optimizer = SGD(model, lr=0.1)
+        scheduler = make(optimizer)
+        model.fit(x_small, y_small, SoftmaxCrossEntropy(), optimizer, batch_size=100, epochs=2,
+                  scheduler=scheduler, print_interval=0)
+        assert scheduler.epoch == expected_steps, f"{scheduler}: {scheduler.epoch} step"
+    print("Denetim tamam: plan degerleri, fit'te step sikligi, en iyi agirliklara donus\n")
+
+    max_epochs = 200
+    x, labels = synthetic_fashion(6000)
+    x_train, train_labels = np.ascontiguousarray(x[:, :5000]), labels[:5000]
+    x_val, val_labels = np.ascontiguousarray(x[:, 5000:]), labels[5000:]
+
+    configs = (
+        ('sabit', None, None),
+        ('plateau+es', lambda opt: ReduceLROnPlateau(opt, factor=0.5, patience=5), 15),
+        ('cosine+es', lambda opt: CosineAnnealingLR(opt, T_max=max_epochs), 15),
+    )
+    print(f"Sentetik veri: train 5000, val 1000, SGD lr=0.1, en fazla {max_epochs} epoch")
+    print(f"{'ayar':>11} | {'epoch':>6} | {'sure':>8} | {'en iyi val':>10} | {'son model':>9}")
+    print("-" * 57)
+    for name, make, patience in configs:
+        epochs, train_time, best, final = scheduled_training(
+            make, patience, x_train, train_labels, x_val, val_labels, max_epochs)
+        print(f"{name:>11} | {epochs:>6} | {train_time:>7.2f}s | {best*100:>9.1f}% | {final*100:>8.1f}%")
+
+
+# ============== MINI-BATCH EGITIM (fit) ==============
+def mlp(hidden=128):
+    return Sequential([Dense(784, hidden, seed=42), ReLU(inplace=True), Dense(hidden, 10, seed=42)])
+
+
+def time_to_accuracy(train_epoch, model, x_val, val_labels, target, max_epochs):
+    """train_epoch() ile val dogrulugu target'a ulasana kadar epoch ve egitim suresi."""
+    train_time = 0.0
+    for epoch in range(1, max_epochs + 1):
+        start = time.perf_counter()
+        train_epoch()
+        train_time += time.perf_counter() - start
+        if np.mean(model.predict(x_val, output='labels') == val_labels) >= target:
+            return epoch, train_time
+    return None, train_time
+
+
+@benchmark('fit')
+def bench_fit():
+    print_header("Sequential.fit: mini-batch egitim vs tam batch gradient descent")
+
+    # batch_size=m ve shuffle=False: tek bir tam batch adimiyla ayni sonuc
+    x, labels = synthetic_fashion(512)
+    full, fitted = mlp(), mlp()
+    loss_fn = SoftmaxCrossEntropy()
+    loss_fn.forward(full.forward(x), labels)
+    full.backward(loss_fn.backward())
+    SGD(full, lr=0.1).step()
+    fitted.fit(x, labels, loss_fn, SGD(fitted, lr=0.1), batch_size=512, shuffle=False, print_interval=0)
+    assert np.array_equal(full.arena()[0], fitted.arena()[0])
+
+    # Karistirma veriyi degistirmez, her epoch'ta her ornek bir kez kullanilir
+    seen = []
+    class Recorder(SoftmaxCrossEntropy):
+        def forward(self, y_pred, y_true):
+            seen.append(y_true.copy())
+            return super().forward(y_pred, y_true)
+    x_before = x.copy()
+    model = mlp()
+    model.fit(x, labels, Recorder(), SGD(model, lr=0.1), batch_size=100, seed=0, print_interval=0)
+    assert np.array_equal(x, x_before)
+    assert [len(batch) for batch in seen] == [100] * 5 + [12]
+    assert np.array_equal(np.sort(np.concatenate(seen)), np.sort(labels))
+    print("Denetim tamam: tam batch esdegerligi, veri kopyalanmiyor/degismiyor\n")
+
+    # Toplama duzeni: (m, 784) verinin .T view'u satir toplar
+    m = 20000
+    x, labels = synthetic_fashion(m)
+    layouts = (
+        ('view (shuffle=False)', x, False),
+        ('(784, m) sutun toplama', x, True),
+        ('(m, 784).T satir toplama', np.ascontiguousarray(x.T).T, True),
+    )
+    print(f"Batch toplama, batch_size=128, {m} ornek:")
+    for name, data, shuffle in layouts:
+        model = mlp()
+        history = model.fit(data, labels, SoftmaxCrossEntropy(), SGD(model, lr=0.1), batch_size=128,
+                            epochs=3, shuffle=shuffle, seed=0, print_interval=0)
+        print(f"  {name:>26}: {max(history['samples_per_sec']):>8.0f} ornek/sn")
+
+    # Hedef dogruluga kadar sure: tam batch GD vs mini-batch
+    target, max_epochs = 0.90, 200
+    x_train = np.ascontiguousarray(x[:, :15000].T).T
+    train_labels = labels[:15000]
+    x_val, val_labels = x[:, 15000:], labels[15000:]
+    print(f"\nVal dogrulugu %{target*100:.0f}'a kadar (train 15000, val 5000, SGD lr=0.1):")
+    print(f"{'egitim':>16} | {'epoch':>6} | {'sure':>8}")
+    print("-" * 36)
+
+    model = mlp()
+    loss_fn, optimizer = SoftmaxCrossEntropy(), SGD(model, lr=0.1)
+    def full_batch_epoch():
+        loss_fn.forward(model.forward(x_train), train_labels)
+        model.backward(loss_fn.backward())
+        optimizer.step()
+    epochs, train_time = time_to_accuracy(full_batch_epoch, model, x_val, val_labels, target, max_epochs)
+    print(f"{'tam batch':>16} | {epochs or f'>{max_epochs}':>6} | {train_time:>7.2f}s")
+
+    for batch_size in (32, 128, 512):
+        model = mlp()
+        optimizer = SGD(model, lr=0.1)
+        rng_seed = iter(range(max_epochs))
+        def minibatch_epoch():
+            model.fit(x_train, train_labels, loss_fn, optimizer, batch_size=batch_size,
+                      seed=next(rng_seed), print_interval=0)
+        epochs, train_time = time_to_accuracy(minibatch_epoch, model, x_val, val_labels, target, max_epochs)
+        print(f"{f'fit(batch={batch_size})':>16} | {epochs or f'>{max_epochs}':>6} | {train_time:>7.2f}s")
+
+
+# ============== DATALOADER ==============
+def noise_augment(seed=0):
+    """Batch'e yerinde kucuk Gauss gurultusu ekleyen veri artirma (batch hazirligini pahalilastirir)."""
+    rng = np.random.default_rng(seed)
+    def augment(x_batch):
+        x_batch += rng.standard_normal(x_batch.shape, dtype=x_batch.dtype) * x_batch.dtype.type(0.05)
+        return x_batch
+    return augment
+
+
+def loader_throughput(loader, epochs=3):
+    """(fit ile ornek/sn, sadece yukleyicinin ornek/sn'si) - en iyi epoch."""
+    model = mlp()
+    history = model.fit(loader, loss_fn=SoftmaxCrossEntropy(), optimizer=SGD(model, lr=0.1),
+                        epochs=epochs, print_interval=0)
+    best = float('inf')
+    for _ in range(epochs):
+        start = time.perf_counter()
+        for _ in loader:
+            pass
+        best = min(best, time.perf_counter() - start)
+    return max(history['samples_per_sec']), loader.num_samples / best
+
+
+@benchmark('dataloader')
+def bench_dataloader():
+    print_header("DataLoader: arka planda batch hazirlama (prefetch) vs ayni thread")
+
+    # prefetch batch'leri ve sirayi degistirmez; erken cikis thread birakmaz;
+    # uretici hatasi ana thread'de firlatilir
+    x, labels = synthetic_fashion(1000)
+    x = np.ascontiguousarray(x.T).T
+    batches = {}
+    for prefetch in (0, 1, 3):
+        loader = DataLoader(x, labels, batch_size=96, seed=0, prefetch=prefetch)
+        batches[prefetch] = [(xb.copy(), yb.copy()) for _ in range(2) for xb, yb in loader]
+    for prefetch in (1, 3):
+        assert all(np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1])
+                   for a, b in zip(batches[0], batches[prefetch]))
+    assert sum(len(yb) for _, yb in batches[0]) == 2000
+    threads = threading.active_count()
+    for i, _ in enumerate(DataLoader(x, labels, batch_size=10, prefetch=2)):
+        if i == 3:
+            break
+    assert threading.active_count() == threads
+    def failing(x_batch):
+        raise RuntimeError("transform hatasi")
+    try:
+        list(DataLoader(x, labels, batch_size=10, transform=failing))
+        raise AssertionError("hata iletilmedi")
+    except RuntimeError:
+        pass
+    print("Denetim tamam: ayni batch'ler, erken cikis, hata iletimi\n")
+
+    m = 30000
+    x, labels = synthetic_fashion(m)
+    x = np.ascontiguousarray(x.T).T
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    print(f"MLP 784-128-10, {m} ornek, CPU cekirdegi: {cores}")
+    print(f"{'batch hazirligi':>15} | {'batch':>5} | {'prefetch':>8} | {'fit ornek/sn':>12} | {'yukleyici':>10}")
+    print("-" * 64)
+    for name, transform in (('toplama', None), ('+ artirma', 'augment')):
+        for batch_size in (64, 256):
+            for prefetch in (0, 2):
+                loader = DataLoader(x, labels, batch_size=batch_size, seed=0, prefetch=prefetch,
+                                    transform=noise_augment() if transform else None)
+                fit_rate, load_rate = loader_throughput(loader)
+                print(f"{name:>15} | {batch_size:>5} | {prefetch:>8} | {fit_rate:>12.0f} | {load_rate:>10.0f}")
+    if cores == 1:
+        print("\nTek cekirdekte thread'ler sirayla calisir: prefetch ancak birden fazla cekirdekte")
+        print("batch hazirligini forward/backward ile ortusturur.")
+
+
+# ============== FASHION-MNIST CACHE ==============
+def write_fashion_csv(path, m, seed=0):
+    """Fashion-MNIST bicminde (baslik + label, 784 piksel) rastgele CSV yaz."""
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 256, (m, 785))
+    data[:, 0] %= 10
+    header = 'label,' + ','.join(f'pixel{i}' for i in range(1, 785))
+    np.savetxt(path, data, fmt='%d', delimiter=',', header=header, comments='')
+    return data
+
+
+@benchmark('dataset')
+def bench_dataset():
+    print_header("Fashion-MNIST: CSV ayristirma vs uint8 memory-map cache")
+
+    m = 10000
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'fashion-mnist_train.csv')
+        data = write_fashion_csv(csv_path, m)
+
+        # Ilk yukleme cache'i olusturur; degerler CSV ile ayni, dtype uint8
+        start = time.perf_counter()
+        images, labels = load_fashion_mnist(csv_path)
+        build_time = time.perf_counter() - start
+        assert images.dtype == labels.dtype == np.uint8
+        assert np.array_equal(images, data[:, 1:]) and np.array_equal(labels, data[:, 0])
+        assert isinstance(images, np.memmap) and not images.flags.writeable
+
+        # CSV degisirse (mtime/boyut) cache yeniden olusturulur
+        meta_path = cache_paths(csv_path)[2]
+        with open(meta_path) as f:
+            meta_before = f.read()
+        data = write_fashion_csv(csv_path, m, seed=1)
+        stat = os.stat(csv_path)
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        images, labels = load_fashion_mnist(csv_path)
+        assert np.array_equal(images, data[:, 1:])
+        with open(meta_path) as f:
+            assert f.read() != meta_before
+        print("Denetim tamam: degerler ayni, CSV degisince cache yenileniyor\n")
+
+        parse_time = measure(lambda: read_csv_uint8(csv_path), repeat=1)
+        load_time = measure(lambda: load_fashion_mnist(csv_path), repeat=5)
+        touch_time = measure(lambda: np.asarray(load_fashion_mnist(csv_path)[0]).sum(), repeat=5)
+        csv_mb = os.path.getsize(csv_path) / 2**20
+        npy_mb = sum(os.path.getsize(path) for path in cache_paths(csv_path)[:2]) / 2**20
+        int64_mb = data.nbytes / 2**20
+
+    print(f"{m} ornek (60000 icin x6):")
+    print(f"  CSV ayristirma:           {parse_time*1000:>8.1f}ms  (CSV {csv_mb:.1f} MB)")
+    print(f"  ilk yukleme + cache:      {build_time*1000:>8.1f}ms")
+    print(f"  cache'ten memory-map:     {load_time*1000:>8.2f}ms  (.npy {npy_mb:.1f} MB, int64 dizi {int64_mb:.1f} MB)")
+    print(f"  memory-map + tum piksel:  {touch_time*1000:>8.1f}ms")
+
+
+# ============== GRADYAN BIRIKTIRME ==============
+def accumulated_step(model, loss_fn, optimizer, x, labels, micro_batch):
+    """Etkin batch x'i micro_batch'lik parcalarla biriktirip tek optimizer adimi at."""
+    with model.accumulate_grads():
+        for start in range(0, x.shape[0], micro_batch):
+            stop = start + micro_batch
+            loss_fn.forward(model.forward(x[start:stop]), labels[start:stop])
+            model.backward(loss_fn.backward())
+    optimizer.step()
+
+
+def accumulation_memory(micro_batch, x, labels, steps=3):
+    """CNN egitiminde tepe bellek (tracemalloc, model dahil) ve adim suresi."""
+    tracemalloc.start()
+    model = Sequential(fashion_cnn('NCHW').layers[:-1])   # Softmax -> fused loss
+    loss_fn, optimizer = SoftmaxCrossEntropy(), SGD(model, lr=0.01)
+    accumulated_step(model, loss_fn, optimizer, x, labels, micro_batch)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    step_time = measure(lambda: accumulated_step(model, loss_fn, optimizer, x, labels, micro_batch),
+                        repeat=steps)
+    return peak, step_time
+
+
+@benchmark('accumulation')
+def bench_accumulation():
+    print_header("Gradyan biriktirme: micro-batch boyutuna gore tepe bellek")
+
+    # Biriken gradyan, micro-batch'lerin birlesimiyle tek backward'in gradyani olmali
+    # (farkli boyutlu son parca dahil: 1/m olcegi toplam ornek sayisina gore)
+    rng = np.random.default_rng(0)
+    x = rng.random((100, 1, 28, 28), dtype=np.float32)
+    labels = rng.integers(0, 10, 100).astype(np.uint8)
+    for algorithm in ('im2col', 'fft'):
+        full, accumulated = (Sequential(fashion_cnn('NCHW', algorithm=algorithm).layers[:-1])
+                             for _ in range(2))
+        accumulated.arena()   # seed'siz katmanlar: agirliklar arena ile esitlenir
+        full.arena()
+        np.copyto(accumulated.param_arena, full.param_arena)
+        loss_fn = SoftmaxCrossEntropy()
+        loss_fn.forward(full.forward(x), labels)
+        full.backward(loss_fn.backward())
+        with accumulated.accumulate_grads():
+            for start, stop in ((0, 32), (32, 64), (64, 96), (96, 100)):
+                loss_fn.forward(accumulated.forward(x[start:stop]), labels[start:stop])
+                accumulated.backward(loss_fn.backward())
+        assert np.allclose(accumulated.grad_arena, full.grad_arena, rtol=1e-4, atol=1e-6), algorithm
+        assert not any(layer.accumulate_grads for layer in accumulated.layers)
+    print("Dogruluk kontrolu tamam: biriken gradyan = tam batch gradyani\n")
+
+    effective = 512
+    x = rng.random((effective, 1, 28, 28), dtype=np.float32)
+    labels = rng.integers(0, 10, effective).astype(np.uint8)
+    print(f"Fashion CNN, etkin batch {effective}, tek SGD adimi")
+    print(f"{'micro-batch':>11} | {'adim':>5} | {'tepe bellek':>11} | {'adim suresi':>11}")
+    print("-" * 50)
+    for micro_batch in (512, 256, 128, 64, 32):
+        peak, step_time = run_isolated(accumulation_memory, micro_batch, x, labels)
+        print(f"{micro_batch:>11} | {effective // micro_batch:>5} | {peak / 2**20:>8.1f} MB | "
+              f"{step_time*1000:>8.1f}ms")
+
+
+# ============== UINT8 VERI + BATCH BASINA NORMALIZASYON ==============
+def uint8_fashion(m, seed=0):
+    """synthetic_fashion'in 0-255'e nicemlenmis hali: (m, 784) uint8 (load_fashion_mnist gibi ardisik), (m,) uint8."""
+    x, labels = synthetic_fashion(m, seed=seed)
+    return np.ascontiguousarray(np.round(x.T * 255), dtype=np.uint8), labels
+
+
+@benchmark('normalize')
+def bench_normalize():
+    print_header("uint8 veri + batch basina normalizasyon vs onceden normalize edilmis float")
+
+    # Birlesik scale/offset, (x/255 - mean) / std ile ayni batch'leri vermeli;
+    # karistirmali/karistirmasiz ve prefetch'li yollar ayni sonucu vermeli
+    images, labels = uint8_fashion(1000)
+    mean, std = images.mean() / 255, images.std() / 255
+    reference = ((images / 255 - mean) / std).astype(np.float32)
+    for shuffle, prefetch in ((False, 0), (True, 0), (True, 2)):
+        loader = DataLoader(images.T, labels, batch_size=96, shuffle=shuffle, seed=0, prefetch=prefetch,
+                            dtype=np.float32, scale=1 / (255 * std), offset=-mean / std)
+        expected = DataLoader(reference.T, labels, batch_size=96, shuffle=shuffle, seed=0, prefetch=0)
+        for (xb, yb), (xr, yr) in zip(loader, expected):
+            assert xb.dtype == np.float32 and xb.shape == xr.shape
+            assert np.allclose(xb, xr, rtol=1e-5, atol=1e-5) and np.array_equal(yb, yr)
+    try:
+        DataLoader(images, labels, scale=1 / 255)
+        raise AssertionError("dtype'siz scale kabul edildi")
+    except ValueError:
+        pass
+    assert images.nbytes * 4 == reference.nbytes
+    print("Denetim tamam: birlesik scale/offset = (x/255 - mean)/std\n")
+
+    m = 30000
+    images, labels = uint8_fashion(m)
+    dtype = get_default_dtype()
+    print(f"MLP 784-128-10, {m} ornek, katman dtype'i: {np.dtype(dtype).name}")
+    print(f"{'veri':>22} | {'bellekte':>9} | {'fit ornek/sn':>12} | {'yukleyici':>10}")
+    print("-" * 64)
+    normalized = np.ascontiguousarray(images, dtype=dtype)
+    normalized /= np.dtype(dtype).type(255)
+    cases = (
+        ('float (onceden)', normalized.T, {}),
+        ('uint8 + batch basina', images.T, dict(dtype=dtype, scale=1 / 255.0)),
+    )
+    for name, x, normalize in cases:
+        loader = DataLoader(x, labels, batch_size=128, seed=0, prefetch=0, **normalize)
+        fit_rate, load_rate = loader_throughput(loader)
+        print(f"{name:>22} | {x.nbytes / 2**20:>6.1f} MB | {fit_rate:>12.0f} | {load_rate:>10.0f}")
+    print(f"\n60000 ornekte: uint8 {60000 * 784 / 2**20:.0f} MB, float64 {60000 * 784 * 8 / 2**20:.0f} MB")
+
+
+# ============== MAIN ==============
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise SystemExit(f"Bilinmeyen benchmark: {name}. Secenekler: {', '.join(BENCHMARKS)}")
+        BENCHMARKS[name]()
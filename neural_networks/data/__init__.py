@@ -0,0 +1,2 @@
+from .loader import DataLoader
+from .fashion_mnist import load_fashion_mnist
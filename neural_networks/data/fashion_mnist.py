@@ -0,0 +1,151 @@
+"""
+Fashion-MNIST Binary Cache
+==========================
+Fashion-MNIST CSV'lerini bir kez ikili (binary) .npy dosyalarina cevirir;
+sonraki calistirmalar bu dosyalari np.load(mmap_mode='r') ile acar.
+
+Neden?
+    60000x785'lik train CSV'sini her calistirmada metin olarak ayristirmak
+    saniyeler surer ve int64 dizi (~376 MB) uretir. Pikseller ve etiketler
+    0-255 arasinda oldugu icin uint8 yeterlidir:
+
+        images: (m, 784) uint8   60000 ornek icin ~47 MB
+        labels: (m,) uint8
+
+    Memory-map ile acmak milisaniyeler surer: veri okunmaz, sayfalar
+    kullanildikca diskten (veya isletim sistemi sayfa onbelleginden) gelir.
+    Ayni dosyayi acan process'ler ayni fiziksel sayfalari paylasir.
+
+Gecersiz kilma:
+    Cache, kaynak CSV'nin boyutu ve degisme zamani (mtime) ile birlikte
+    kaydedilir. CSV degisirse bir sonraki yuklemede cache yeniden uretilir.
+    Dosyalar once gecici isimle yazilip os.replace ile yerine konur; yarim
+    kalan bir donusum gecerli cache gibi gorunmez.
+
+Kullanim:
+    from data import load_fashion_mnist
+
+    X_train, y_train = load_fashion_mnist("fashion-mnist_train.csv")
+    X_train.shape, X_train.dtype     # (60000, 784) uint8 (salt okunur memmap)
+
+Dosyalar (cache_dir verilmezse CSV'nin yaninda):
+    fashion-mnist_train.images.npy
+    fashion-mnist_train.labels.npy
+    fashion-mnist_train.cache.json   # kaynak boyutu/mtime'i (en son yazilir)
+"""
+
+import os
+import json
+import numpy as np
+
+
+CACHE_VERSION = 1
+
+
+def cache_paths(csv_path, cache_dir=None):
+    """
+    csv_path'in cache dosya yollari.
+
+    Returns:
+        (images_path, labels_path, meta_path)
+    """
+    directory = cache_dir or os.path.dirname(os.path.abspath(csv_path))
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    base = os.path.join(directory, stem)
+    return base + '.images.npy', base + '.labels.npy', base + '.cache.json'
+
+
+def _source_info(csv_path):
+    stat = os.stat(csv_path)
+    return {'version': CACHE_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _cache_valid(csv_path, cache_dir=None):
+    """Cache dosyalari var ve kaynak CSV ile uyumlu mu?"""
+    images_path, labels_path, meta_path = cache_paths(csv_path, cache_dir)
+    if not all(os.path.exists(path) for path in (images_path, labels_path, meta_path)):
+        return False
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return meta == _source_info(csv_path)
+
+
+def read_csv_uint8(csv_path):
+    """
+    Fashion-MNIST CSV'sini (baslik satiri + label, pixel1..pixel784) oku.
+
+    pandas varsa hizli C ayristiricisi kullanilir, yoksa np.loadtxt.
+
+    Returns:
+        images: (m, 784) uint8
+        labels: (m,) uint8
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        data = pd.read_csv(csv_path, dtype=np.uint8).values
+    else:
+        data = np.loadtxt(csv_path, delimiter=',', skiprows=1, dtype=np.uint8)
+    data = np.atleast_2d(data)
+    if data.shape[1] != 785:
+        raise ValueError(f"Fashion-MNIST CSV'si 785 sutun olmali (label + 784 piksel): {data.shape[1]}")
+    return np.ascontiguousarray(data[:, 1:]), np.ascontiguousarray(data[:, 0])
+
+
+def build_cache(csv_path, cache_dir=None):
+    """
+    CSV'yi uint8 .npy dosyalarina cevir (mevcut cache'in uzerine yazar).
+
+    Returns:
+        (images_path, labels_path)
+    """
+    images_path, labels_path, meta_path = cache_paths(csv_path, cache_dir)
+    os.makedirs(os.path.dirname(images_path), exist_ok=True)
+
+    # Donusum sirasinda CSV degisirse cache eski kaynakla eslesmesin
+    info = _source_info(csv_path)
+    images, labels = read_csv_uint8(csv_path)
+
+    # Gecici dosyaya yaz, sonra atomik olarak yerine koy; meta en son
+    for path, array in ((images_path, images), (labels_path, labels)):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(info, f)
+    os.replace(tmp_path, meta_path)
+    return images_path, labels_path
+
+
+def load_fashion_mnist(csv_path, cache_dir=None, mmap=True):
+    """
+    Fashion-MNIST CSV'sini uint8 olarak yukle (gerekirse cache'i olustur).
+
+    Args:
+        csv_path: Kaynak CSV dosyasi
+        cache_dir: (Opsiyonel) Cache dizini. None ise CSV'nin dizini.
+        mmap: True ise diziler salt okunur memory-map olarak acilir;
+            False ise bellege okunur (yazilabilir kopya).
+
+    Returns:
+        images: (m, 784) uint8
+        labels: (m,) uint8
+    """
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV bulunamadi: {csv_path}")
+
+    if not _cache_valid(csv_path, cache_dir):
+        build_cache(csv_path, cache_dir)
+
+    images_path, labels_path, _ = cache_paths(csv_path, cache_dir)
+    mmap_mode = 'r' if mmap else None
+    return np.load(images_path, mmap_mode=mmap_mode), np.load(labels_path, mmap_mode=mmap_mode)
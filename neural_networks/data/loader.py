@@ -0,0 +1,266 @@
+"""
+DataLoader
+==========
+Batch hazirligini (karistirma, toplama, donusum) egitimden ayri bir
+thread'de yapan veri yukleyici.
+
+Neden thread?
+    Batch toplama (np.take) ve egitimdeki matris carpimlari NumPy icinde
+    GIL'i birakir. Arka plan thread'i sonraki batch'leri hazirlarken ana
+    thread forward/backward yapar; batch hazirligi egitim suresine eklenmez.
+
+Buffer halkasi:
+    Batch'ler prefetch + 1 adet onceden ayrilmis buffer'a (slot) yazilir:
+    prefetch slot kuyrukta hazir bekler, biri ana thread'de kullanilir.
+    Ana thread bir sonraki batch'i istediginde onceki slot serbest kalir ve
+    uretici ona yazar. Kuyruk sinirli oldugu icin bellek sabittir ve hicbir
+    batch icin yeni dizi ayrilmaz.
+
+    UYARI: Donen batch bir slot'un view'udur; bir sonraki batch istendiginde
+    uzerine yazilabilir. Saklanacaksa kopyalanmali (.copy()).
+
+Kullanim:
+    loader = DataLoader(X_train, y_train, batch_size=128, shuffle=True)
+
+    for epoch in range(num_epochs):
+        for x_batch, y_batch in loader:     # her epoch yeniden karistirilir
+            ...
+
+    history = model.fit(loader, epochs=20, ...)   # bkz. Sequential.fit
+
+uint8 veri ve batch basina normalizasyon:
+    Pikseller uint8 olarak kalir (60000x784: 47 MB; float64 kopyasi 376 MB).
+    dtype verilirse her batch toplandiktan sonra, yeniden kullanilan bir
+    buffer'a tek bir afin donusumle yazilir:
+
+        x_batch = x_uint8 * scale + offset        (dtype'ta)
+
+    0-1 olcekleme:   scale=1/255
+    mean-std:        scale=1/(255*std), offset=-mean/std
+                     ((x/255 - mean) / std ile ayni; uc ayri islem ve ara
+                     dizi yerine ayni buffer'da bir carpma ve bir toplama)
+
+    loader = DataLoader(X_uint8.T, y, batch_size=128, dtype=np.float32, scale=1/255)
+
+Ornek ekseni Sequential.fit ile ayni: 2D dizi (n_features, m) icin eksen 1,
+diger diziler (orn: (m, C, H, W) veya (m,) etiketler) icin eksen 0.
+"""
+
+import queue
+import threading
+import numpy as np
+
+
+class DataLoader:
+    """
+    Arka planda batch hazirlayan veri yukleyici.
+
+    Args:
+        x: Girdi verisi
+        y: Etiketler (m,) veya one-hot (n_classes, m)
+        batch_size: Batch boyutu
+        shuffle: Her epoch basinda ornek sirasini karistir
+        seed: Karistirma icin seed (tekrarlanabilirlik)
+        prefetch: Onceden hazirlanacak batch sayisi. 0 ise batch'ler ana
+            thread'de, istendiginde hazirlanir.
+        transform: (Opsiyonel) x batch'ine uretici thread'de uygulanan
+            fonksiyon (orn: veri artirma). Batch'i yerinde degistirip veya
+            ayni sekilde yeni bir dizi dondurur. dtype donusumunden sonra
+            uygulanir.
+        drop_last: Eksik son batch'i atla
+        dtype: (Opsiyonel) x batch'lerinin dtype'i (orn: np.float32). None
+            ise kaynak dtype'i korunur ve scale/offset kullanilamaz.
+        scale: x batch'inin carpildigi sabit (default=1)
+        offset: Carpimdan sonra eklenen sabit (default=0)
+
+    Ornek:
+        loader = DataLoader(X_train, y_train, batch_size=128, prefetch=2)
+        for x_batch, y_batch in loader:
+            ...
+    """
+
+    def __init__(self, x, y, batch_size=32, shuffle=True, seed=None, prefetch=2,
+                 transform=None, drop_last=False, dtype=None, scale=None, offset=None):
+        self.x_axis = 1 if x.ndim == 2 else 0
+        self.y_axis = 1 if y.ndim == 2 else 0
+        m = x.shape[self.x_axis]
+        if y.shape[self.y_axis] != m:
+            raise ValueError(f"x ve y ornek sayisi farkli: {m} != {y.shape[self.y_axis]}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size en az 1 olmali: {batch_size}")
+        if prefetch < 0:
+            raise ValueError(f"prefetch negatif olamaz: {prefetch}")
+
+        self.x = x
+        self.y = y
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.transform = transform
+        self.drop_last = drop_last
+
+        if dtype is None and (scale is not None or offset is not None):
+            raise ValueError("scale/offset icin dtype gerekli (orn: np.float32)")
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        if self.dtype is not None and self.dtype.kind != 'f':
+            raise ValueError(f"dtype ondalikli olmali: {self.dtype}")
+        # Sabitler hedef dtype'ta: uint8 * float32 carpimi float32 dongusunde kalir
+        self.scale = None if scale is None else self.dtype.type(scale)
+        self.offset = None if offset is None else self.dtype.type(offset)
+
+        self.rng = np.random.default_rng(seed)
+        self.order = np.arange(m)
+
+        # Slot basina {(isim, batch boyutu): buffer}; ilk kullanimda ayrilir
+        self._slots = [{} for _ in range(prefetch + 1)]
+
+    @property
+    def num_samples(self):
+        """Bir epoch'ta kullanilan ornek sayisi."""
+        m = self.x.shape[self.x_axis]
+        return m - m % self.batch_size if self.drop_last else m
+
+    def __len__(self):
+        """Epoch basina batch sayisi."""
+        m = self.x.shape[self.x_axis]
+        if self.drop_last:
+            return m // self.batch_size
+        return -(-m // self.batch_size)
+
+    def __iter__(self):
+        """Bir epoch'luk (x_batch, y_batch) ciftleri."""
+        if self.shuffle:
+            self.rng.shuffle(self.order)
+        if self.prefetch == 0:
+            return self._iter_sync()
+        return self._iter_prefetch()
+
+    # ==========================================================================
+    # BATCH HAZIRLAMA
+    # ==========================================================================
+
+    def _ranges(self):
+        """Epoch'un batch sinirlari (start, stop)."""
+        m = self.num_samples
+        for start in range(0, m, self.batch_size):
+            yield start, min(start + self.batch_size, m)
+
+    def _gather(self, slot, a, axis, start, stop, name):
+        """a'nin [start, stop) batch'ini slot'un buffer'ina topla (shuffle=False: view)."""
+        if not self.shuffle:
+            return a[:, start:stop] if axis == 1 else a[start:stop]
+
+        # (n, m) dizi (m, n) verinin transpozu ise (orn: X_train.T) ornekler
+        # bellekte ardisik satirlardir; satirlar toplanir (bkz. Sequential.fit)
+        rows = axis == 1 and a.flags.f_contiguous and not a.flags.c_contiguous
+        if rows:
+            a, axis = a.T, 0
+        shape = list(a.shape)
+        shape[axis] = stop - start
+        key = (name, stop - start)
+        buf = slot.get(key)
+        if buf is None:
+            buf = slot[key] = np.empty(shape, dtype=a.dtype)
+        np.take(a, self.order[start:stop], axis=axis, out=buf)
+        return buf.T if rows else buf
+
+    def _convert(self, slot, x_batch):
+        """x_batch'i dtype'a cevir ve olcekle: out = x * scale + offset (slot buffer'inda)."""
+        key = ('x_converted', x_batch.shape, x_batch.strides)
+        out = slot.get(key)
+        if out is None:
+            # empty_like duzeni korur: toplanan (b, n).T view'u icin de ardisik okuma/yazma
+            out = slot[key] = np.empty_like(x_batch, dtype=self.dtype)
+        if self.scale is None:
+            np.copyto(out, x_batch)
+        else:
+            np.multiply(x_batch, self.scale, out=out)
+        if self.offset is not None:
+            out += self.offset
+        return out
+
+    def _make_batch(self, slot, start, stop):
+        x_batch = self._gather(slot, self.x, self.x_axis, start, stop, 'x')
+        y_batch = self._gather(slot, self.y, self.y_axis, start, stop, 'y')
+        if self.dtype is not None:
+            x_batch = self._convert(slot, x_batch)
+        if self.transform is not None:
+            x_batch = self.transform(x_batch)
+        return x_batch, y_batch
+
+    def _iter_sync(self):
+        slot = self._slots[0]
+        for start, stop in self._ranges():
+            yield self._make_batch(slot, start, stop)
+
+    # ==========================================================================
+    # ARKA PLAN THREAD'I
+    # ==========================================================================
+    #
+    #   free:  bos slot indeksleri      uretici alir -> doldurur -> ready'ye koyar
+    #   ready: (slot, batch) / hata / bitti isareti (en fazla prefetch eleman)
+    #
+    # Ana thread yeni batch istediginde bir onceki slot'u free'ye geri verir.
+    # Ana thread donguyu erken birakirsa (break) stop isaretlenir; uretici
+    # bekledigi kuyruktan zaman asimiyla cikip sonlanir.
+    # ==========================================================================
+
+    _DONE = object()
+
+    def _iter_prefetch(self):
+        free = queue.Queue()
+        for index in range(len(self._slots)):
+            free.put(index)
+        ready = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for start, end in self._ranges():
+                    index = None
+                    while index is None and not stop.is_set():
+                        try:
+                            index = free.get(timeout=0.1)
+                        except queue.Empty:
+                            pass
+                    if index is None:
+                        return
+                    batch = self._make_batch(self._slots[index], start, end)
+                    if not put((index, batch)):
+                        return
+                put(self._DONE)
+            except BaseException as error:     # ana thread'de yeniden firlatilir
+                put(error)
+
+        worker = threading.Thread(target=produce, name='DataLoader', daemon=True)
+        worker.start()
+
+        held = None
+        try:
+            while True:
+                item = ready.get()
+                if held is not None:
+                    free.put(held)
+                    held = None
+                if item is self._DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                held, batch = item
+                yield batch
+        finally:
+            stop.set()
+            worker.join()
+
+    def __repr__(self):
+        return (f"DataLoader(num_samples={self.num_samples}, batch_size={self.batch_size}, "
+                f"shuffle={self.shuffle}, prefetch={self.prefetch})")
@@ -1,4 +1,4 @@
-from .base import Layer
+from .base import Layer, set_default_dtype, get_default_dtype
 from .dense import Dense
 from .activations import ReLU, Softmax
-from .conv import Conv2D, MaxPool2D, Flatten
+from .conv import Conv2D, DepthwiseConv2D, PointwiseConv2D, MaxPool2D, Flatten
@@ -19,12 +19,30 @@ class ReLU(Layer):
         Forward:  a = max(0, z)
         Backward: dz = dout * (z > 0)
 
+    Backward icin z yerine sadece (z > 0) maskesi saklanir: bool maske eleman
+    basina 1 byte (float32 z'nin 1/4'u, float64'un 1/8'i), packed=True ile
+    np.packbits'le 1 bit (1/32, 1/64).
+
+    Args:
+        inplace: True ise forward girdiyi (z), backward gelen gradyani (dout)
+            yerinde degistirir; iki tam boyutlu gecici dizi ayrilmaz.
+            Girdi baska bir yerde kullanilacaksa (orn: kullanicinin kendi
+            dizisi) inplace kullanilmamali.
+        packed: True ise maske bit bit paketlenir (backward'da acilir)
+
     Ornek:
         layer = ReLU()
         a = layer.forward(z)       # z: (n, m)
         dz = layer.backward(dout)  # dout: (n, m)
+
+        layer = ReLU(inplace=True, packed=True)   # en az bellek
     """
 
+    def __init__(self, inplace=False, packed=False):
+        super().__init__()
+        self.inplace = inplace
+        self.packed = packed
+
     def forward(self, z):
         """
         Ileri yayilim: a = max(0, z)
@@ -33,10 +51,19 @@ class ReLU(Layer):
             z: Girdi (herhangi bir boyut)
 
         Returns:
-            a: Cikti (ayni boyut)
+            a: Cikti (ayni boyut; inplace=True ise z'nin kendisi)
         """
-        self.cache['z'] = z
-        return np.maximum(0, z)
+        if self.training:
+            mask = z > 0
+            if self.packed:
+                self.cache['mask'] = np.packbits(mask)
+                self.cache['shape'] = z.shape
+            else:
+                self.cache['mask'] = mask
+
+        if self.inplace and z.flags.writeable:
+            return np.maximum(z, 0, out=z)
+        return np.maximum(z, 0)
 
     def backward(self, dout):
         """
@@ -46,14 +73,21 @@ class ReLU(Layer):
             dout: Sonraki katmandan gelen gradyan
 
         Returns:
-            dz: Onceki katmana iletilecek gradyan
+            dz: Onceki katmana iletilecek gradyan (inplace=True ise dout'un kendisi)
         """
-        z = self.cache['z']
-        dz = dout * (z > 0).astype(float)
-        return dz
+        mask = self.cache['mask']
+        if self.packed:
+            shape = self.cache['shape']
+            mask = np.unpackbits(mask, count=np.prod(shape)).reshape(shape).view(bool)
+
+        # bool maske dout'un dtype'ini korur (float64'e yukseltmez)
+        if self.inplace and dout.flags.writeable:
+            return np.multiply(dout, mask, out=dout)
+        return dout * mask
 
     def __repr__(self):
-        return "ReLU()"
+        options = [f"{name}=True" for name in ('inplace', 'packed') if getattr(self, name)]
+        return f"ReLU({', '.join(options)})"
 
 
 class Softmax(Layer):
@@ -73,6 +107,9 @@ class Softmax(Layer):
         probs = layer.forward(z)  # z: (n_classes, m)
     """
 
+    # Sequential.predict(output='logits'/'labels') son Softmax'i atlar
+    is_softmax = True
+
     def forward(self, z):
         """
         Ileri yayilim: softmax(z)
@@ -90,7 +127,8 @@ class Softmax(Layer):
         exp_z = np.exp(z_shifted)
         a = exp_z / np.sum(exp_z, axis=0, keepdims=True)
 
-        self.cache['a'] = a
+        if self.training:
+            self.cache['a'] = a
         return a
 
     def backward(self, dout):
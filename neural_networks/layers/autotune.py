@@ -0,0 +1,131 @@
+"""
+Algoritma Autotuner
+===================
+Ayni islemi yapan birden fazla algoritma (orn: Conv2D icin im2col, Winograd,
+FFT) arasindan, verilen girdi boyutu icin en hizlisini olcerek secer.
+
+En hizli algoritma batch boyutuna, kanal sayisina, kernel boyutuna, stride'a
+ve CPU'ya gore degisir. Bu yuzden ilk cagrida adaylar kisaca calistirilir ve
+kazanan saklanir:
+
+    1. Bellek cache'i: process boyunca gecerli
+    2. Disk cache'i (opsiyonel): JSON dosyasi, CPU ve boyutla anahtarlanir.
+       Sonraki calistirmalar olcum yapmadan kazanani okur.
+
+Disk cache'ini acmak icin:
+    from layers import autotune
+    autotune.set_cache_file("autotune.json")
+
+veya NN_AUTOTUNE_CACHE ortam degiskeni ile dosya yolu verilir.
+"""
+
+import os
+import json
+import time
+import platform
+from functools import lru_cache
+
+
+_memory_cache = {}
+_cache_file = os.environ.get('NN_AUTOTUNE_CACHE')
+
+
+def set_cache_file(path):
+    """Disk cache dosyasini ayarla (None: disk cache'i kapat)."""
+    global _cache_file
+    _cache_file = path
+
+
+def clear_cache():
+    """Bellek cache'ini temizle (disk dosyasina dokunmaz)."""
+    _memory_cache.clear()
+
+
+@lru_cache(maxsize=None)
+def cpu_signature():
+    """Olcumlerin ait oldugu CPU'yu tanimlayan metin."""
+    model = platform.processor()
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    model = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return f"{platform.machine()}/{model}/{os.cpu_count()}"
+
+
+def make_key(op, **fields):
+    """Islem adi, CPU ve boyut bilgisinden cache anahtari olustur."""
+    parts = [op, cpu_signature()] + [f"{k}={v}" for k, v in fields.items()]
+    return "|".join(parts)
+
+
+def _load_disk_cache():
+    if not _cache_file or not os.path.exists(_cache_file):
+        return {}
+    try:
+        with open(_cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_disk_cache(key, entry):
+    if not _cache_file:
+        return
+    data = _load_disk_cache()
+    data[key] = entry
+
+    # Yarim yazilmis dosya kalmasin diye once gecici dosyaya yaz
+    tmp_path = f"{_cache_file}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, _cache_file)
+
+
+def measure(fn, repeat=3):
+    """fn'i bir kez isindir, sonra repeat olcumun en iyisini dondur."""
+    fn()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def tune(key, candidates, repeat=3):
+    """
+    En hizli adayi dondur.
+
+    Args:
+        key: make_key ile olusturulan anahtar
+        candidates: {algoritma adi: parametresiz calistirilabilir fonksiyon}
+            Fonksiyonlar sadece cache'te sonuc yoksa cagrilir.
+        repeat: Aday basina olcum sayisi
+
+    Returns:
+        name: Kazanan algoritmanin adi
+    """
+    name = _memory_cache.get(key)
+    if name in candidates:
+        return name
+
+    entry = _load_disk_cache().get(key)
+    if entry is not None and entry.get('algorithm') in candidates:
+        _memory_cache[key] = entry['algorithm']
+        return entry['algorithm']
+
+    times = {}
+    for candidate, fn in candidates.items():
+        try:
+            times[candidate] = measure(fn, repeat)
+        except MemoryError:
+            times[candidate] = float('inf')
+
+    name = min(times, key=times.get)
+    _memory_cache[key] = name
+    _save_disk_cache(key, {'algorithm': name, 'times': times})
+    return name
@@ -8,9 +8,71 @@ Her katman su arayuzu uygulamalidir:
 - backward(dout): Geri yayilim (gradyan hesabi)
 - get_params(): Parametreleri dondur (W, b)
 - get_grads(): Gradyanlari dondur (dW, db)
+
+Dtype politikasi:
+    Parametreler get_default_dtype() ile olusturulur (varsayilan float32).
+    Parametreli katmanlar girdiyi ve gelen gradyani kendi parametre
+    dtype'ina cevirir; parametresiz katmanlar gelen dtype'i korur. Boylece
+    float32 bir modelde hicbir ara dizi sessizce float64'e yukselmez.
+
+    Gradyan kontrolu gibi hassas isler icin:
+        from layers import set_default_dtype
+        set_default_dtype(np.float64)   # katmanlari olusturmadan once
+
+Karisik hassasiyet (mixed precision):
+    cache_dtype verilirse katmanlar backward icin sakladiklari aktivasyonlari
+    (Dense girdisi, Conv2D x_col) bu dtype'ta tutar. ReLU zaten sadece bool
+    maske sakladigi icin cache_dtype'tan etkilenmez. Matris
+    carpimlari yine parametre dtype'inda yapilir: Conv2D forward'da float32
+    x_col ile carpar, cache'e float16 kopyasini koyar; backward'da kopya ayni
+    float32 buffer'a geri yazilir (np.matmul'a float16 verilirse her cagrida
+    tam boy float32 gecici dizi ayrilir).
+
+    Olculen sinirlar (benchmark.py mixed_precision, CNN, batch=256):
+    cache 1.57x kuculur (bool maskeler ve MaxPool indeksleri ayni kalir),
+    cache + workspace ~1.1x, tepe RSS neredeyse degismez (katman ciktilari
+    ve workspace'ler baskin). float16 donusumleri adimi ~%10-25 uzatir.
+    Kazanc, aktivasyonlarin bellegin cogunu tuttugu buyuk batch'lerdedir.
+
+Egitim / cikarim modu:
+    layer.training False ise (layer.eval() veya Sequential.no_grad()) forward
+    backward icin hicbir sey saklamaz. Degerlendirmede cache doldurulmaz,
+    bellek sadece katman ciktilari kadar kullanilir. Mod degisimi sadece
+    cache'i birakir; workspace buffer'lari (Conv2D, Dense) egitime donuste
+    yeniden kullanilir ve clear_workspace() ile acikca birakilir.
+
+Gradyan biriktirme (gradient accumulation):
+    layer.accumulate_grads True ise backward dW/db'nin uzerine yazmaz; bu
+    batch'in ortalamasini biriken ortalamaya katar. grad_samples, dW/db'nin
+    kac ornegin ortalamasi oldugunu tutar; zero_grad() sifirlar. Buyuk bir
+    batch, aktivasyonlari ayni anda tutulmadan micro-batch'lerle islenir
+    (bkz. Sequential.accumulate_grads).
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
+
+
+_default_dtype = np.dtype(np.float32)
+
+
+def set_default_dtype(dtype):
+    """
+    Yeni olusturulan katmanlarin parametre dtype'ini ayarla.
+
+    Args:
+        dtype: np.float32 veya np.float64
+    """
+    global _default_dtype
+    dtype = np.dtype(dtype)
+    if dtype.kind != 'f':
+        raise ValueError(f"Varsayilan dtype ondalikli olmali: {dtype}")
+    _default_dtype = dtype
+
+
+def get_default_dtype():
+    """Yeni katmanlarin parametre dtype'i."""
+    return _default_dtype
 
 
 class Layer(ABC):
@@ -25,8 +87,23 @@ class Layer(ABC):
                 ...
     """
 
+    # Backward icin saklanan aktivasyonlarin dtype'i (None: hesap dtype'i)
+    cache_dtype = None
+
+    # False ise forward cache doldurmaz (cikarim modu)
+    training = True
+
+    # True ise backward gradyanlari biriktirir; grad_samples: dW/db'deki ornek sayisi
+    accumulate_grads = False
+    grad_samples = 0
+
+    # True ise ara buffer'lar girdi boyutu basina saklanir (bkz. WORKSPACE)
+    use_workspace = False
+    MAX_WORKSPACES = 4  # egitim: tam + son eksik batch; degerlendirme: tam + son eksik parca
+
     def __init__(self):
         self.cache = {}  # Forward sirasinda backward icin saklanacak degerler
+        self._workspaces = {}  # (girdi boyutu, dtype) -> {buffer adi: np.ndarray}
 
     @abstractmethod
     def forward(self, x):
@@ -72,5 +149,153 @@ class Layer(ABC):
         """
         return {}
 
+    def set_dtype(self, dtype):
+        """
+        Parametreleri dtype'a cevir.
+
+        Eski dtype'taki gradyanlar ve cache silinir; sonraki backward yeni
+        dtype'ta hesaplar. get_params() anahtarlari katman attribute
+        isimleriyle ayni olmali (W -> self.W).
+
+        Args:
+            dtype: Yeni parametre dtype'i
+
+        Returns:
+            self
+        """
+        dtype = np.dtype(dtype)
+        for name, value in self.get_params().items():
+            setattr(self, name, value.astype(dtype, copy=False))
+        for name in self.get_grads():
+            setattr(self, name, None)
+        self.cache = {}
+        self.clear_workspace()
+        return self
+
+    def set_cache_dtype(self, dtype):
+        """
+        Backward icin saklanan aktivasyonlarin dtype'ini ayarla.
+
+        Args:
+            dtype: np.float16 (karisik hassasiyet) veya None (hesap dtype'i)
+
+        Returns:
+            self
+        """
+        self.cache_dtype = None if dtype is None else np.dtype(dtype)
+        self.cache = {}
+        self.clear_workspace()
+        return self
+
+    def train(self, mode=True):
+        """
+        Egitim (True) veya cikarim (False) moduna gec.
+
+        Cikarim modunda forward cache doldurmaz; mevcut cache birakilir
+        (workspace buffer'lari kalir).
+
+        Returns:
+            self
+        """
+        self.training = mode
+        if not mode:
+            self.clear_cache()
+        return self
+
+    def eval(self):
+        """Cikarim moduna gec (train(False))."""
+        return self.train(False)
+
+    def clear_cache(self):
+        """Backward icin saklanan degerleri birak."""
+        self.cache = {}
+        return self
+
+    def zero_grad(self):
+        """
+        Gradyanlari sifirla; sonraki backward yeni bir ortalama baslatir.
+
+        Returns:
+            self
+        """
+        for grad in self.get_grads().values():
+            if grad is not None:
+                grad.fill(0)
+        self.grad_samples = 0
+        return self
+
+    def _accumulating(self):
+        """Bu backward mevcut gradyanlara eklenecek mi?"""
+        return self.accumulate_grads and self.grad_samples > 0
+
+    def _merge_grads(self, batch_grads, m):
+        """
+        m orneklik batch'in ortalama gradyanlarini biriken ortalamaya kat.
+
+        Ortalama kayarak tutulur: g += (g_batch - g) * m / (n + m). Her
+        micro-batch'ten sonra dW/db o ana kadarki tum orneklerin ortalamasidir,
+        micro-batch boyutlari farkli olsa da 1/m olcegi dogru kalir.
+        batch_grads gecici dizilerdir ve yerinde degistirilir.
+
+        Args:
+            batch_grads: get_grads() sirasinda batch ortalamalari
+            m: Batch'teki ornek sayisi
+        """
+        total = self.grad_samples + m
+        weight = m / total
+        for grad, batch in zip(self.get_grads().values(), batch_grads):
+            np.subtract(batch, grad, out=batch)
+            batch *= weight
+            grad += batch
+        self.grad_samples = total
+
+    def _to_cache(self, a):
+        """a'yi cache_dtype'ta saklanacak hale getir (None ise oldugu gibi)."""
+        if self.cache_dtype is None or not self.training:
+            return a
+        return a.astype(self.cache_dtype, copy=False)
+
+    # ==========================================================================
+    # WORKSPACE
+    # ==========================================================================
+    #
+    # Her adimda ayni boyutlu buyuk ara diziler (orn: Conv2D x_col, Dense
+    # cikti/dx) yeniden ayrilmasin diye girdi boyutu basina bir buffer
+    # sozlugu tutulur. Diziler ilk kullanimda ayrilir, sonraki adimlarda
+    # np.copyto ve out= parametreleri ile doldurulur. Son kullanilan
+    # MAX_WORKSPACES sozluk tutulur; cache'ten bagimsizdir (eval()/no_grad()
+    # birakmaz), clear_workspace() ile birakilir.
+    # ==========================================================================
+
+    def _get_workspace(self, key, dtype):
+        """(key, dtype) icin workspace sozlugunu dondur (yoksa olustur)."""
+        dtype = np.dtype(dtype)
+        if not self.use_workspace:
+            return {'dtype': dtype, 'persistent': False}
+
+        key = (key, dtype)
+        ws = self._workspaces.pop(key, None)
+        if ws is None:
+            ws = {'dtype': dtype, 'persistent': True}
+            # En eski workspace'i birak
+            while len(self._workspaces) >= self.MAX_WORKSPACES:
+                del self._workspaces[next(iter(self._workspaces))]
+        self._workspaces[key] = ws  # en sona tasi (en son kullanilan)
+        return ws
+
+    def _buffer(self, ws, name, shape, dtype=None):
+        """Workspace'ten name adli buffer'i dondur, yoksa ayir (dtype: None ise ws dtype'i)."""
+        buf = ws.get(name)
+        if buf is None:
+            buf = np.empty(shape, dtype=dtype or ws['dtype'])
+            if ws['persistent']:
+                ws[name] = buf
+        return buf
+
+    def clear_workspace(self):
+        """Tum workspace buffer'larini serbest birak."""
+        self._workspaces.clear()
+        return self
+
     def __repr__(self):
         return f"{self.__class__.__name__}()"
@@ -4,6 +4,8 @@ Convolutional Layers
 CNN icin konvolusyon ve pooling katmanlari.
 
 Boyut notasyonu: (batch, channels, height, width) - NCHW format
+Conv2D ve MaxPool2D data_format='NHWC' ile (batch, height, width, channels)
+duzeninde de calisir; Flatten ve ReLU her iki duzeni de oldugu gibi kabul eder.
 
 im2col Optimizasyonu:
     Konvolusyonu matris carpimina donusturur.
@@ -34,6 +36,10 @@ MATEMATIKSEL TANIM
 Tek kanalli konvolusyon:
     Y[i,j] = sum_{p,q} X[i*s + p, j*s + q] * W[p, q] + b
 
+Genisletilmis (dilated) konvolusyon kernel elemanlari arasinda d-1 piksel
+atlar; 3x3 kernel 5x5'lik (d=2) alani gorur, carpim sayisi ayni kalir:
+    Y[i,j] = sum_{p,q} X[i*s + p*d, j*s + q*d] * W[p, q] + b
+
 Cok kanalli (tam) konvolusyon:
     Y[n, f, i, j] = sum_{c,p,q} X[n, c, i*s + p, j*s + q] * W[f, c, p, q] + b[f]
 
@@ -44,6 +50,7 @@ Burada:
     i, j: cikti konumu
     p, q: kernel ici konum
     s: stride
+    d: dilation
 
 ================================================================================
 CIKTI BOYUTU HESABI
@@ -52,14 +59,22 @@ CIKTI BOYUTU HESABI
     H_out = (H_in + 2*padding - kH) / stride + 1
     W_out = (W_in + 2*padding - kW) / stride + 1
 
+Dilation ile kernel'in kapladigi alan d*(k-1) + 1 olur, formulde kH/kW
+yerine bu deger kullanilir.
+
 Ornek: 28x28 girdi, 3x3 kernel, stride=1, padding=0:
     H_out = (28 + 0 - 3) / 1 + 1 = 26
 
 ================================================================================
 """
 
+import copy
 import numpy as np
-from .base import Layer
+from .base import Layer, get_default_dtype
+from . import autotune
+from .winograd import (winograd_weights, winograd_weight_grad, split_phases, merge_phases,
+                       winograd_conv2d, winograd_conv2d_backward)
+from .fft_conv import dilated_size, fft_kernel_spectrum, fft_conv2d, fft_conv2d_backward
 
 
 # ============== im2col / col2im Helper Fonksiyonlari ==============
@@ -117,7 +132,7 @@ from .base import Layer
 #
 # ==============================================================================
 
-def im2col(x, kH, kW, stride=1, padding=0):
+def im2col(x, kH, kW, stride=1, padding=0, out=None, dilation=1):
     """
     Goruntu tensorunu kolon matrisine donustur.
 
@@ -130,6 +145,8 @@ def im2col(x, kH, kW, stride=1, padding=0):
         kW: Kernel genisligi
         stride: Adim boyutu
         padding: Kenar dolgusu
+        out: (Opsiyonel) Sonucun yazilacagi (C*kH*kW, H_out*W_out*m) buffer
+        dilation: Kernel elemanlari arasindaki adim (default=1)
 
     Returns:
         col: (C*kH*kW, H_out*W_out*m) matris
@@ -147,9 +164,9 @@ def im2col(x, kH, kW, stride=1, padding=0):
 
     H_padded, W_padded = x.shape[2], x.shape[3]
 
-    # Cikti boyutlari
-    H_out = (H_padded - kH) // stride + 1
-    W_out = (W_padded - kW) // stride + 1
+    # Cikti boyutlari (kernel'in kapladigi alan: dilation*(k-1) + 1)
+    H_out = (H_padded - dilation * (kH - 1) - 1) // stride + 1
+    W_out = (W_padded - dilation * (kW - 1) - 1) // stride + 1
 
     # ===========================================================================
     # STRIDE TRICKS ACIKLAMASI
@@ -164,8 +181,12 @@ def im2col(x, kH, kW, stride=1, padding=0):
     #   s2: sonraki satira git
     #   s3: sonraki sutuna git
     #
-    # Yeni strides: (s0, s1, s2, s3, s2*stride, s3*stride)
+    # Yeni strides: (s0, s1, s2*d, s3*d, s2*stride, s3*stride)
+    #   kH, kW boyutlari: kernel ici adim - dilation d kadar satir/sutun atlar
     #   Son iki boyut: pencere konumlari icin stride atlama
+    #
+    # Dilation sadece strides'i degistirir: x_col yine (C*kH*kW, ...) boyutunda,
+    # matris carpimi yogun (dense) kernel ile ayni maliyettedir.
     # ===========================================================================
 
     # Shape: (m, C, kH, kW, H_out, W_out)
@@ -173,7 +194,7 @@ def im2col(x, kH, kW, stride=1, padding=0):
 
     # Strides hesapla (byte cinsinden atlama miktarlari)
     s = x.strides
-    strides = (s[0], s[1], s[2], s[3], s[2] * stride, s[3] * stride)
+    strides = (s[0], s[1], s[2] * dilation, s[3] * dilation, s[2] * stride, s[3] * stride)
 
     # as_strided ile pencereler olustur
     cols = np.lib.stride_tricks.as_strided(x, shape=shape, strides=strides)
@@ -181,9 +202,14 @@ def im2col(x, kH, kW, stride=1, padding=0):
 
     # (m, C, kH, kW, H_out, W_out) -> (C*kH*kW, H_out*W_out*m)
     # Yeniden sekillendirme: (1, 3, 3, 26, 26, 32) -> (9, 21632)
-    cols = cols.transpose(1, 2, 3, 4, 5, 0).reshape(C * kH * kW, -1)
+    cols = cols.transpose(1, 2, 3, 4, 5, 0)
+
+    if out is None:
+        return cols.reshape(C * kH * kW, -1)
 
-    return cols
+    # Yeni dizi ayirmadan verilen buffer'a kopyala
+    np.copyto(out.reshape(C, kH, kW, H_out, W_out, m), cols)
+    return out
 
 
 # ==============================================================================
@@ -208,7 +234,7 @@ def im2col(x, kH, kW, stride=1, padding=0):
 #     Her pencereden gelen gradyan katkisi toplanmali.
 # ==============================================================================
 
-def col2im(col, x_shape, kH, kW, stride=1, padding=0):
+def col2im(col, x_shape, kH, kW, stride=1, padding=0, out=None, dilation=1):
     """
     Kolon matrisini goruntu tensoruna geri donustur (im2col'un tersi).
 
@@ -221,6 +247,8 @@ def col2im(col, x_shape, kH, kW, stride=1, padding=0):
         kW: Kernel genisligi
         stride: Adim boyutu
         padding: Kenar dolgusu
+        out: (Opsiyonel) Toplama icin kullanilacak (C, H+2p, W+2p, m) buffer
+        dilation: Kernel elemanlari arasindaki adim (default=1)
 
     Returns:
         x: Orijinal boyutta tensor (m, C, H, W)
@@ -230,25 +258,36 @@ def col2im(col, x_shape, kH, kW, stride=1, padding=0):
     H_padded = H + 2 * padding
     W_padded = W + 2 * padding
 
-    H_out = (H_padded - kH) // stride + 1
-    W_out = (W_padded - kW) // stride + 1
+    H_out = (H_padded - dilation * (kH - 1) - 1) // stride + 1
+    W_out = (W_padded - dilation * (kW - 1) - 1) // stride + 1
 
     # (C*kH*kW, H_out*W_out*m) -> (C, kH, kW, H_out, W_out, m)
+    # Bellek duzeni korunur, kopya yok
     col_reshaped = col.reshape(C, kH, kW, H_out, W_out, m)
 
-    # (C, kH, kW, H_out, W_out, m) -> (m, C, kH, kW, H_out, W_out)
-    col_reshaped = col_reshaped.transpose(5, 0, 1, 2, 3, 4)
-
-    # Padding dahil bos tensor olustur
-    x_padded = np.zeros((m, C, H_padded, W_padded))
-
-    # Her pencereyi yerine yerlestir (overlap durumunda topla)
+    # Padding dahil bos tensor - col ile ayni bellek duzeninde (C, H, W, m)
+    # Boylece asagidaki toplamalar ardisik bellek uzerinde calisir
+    if out is None:
+        x_padded = np.zeros((C, H_padded, W_padded, m), dtype=col.dtype)
+    else:
+        x_padded = out
+        x_padded.fill(0)
+
+    # Her kernel ofseti (p, q) icin TUM pencereleri tek seferde yerlestir.
+    # Ofset (p, q) tum pencerelerde x[p*d + i*stride, q*d + j*stride] konumuna
+    # denk gelir - yani x_padded uzerinde stride'li bir view.
+    # Dongu H_out*W_out (26*26=676) yerine kH*kW (3*3=9) kez doner.
     # += ile overlap'lerde toplama yapiliyor - bu cok onemli!
-    for i in range(H_out):
-        for j in range(W_out):
-            h_start = i * stride
-            w_start = j * stride
-            x_padded[:, :, h_start:h_start+kH, w_start:w_start+kW] += col_reshaped[:, :, :, :, i, j]
+    for p in range(kH):
+        h_start = p * dilation
+        h_end = h_start + stride * H_out
+        for q in range(kW):
+            w_start = q * dilation
+            w_end = w_start + stride * W_out
+            x_padded[:, h_start:h_end:stride, w_start:w_end:stride, :] += col_reshaped[:, p, q]
+
+    # (C, H, W, m) -> (m, C, H, W)
+    x_padded = x_padded.transpose(3, 0, 1, 2)
 
     # Padding'i kaldir
     if padding > 0:
@@ -256,6 +295,107 @@ def col2im(col, x_shape, kH, kW, stride=1, padding=0):
     return x_padded
 
 
+# ==============================================================================
+# NHWC (CHANNELS-LAST) im2col / col2im
+# ==============================================================================
+# Kanallar son eksende oldugunda pencereler satirlara acilir:
+#
+#     x (m, H, W, C) -> x_col (m*H_out*W_out, kH*kW*C)
+#
+# Bir satir bir pencerenin tum degerleridir; kanal ekseni en icte kaldigi
+# icin her (p, q) ofsetindeki C deger bellekte ardisiktir. Matris carpimi
+# x_col @ W_col = (m*H_out*W_out, C_out) dogrudan (m, H_out, W_out, C_out)
+# duzenindedir: sonuc icin transpose veya kopya gerekmez.
+#
+# Az kanalda (orn: C=1 ilk katman) satir duzeni yavastir: kopyanin en ic
+# dongusu C uzunlugundadir ve her pencere icin kH*kW kez yeniden baslar.
+# Bu durumda ayni matris (kH*kW*C, m*H_out*W_out) buffer'inin transpoz
+# view'u olarak doldurulur: en ic eksen W_out olur, yazmalar ardisiktir
+# (NCHW im2col gibi). Matris carpimlari transpoz view'u BLAS'a kopyasiz verir.
+# ==============================================================================
+
+def im2col_nhwc(x, kH, kW, stride=1, out=None, dilation=1):
+    """
+    NHWC girdiyi satir matrisine donustur (padding onceden uygulanmis olmali).
+
+    Args:
+        x: Girdi tensoru (m, H, W, C)
+        kH: Kernel yuksekligi
+        kW: Kernel genisligi
+        stride: Adim boyutu
+        out: (Opsiyonel) Sonucun yazilacagi (m*H_out*W_out, kH*kW*C) buffer.
+            Ardisik bir (kH*kW*C, m*H_out*W_out) dizinin transpoz view'u da
+            olabilir (az kanal icin hizli duzen, bkz. yukaridaki aciklama).
+        dilation: Kernel elemanlari arasindaki adim (default=1)
+
+    Returns:
+        col: (m*H_out*W_out, kH*kW*C) matris
+    """
+    m, H, W, C = x.shape
+    H_out = (H - dilation * (kH - 1) - 1) // stride + 1
+    W_out = (W - dilation * (kW - 1) - 1) // stride + 1
+
+    # (m, H_out, W_out, kH, kW, C) pencere view'u
+    s = x.strides
+    cols = np.lib.stride_tricks.as_strided(
+        x, shape=(m, H_out, W_out, kH, kW, C),
+        strides=(s[0], s[1] * stride, s[2] * stride, s[1] * dilation, s[2] * dilation, s[3]),
+        writeable=False)
+
+    if out is None:
+        return cols.reshape(m * H_out * W_out, -1)
+
+    if out.flags.c_contiguous:
+        np.copyto(out.reshape(m, H_out, W_out, kH, kW, C), cols)
+    else:
+        np.copyto(out.T.reshape(kH, kW, C, m, H_out, W_out), cols.transpose(3, 4, 5, 0, 1, 2))
+    return out
+
+
+def col2im_nhwc(col, x_shape, kH, kW, stride=1, padding=0, out=None, dilation=1):
+    """
+    im2col_nhwc'nin tersi: satirlari (m, H, W, C) tensorune topla.
+
+    Args:
+        col: (m*H_out*W_out, kH*kW*C) matris
+        x_shape: Orijinal girdi boyutu (m, H, W, C)
+        kH: Kernel yuksekligi
+        kW: Kernel genisligi
+        stride: Adim boyutu
+        padding: Kenar dolgusu
+        out: (Opsiyonel) Toplama icin kullanilacak (m, H+2p, W+2p, C) buffer
+        dilation: Kernel elemanlari arasindaki adim (default=1)
+
+    Returns:
+        x: Orijinal boyutta tensor (m, H, W, C)
+    """
+    m, H, W, C = x_shape
+    H_padded, W_padded = H + 2 * padding, W + 2 * padding
+    H_out = (H_padded - dilation * (kH - 1) - 1) // stride + 1
+    W_out = (W_padded - dilation * (kW - 1) - 1) // stride + 1
+
+    col_reshaped = col.reshape(m, H_out, W_out, kH, kW, C)
+
+    if out is None:
+        x_padded = np.zeros((m, H_padded, W_padded, C), dtype=col.dtype)
+    else:
+        x_padded = out
+        x_padded.fill(0)
+
+    # col2im ile ayni fikir: kernel ofseti basina tek toplama
+    for p in range(kH):
+        h_start = p * dilation
+        h_end = h_start + stride * H_out
+        for q in range(kW):
+            w_start = q * dilation
+            w_end = w_start + stride * W_out
+            x_padded[:, h_start:h_end:stride, w_start:w_end:stride, :] += col_reshaped[:, :, :, p, q, :]
+
+    if padding > 0:
+        return x_padded[:, padding:-padding, padding:-padding, :]
+    return x_padded
+
+
 # ==============================================================================
 # CONV2D KATMANI
 # ==============================================================================
@@ -290,45 +430,149 @@ class Conv2D(Layer):
         stride: Adim boyutu (default=1)
         padding: Kenar dolgusu (default=0)
         seed: Random seed
+        use_workspace: Ara buffer'lari (x_col, dx_col, padding...) girdi
+            boyutu basina saklayip her adimda yeniden kullan (default=True).
+            False ise her cagrida yeni diziler ayrilir.
+        algorithm: Konvolusyon algoritmasi (default='auto')
+            'im2col':   im2col + tek matris carpimi (her durumda calisir)
+            'winograd': Winograd F(2x2, 3x3), sadece 3x3 kernel ve stride=1
+            'fft':      FFT konvolusyonu, buyuk kernel'lar icin
+            'auto':     Her girdi boyutunun ilk cagrisinda uygun adaylari
+                        olcup en hizlisini kullan (bkz. layers/autotune.py)
+        data_format: Tensor duzeni (default='NCHW')
+            'NCHW': (m, C, H, W)
+            'NHWC': (m, H, W, C) - channels-last. im2col yolunda matris
+                    carpimi ciktiyi dogrudan ardisik (m, H_out, W_out, C_out)
+                    olarak yazar. Winograd ve FFT ayni cekirdekleri NCHW
+                    view'u uzerinden kullanir.
+                    Conv2D'nin kendisi NCHW'den hizli degildir: forward
+                    yakin, backward (col2im_nhwc) az/orta kanalda ~1.1-1.6x
+                    yavas (bkz. benchmark.py nhwc). Model duzeyindeki kazanc
+                    ReLU ve MaxPool2D'nin kanal-son duzenindeki hizindandir.
+        groups: Kanal grubu sayisi (default=1). Girdi ve cikti kanallari
+            groups parcaya bolunur; her cikti grubu sadece kendi girdi
+            grubunu gorur. Maliyet C_in*C_out*kH*kW yerine
+            C_in*C_out*kH*kW / groups olur. groups=in_channels depthwise
+            konvolusyondur (bkz. DepthwiseConv2D). groups > 1 sadece
+            im2col algoritmasiyla calisir.
+        dilation: Kernel elemanlari arasindaki adim (default=1). 3x3 kernel
+            dilation=2 ile 5x5'lik alani gorur; x_col ve matris carpimi yogun
+            3x3 ile ayni boyuttadir. Winograd alt izgaralar uzerinden
+            (bkz. layers/winograd.py), FFT genisletilmis kernel ile calisir.
+        memory_budget: im2col ara dizileri (x_col, dx_col) icin bayt
+            cinsinden ust sinir (default=None: sinirsiz). x_col butceyi
+            asarsa batch parcalara bolunur ve dW parcalar uzerinden
+            toplanir (bkz. MIKRO-BATCH). Tepe bellek azalir, adim suresi
+            uzayabilir. Butce asildiginda 'auto' im2col'u
+            secer; winograd/fft ile birlikte kullanilamaz.
 
     Boyutlar:
-        Input:  (m, C_in, H, W)
-        Output: (m, C_out, H_out, W_out)
+        Input:  (m, C_in, H, W)       veya NHWC: (m, H, W, C_in)
+        Output: (m, C_out, H_out, W_out)  veya NHWC: (m, H_out, W_out, C_out)
 
-        H_out = (H - kernel_size + 2*padding) // stride + 1
-        W_out = (W - kernel_size + 2*padding) // stride + 1
+        H_out = (H - dilation*(kernel_size-1) - 1 + 2*padding) // stride + 1
+        W_out = (W - dilation*(kernel_size-1) - 1 + 2*padding) // stride + 1
+        Kernel: (C_out, C_in // groups, kH, kW)
+
+    Workspace:
+        forward() ciktisi workspace buffer'inin bir view'udur; ayni girdi
+        boyutuyla yapilan bir sonraki forward() cagrisinda uzerine yazilir
+        (Sequential.forward son katmanin ciktisini kopyalar).
+        Son kullanilan MAX_WORKSPACES girdi boyutunun buffer'lari tutulur;
+        eval()/no_grad() bunlari birakmaz, clear_workspace() birakir.
 
     Ornek:
         conv = Conv2D(1, 32, kernel_size=3)
         out = conv.forward(x)  # x: (m, 1, 28, 28) -> out: (m, 32, 26, 26)
     """
 
-    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0, seed=None):
+    ALGORITHMS = ('auto', 'im2col', 'winograd', 'fft')
+    DATA_FORMATS = ('NCHW', 'NHWC')
+
+    # NHWC im2col: C_in bundan azsa x_col (kH*kW*C_in, m*H_out*W_out) transpoz
+    # duzeninde doldurulur (bkz. im2col_nhwc). Olcum: C_in=1'de forward+dW
+    # ~1.7x hizli, 4'te esit, 8'den itibaren satir duzeni hizli.
+    NHWC_COLUMN_CHANNELS = 8
+
+    # Autotune olcumleri batch'in bu kadar ornegiyle yapilir. Sureler batch
+    # boyutuyla dogrusal buyudugu icin siralama degismez, olcum ucuz kalir.
+    AUTOTUNE_BATCH = 64
+
+    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0, seed=None,
+                 use_workspace=True, algorithm='auto', data_format='NCHW', groups=1, dilation=1,
+                 memory_budget=None):
         super().__init__()
         self.in_channels = in_channels
         self.out_channels = out_channels
         self.kernel_size = kernel_size if isinstance(kernel_size, tuple) else (kernel_size, kernel_size)
         self.stride = stride
         self.padding = padding
+        self.use_workspace = use_workspace
+
+        if dilation < 1:
+            raise ValueError(f"dilation en az 1 olmali: dilation={dilation}")
+        self.dilation = dilation
+
+        if in_channels % groups or out_channels % groups:
+            raise ValueError(f"in_channels ve out_channels groups'a tam bolunmeli: "
+                             f"in_channels={in_channels}, out_channels={out_channels}, groups={groups}")
+        self.groups = groups
+
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Bilinmeyen algoritma: {algorithm}. Secenekler: {self.ALGORITHMS}")
+        if algorithm == 'winograd' and not self._supports_winograd():
+            raise ValueError(f"Winograd sadece 3x3 kernel ve stride=1 icin: "
+                             f"kernel_size={self.kernel_size}, stride={stride}")
+        if algorithm in ('winograd', 'fft') and groups > 1:
+            raise ValueError(f"{algorithm} groups > 1 desteklemiyor (groups={groups}), 'im2col' kullanin")
+        if algorithm in ('winograd', 'fft') and memory_budget is not None:
+            raise ValueError(f"memory_budget sadece im2col ile calisir: algorithm='{algorithm}'")
+        self.algorithm = algorithm
+        self.memory_budget = memory_budget
+
+        if data_format not in self.DATA_FORMATS:
+            raise ValueError(f"Bilinmeyen data_format: {data_format}. Secenekler: {self.DATA_FORMATS}")
+        self.data_format = data_format
+
+        # FFT yolu icin kernel spektrumu (agirliklar degismedikce gecerli)
+        self._fft_cache = None
+
+        # 'auto' modunda (girdi boyutu, dtype) -> secilen algoritma
+        self._tuned_algorithms = {}
 
         # He initialization - ReLU ile kullanildiginda iyi calisir
         if seed is not None:
             np.random.seed(seed)
 
         kH, kW = self.kernel_size
-        fan_in = in_channels * kH * kW
+        fan_in = in_channels // groups * kH * kW
 
-        # Kernel: (C_out, C_in, kH, kW)
-        self.W = np.random.randn(out_channels, in_channels, kH, kW) * np.sqrt(2.0 / fan_in)
-        self.b = np.zeros((out_channels, 1))
+        # Kernel: (C_out, C_in // groups, kH, kW)
+        dtype = get_default_dtype()
+        W = np.random.randn(out_channels, in_channels // groups, kH, kW) * np.sqrt(2.0 / fan_in)
+        self.W = W.astype(dtype)
+        self.b = np.zeros((out_channels, 1), dtype=dtype)
 
         # Gradyanlar
         self.dW = None
         self.db = None
 
+    def _output_size(self, H, W):
+        """Padding'siz (H, W) girdi icin (H_out, W_out)."""
+        kH, kW = dilated_size(self.kernel_size, self.dilation)
+        H_out = (H + 2 * self.padding - kH) // self.stride + 1
+        W_out = (W + 2 * self.padding - kW) // self.stride + 1
+        if H_out < 1 or W_out < 1:
+            raise ValueError(f"Girdi ({H}x{W}) kernel'in kapladigi alandan ({kH}x{kW}) kucuk: "
+                             f"padding={self.padding}, dilation={self.dilation}")
+        return H_out, W_out
+
     def forward(self, x):
         """
-        Konvolusyon islemi (im2col optimizasyonlu).
+        Konvolusyon islemi.
+
+        Algoritma self.algorithm'e gore secilir (bkz. _select_algorithm).
+        Asagidaki adimlar varsayilan im2col yolunu anlatir.
 
         Args:
             x: Girdi (m, C_in, H, W)
@@ -342,33 +586,94 @@ class Conv2D(Layer):
             3. Matris carpimi yap
             4. Sonucu tekrar 4D tensore donustur
         """
+        # Hesap parametre dtype'inda yapilir (float32 modelde float64 girdi yukseltmez)
+        x = x.astype(self.W.dtype, copy=False)
+        ws = self._get_workspace(x.shape, self.W.dtype)
+        channels_last = self.data_format == 'NHWC'
+
+        # Kernel (dilation dahil) girdiden buyukse burada anlasilir hata ver
+        self._output_size(*(x.shape[1:3] if channels_last else x.shape[2:]))
+
+        # Bellek butcesi asiliyorsa batch parcalara bolunur (sadece im2col)
+        chunk = self._batch_chunk(x, ws['dtype'])
+        algorithm = 'im2col' if chunk else self._select_algorithm(x)
+
+        if channels_last and algorithm == 'im2col' and self.groups == 1:
+            if chunk:
+                out = self._forward_im2col_nhwc_chunked(x, ws, chunk)
+            else:
+                out = self._forward_im2col_nhwc(x, ws)
+        else:
+            if channels_last:
+                # Winograd/FFT ve gruplu im2col NCHW view'u ile calisir (kopya yok)
+                x = x.transpose(0, 3, 1, 2)
+
+            if algorithm == 'winograd':
+                out = self._forward_winograd(x, ws)
+            elif algorithm == 'fft':
+                out = self._forward_fft(x, ws)
+            elif chunk:
+                out = self._forward_im2col_chunked(x, ws, chunk)
+            else:
+                out = self._forward_im2col(x, ws)
+
+            if channels_last:
+                out = out.transpose(0, 2, 3, 1)
+
+        if not self.training:
+            # Cikarim: alt yollarin sakladigi referanslari birak (workspace
+            # buffer'lari bir sonraki cagrida yeniden kullanilir)
+            self.cache = {}
+            return out
+
+        # Cache - backward icin sakla
+        self.cache['x_shape'] = x.shape
+        self.cache['workspace'] = ws
+        self.cache['algorithm'] = algorithm
+        self.cache['chunked'] = bool(chunk)
+
+        return out
+
+    def _forward_im2col(self, x, ws):
+        """im2col + matris carpimi ile forward (bkz. forward)."""
         m, C_in, H, W = x.shape  # (32, 1, 28, 28)
         kH, kW = self.kernel_size  # (3, 3)
 
         # Cikti boyutlari
-        H_out = (H + 2 * self.padding - kH) // self.stride + 1  # 26
-        W_out = (W + 2 * self.padding - kW) // self.stride + 1  # 26
+        H_out, W_out = self._output_size(H, W)  # (26, 26)
+
+        dtype = ws['dtype']
 
         # ===========================================================================
         # ADIM 1: im2col
         # Girdiyi (C_in*kH*kW, H_out*W_out*m) matrise donustur
         # (1*3*3, 26*26*32) = (9, 21632)
+        # Padding ve x_col workspace buffer'larina yazilir (yeni dizi ayrilmaz)
+        # Karisik hassasiyette cache'e x_col'un float16 kopyasi konur (_cache_cols)
         # ===========================================================================
-        x_col = im2col(x, kH, kW, self.stride, self.padding)
+        x_padded = self._pad_input(ws, x)
+        x_col = self._buffer(ws, 'x_col', (C_in * kH * kW, H_out * W_out * m))
+        im2col(x_padded, kH, kW, self.stride, 0, out=x_col, dilation=self.dilation)
 
         # ===========================================================================
         # ADIM 2: W'yi duzlestir
-        # (C_out, C_in, kH, kW) -> (C_out, C_in*kH*kW)
-        # (16, 1, 3, 3) -> (16, 9)
+        # (C_out, C_in, kH, kW) -> (G, C_out/G, C_in/G*kH*kW)
+        # (16, 1, 3, 3) -> (1, 16, 9)
         # ===========================================================================
-        W_row = self.W.reshape(self.out_channels, -1)
+        G = self.groups
+        W_row = self.W.reshape(G, self.out_channels // G, -1).astype(dtype, copy=False)
 
         # ===========================================================================
-        # ADIM 3: Matris carpimi
-        # (C_out, C_in*kH*kW) @ (C_in*kH*kW, H_out*W_out*m) + (C_out, 1)
-        # (16, 9) @ (9, 21632) + (16, 1) = (16, 21632)
+        # ADIM 3: Matris carpimi (grup basina bir tane)
+        # x_col satirlari kanal sirasinda oldugu icin g. grubun satirlari
+        # ardisik bir bloktur: x_col -> (G, C_in/G*kH*kW, P) kopyasiz view
+        # (G, C_out/G, K) @ (G, K, P) + (C_out, 1)
+        # (1, 16, 9) @ (1, 9, 21632) + (16, 1) = (16, 21632)
         # ===========================================================================
-        out = np.dot(W_row, x_col) + self.b
+        P = H_out * W_out * m
+        out = self._buffer(ws, 'out', (self.out_channels, P))
+        np.matmul(W_row, x_col.reshape(G, -1, P), out=out.reshape(G, -1, P))
+        np.add(out, self.b, out=out)
 
         # ===========================================================================
         # ADIM 4: Yeniden sekillendirme
@@ -378,14 +683,15 @@ class Conv2D(Layer):
         out = out.reshape(self.out_channels, H_out, W_out, m).transpose(3, 0, 1, 2)
 
         # Cache - backward icin sakla
-        self.cache['x'] = x
-        self.cache['x_col'] = x_col
+        self.cache['x_col'] = self._cache_cols(ws, x_col)
 
         return out
 
     def backward(self, dout):
         """
-        Geri yayilim (im2col optimizasyonlu).
+        Geri yayilim (forward'da kullanilan algoritma ile).
+
+        Asagidaki turevler varsayilan im2col yolunu anlatir.
 
         Args:
             dout: Sonraki katmandan gelen gradyan (m, C_out, H_out, W_out)
@@ -443,10 +749,63 @@ class Conv2D(Layer):
             Sonra col2im ile orijinal sekle donustur.
         =========================================================================
         """
-        x = self.cache['x']
-        x_col = self.cache['x_col']
+        dtype = self.cache['workspace']['dtype']
+        dout = dout.astype(dtype, copy=False)
+
+        # Gradyan dizileri bir kez ayrilir, sonra yerinde guncellenir
+        if self.dW is None or self.dW.dtype != dtype:
+            self.dW = np.empty(self.W.shape, dtype=dtype)
+            self.db = np.empty(self.b.shape, dtype=dtype)
+
+        # Biriktirme: algoritmalar batch ortalamasini self.dW/self.db'ye
+        # yazar; bu adim icin gecici buffer'lara yonlendirilip sonra eklenir
+        if self._accumulating():
+            ws = self.cache['workspace']
+            dW, db = self.dW, self.db
+            self.dW = self._buffer(ws, 'dW_batch', dW.shape)
+            self.db = self._buffer(ws, 'db_batch', db.shape)
+            dx = self._backward_algorithm(dout)
+            batch_grads = (self.dW, self.db)
+            self.dW, self.db = dW, db
+            self._merge_grads(batch_grads, self.cache['x_shape'][0])
+            return dx
+
+        dx = self._backward_algorithm(dout)
+        self.grad_samples = self.cache['x_shape'][0]
+        return dx
 
-        m, C_in, H, W = x.shape
+    def _backward_algorithm(self, dout):
+        """forward'da secilen algoritmanin geri yayilimi (dW/db'nin uzerine yazar)."""
+        algorithm = self.cache['algorithm']
+        chunked = self.cache['chunked']
+        if self.data_format == 'NHWC':
+            if algorithm == 'im2col' and self.groups == 1:
+                if chunked:
+                    return self._backward_im2col_nhwc_chunked(dout)
+                return self._backward_im2col_nhwc(dout)
+            dout = dout.transpose(0, 3, 1, 2)
+
+        if algorithm == 'winograd':
+            dx = self._backward_winograd(dout)
+        elif algorithm == 'fft':
+            dx = self._backward_fft(dout)
+        elif chunked:
+            dx = self._backward_im2col_chunked(dout)
+        else:
+            dx = self._backward_im2col(dout)
+
+        if self.data_format == 'NHWC':
+            return dx.transpose(0, 2, 3, 1)
+        return dx
+
+    def _backward_im2col(self, dout):
+        """im2col yolunun geri yayilimi (bkz. backward)."""
+        x_shape = self.cache['x_shape']
+        ws = self.cache['workspace']
+        x_col = self._restore_cols(ws, self.cache['x_col'])
+        dtype = ws['dtype']
+
+        m, C_in, H, W = x_shape
         _, C_out, H_out, W_out = dout.shape
         kH, kW = self.kernel_size
 
@@ -455,43 +814,665 @@ class Conv2D(Layer):
         # (m, C_out, H_out, W_out) -> (C_out, H_out*W_out*m)
         # (32, 16, 26, 26) -> (16, 21632)
         # ===========================================================================
-        dout_reshaped = dout.transpose(1, 2, 3, 0).reshape(C_out, -1)
+        dout_reshaped = self._buffer(ws, 'dout_col', (C_out, H_out * W_out * m))
+        np.copyto(dout_reshaped.reshape(C_out, H_out, W_out, m), dout.transpose(1, 2, 3, 0))
+
+        # W'yi reshape: (G, C_out/G, C_in/G*kH*kW) = (1, 16, 9)
+        G = self.groups
+        P = H_out * W_out * m
+        W_row = self.W.reshape(G, C_out // G, -1).astype(dtype, copy=False)
 
-        # W'yi reshape: (C_out, C_in*kH*kW) = (16, 9)
-        W_row = self.W.reshape(self.out_channels, -1)
+        # Grup basina view'lar: (G, C_out/G, P) ve (G, C_in/G*kH*kW, P)
+        dout_groups = dout_reshaped.reshape(G, -1, P)
+        x_cols = x_col.reshape(G, -1, P)
 
         # ===========================================================================
         # ADIM 2: dW hesapla
-        # dW = dout @ x_col.T
+        # dW = dout @ x_col.T (grup basina)
         # (C_out, H_out*W_out*m) @ (H_out*W_out*m, C_in*kH*kW)
         # (16, 21632) @ (21632, 9) = (16, 9)
+        #
+        # ADIM 3: dx_col hesapla
+        # dx_col = W.T @ dout
+        # (C_in*kH*kW, C_out) @ (C_out, H_out*W_out*m)
+        # (9, 16) @ (16, 21632) = (9, 21632)
         # ===========================================================================
-        dW_row = np.dot(dout_reshaped, x_col.T)
-        self.dW = dW_row.reshape(self.W.shape) / m  # Orijinal sekle dondur ve ortala
+        dW_row = self.dW.reshape(G, C_out // G, -1)
+        dx_col = self._grad_cols_buffer(ws, x_col)
+        self._im2col_grads(W_row, dout_groups, x_cols, dW_row, dx_col.reshape(G, -1, P))
+        dW_row /= m  # Ortala
 
         # ===========================================================================
-        # ADIM 3: db hesapla
+        # ADIM 4: db hesapla
         # db = sum(dout) over (batch, height, width)
-        # axis=(0, 2, 3): ornek, yukseklik, genislik uzerinden topla
-        # ===========================================================================
-        self.db = np.sum(dout, axis=(0, 2, 3)).reshape(-1, 1) / m
-
-        # ===========================================================================
-        # ADIM 4: dx_col hesapla
-        # dx_col = W.T @ dout
-        # (C_in*kH*kW, C_out) @ (C_out, H_out*W_out*m)
-        # (9, 16) @ (16, 21632) = (9, 21632)
+        # dout_reshaped'de bunlar tek eksende (axis=1)
         # ===========================================================================
-        dx_col = np.dot(W_row.T, dout_reshaped)
+        np.sum(dout_reshaped, axis=1, out=self.db.reshape(-1))
+        self.db /= m
 
         # ===========================================================================
         # ADIM 5: col2im ile dx'e donustur
         # (9, 21632) -> (32, 1, 28, 28)
         # ===========================================================================
-        dx = col2im(dx_col, x.shape, kH, kW, self.stride, self.padding)
+        H_padded, W_padded = H + 2 * self.padding, W + 2 * self.padding
+        dx_padded = self._buffer(ws, 'dx_padded', (C_in, H_padded, W_padded, m))
+        dx = col2im(dx_col, x_shape, kH, kW, self.stride, self.padding, out=dx_padded,
+                    dilation=self.dilation)
 
         return dx
 
+    @staticmethod
+    def _im2col_grads(W_row, dout_groups, x_cols, dW_row, dx_cols):
+        """
+        Grup basina dW ve dx_col matris carpimlari (ortalama alinmadan).
+
+        Args:
+            W_row: (G, C_out/G, K) agirliklar
+            dout_groups: (G, C_out/G, P) cikti gradyani
+            x_cols: (G, K, P) forward'daki x_col satirlari
+            dW_row: (G, C_out/G, K) dW ciktisi
+            dx_cols: (G, K, P) dx_col ciktisi (x_cols ile ayni bellek olabilir:
+                dW once hesaplanir)
+        """
+        # dW = dout @ x_col.T: (G, C_out/G, P) @ (G, P, K)
+        np.matmul(dout_groups, x_cols.transpose(0, 2, 1), out=dW_row)
+
+        # dx_col = W.T @ dout: (G, K, C_out/G) @ (G, C_out/G, P)
+        if W_row.shape[1] == 1:
+            # Depthwise: grup basina tek cikti kanali -> carpim bir dis carpim
+            # (K, 1) @ (1, P); BLAS cagrisi yerine broadcast carpim daha hizli
+            np.multiply(W_row.transpose(0, 2, 1), dout_groups, out=dx_cols)
+        else:
+            np.matmul(W_row.transpose(0, 2, 1), dout_groups, out=dx_cols)
+
+    # ==========================================================================
+    # MIKRO-BATCH (memory_budget)
+    # ==========================================================================
+    #
+    # x_col (C_in*kH*kW, H_out*W_out*m) batch ile dogrusal buyur: ilk katmanda
+    # m=10000 icin 9 x 676 x 10000 float64 = ~490 MB. memory_budget verilirse
+    # batch m_c'lik parcalara bolunur ve her parca icin im2col + matris carpimi
+    # yapilir. x_col parca boyutunda bir buffer'dir; backward'da parca
+    # parca yeniden uretilir (forward'daki x_col saklanmaz).
+    #
+    #   out, dx:  Ornekler birbirinden bagimsizdir, parcalama sonucu
+    #             degistirmez - parcasiz yol ile bit bit aynidir.
+    #   db:       Tum dout uzerinden tek toplam (parcasiz yolla ayni duzen ve
+    #             sira) - bit bit aynidir.
+    #   dW:       dout @ x_col.T ornekler uzerinden toplamdir; tam x_col hic
+    #             olusmadigi icin parca sonuclari sirayla toplanir. Toplama
+    #             sirasi (BLAS'in matris boyutuna gore sectigi bloklama)
+    #             degistigi icin parcasiz yoldan yuvarlama duzeyinde farklidir:
+    #             float64'te ~1e-15, float32'de ~1e-6 goreli.
+    #
+    #   Sure: Parca basina im2col + GEMM ayni toplam isi yapar, ama kucuk
+    #   matris carpimlari ve backward'da x_col'un yeniden uretilmesi adimi
+    #   uzatabilir. Olcum (benchmark.py memory_budget, m=4000, 28x28 ilk
+    #   katman, tek cekirdek): NCHW'de adim 4-64 MB butcede ~1.2-1.5x uzar;
+    #   NHWC'de fark olcum gurultusu icindedir. Butce hiz icin degil, tepe
+    #   bellek icin bir takastir.
+    # ==========================================================================
+
+    def _batch_chunk(self, x, dtype):
+        """
+        Butce asiliyorsa forward parca boyutunu (ornek sayisi), degilse None dondur.
+        """
+        if self.memory_budget is None:
+            return None
+
+        m = x.shape[0]
+        H, W = x.shape[1:3] if self.data_format == 'NHWC' else x.shape[2:]
+        kH, kW = self.kernel_size
+        H_out, W_out = self._output_size(H, W)
+        itemsize = np.dtype(dtype).itemsize
+
+        x_col_bytes = self.in_channels * kH * kW * H_out * W_out * m * itemsize
+        if x_col_bytes <= self.memory_budget:
+            return None
+
+        # Parca basina: x_col + cikti parcasi
+        per_sample = (self.in_channels * kH * kW + self.out_channels) * H_out * W_out * itemsize
+        return int(min(m, max(1, self.memory_budget // per_sample)))
+
+    def _chunk_buffer(self, ws, name, shape, capacity):
+        """capacity elemanlik duz buffer'in basini shape seklinde (ardisik) dondur."""
+        buf = ws.get(name)
+        if buf is None or buf.size < capacity:
+            buf = np.empty(capacity, dtype=ws['dtype'])
+            if ws['persistent']:
+                ws[name] = buf
+        return buf[:int(np.prod(shape))].reshape(shape)
+
+    def _forward_im2col_chunked(self, x, ws, chunk):
+        """Batch'i chunk'lik parcalarla isleyen im2col forward'i."""
+        m, C_in, H, W = x.shape
+        kH, kW = self.kernel_size
+        H_out, W_out = self._output_size(H, W)
+        C_out, G = self.out_channels, self.groups
+        K = C_in * kH * kW
+        HW = H_out * W_out
+
+        x_padded = self._pad_input(ws, x)
+        W_row = self.W.reshape(G, C_out // G, -1).astype(ws['dtype'], copy=False)
+
+        # Tam boy cikti, parcasiz yol ile ayni (C_out, H_out, W_out, m) duzeninde
+        out = self._buffer(ws, 'out', (C_out, HW * m)).reshape(C_out, H_out, W_out, m)
+
+        for start in range(0, m, chunk):
+            stop = min(start + chunk, m)
+            P = HW * (stop - start)
+
+            x_col = self._chunk_buffer(ws, 'x_col_chunk', (K, P), K * HW * chunk)
+            im2col(x_padded[start:stop], kH, kW, self.stride, 0, out=x_col, dilation=self.dilation)
+
+            out_chunk = self._chunk_buffer(ws, 'out_chunk', (C_out, P), C_out * HW * chunk)
+            np.matmul(W_row, x_col.reshape(G, -1, P), out=out_chunk.reshape(G, -1, P))
+            np.copyto(out[..., start:stop], out_chunk.reshape(C_out, H_out, W_out, -1))
+
+        out_flat = out.reshape(C_out, -1)
+        np.add(out_flat, self.b, out=out_flat)
+
+        self.cache['x_padded'] = self._to_cache(x_padded)
+        self.cache['chunk'] = chunk
+
+        return out.transpose(3, 0, 1, 2)
+
+    def _backward_im2col_chunked(self, dout):
+        """_forward_im2col_chunked'in geri yayilimi (ayni parcalarla)."""
+        m, C_in, H, W = self.cache['x_shape']
+        x_padded = self.cache['x_padded']
+        chunk = self.cache['chunk']
+        ws = self.cache['workspace']
+        dtype = ws['dtype']
+
+        _, C_out, H_out, W_out = dout.shape
+        kH, kW = self.kernel_size
+        G = self.groups
+        K = C_in * kH * kW
+        HW = H_out * W_out
+
+        W_row = self.W.reshape(G, C_out // G, -1).astype(dtype, copy=False)
+        dW_row = self.dW.reshape(G, C_out // G, -1)
+        dW_row.fill(0)
+        dW_chunk = self._buffer(ws, 'dW_chunk', dW_row.shape)
+
+        # db parcasiz yoldaki gibi (C_out, H_out*W_out*m) duzeninde tek toplamdir
+        # (bit bit ayni). dout Conv2D ciktisi gibi (C_out, H_out, W_out, m)
+        # bellegi uzerinde bir view ise reshape kopyasizdir; degilse dout
+        # boyutunda gecici bir kopya olusur (x_col'un C_out/K'si kadar).
+        dout_cols = dout.astype(dtype, copy=False).transpose(1, 2, 3, 0).reshape(C_out, -1)
+        np.sum(dout_cols, axis=1, out=self.db.reshape(-1))
+
+        H_padded, W_padded = H + 2 * self.padding, W + 2 * self.padding
+        dx_padded = self._buffer(ws, 'dx_padded', (C_in, H_padded, W_padded, m))
+
+        for start in range(0, m, chunk):
+            stop = min(start + chunk, m)
+            m_c = stop - start
+            P = HW * m_c
+
+            # Forward'daki x_col parcasini yeniden uret
+            x_col = self._chunk_buffer(ws, 'x_col_chunk', (K, P), K * HW * chunk)
+            im2col(x_padded[start:stop], kH, kW, self.stride, 0, out=x_col, dilation=self.dilation)
+
+            dout_col = self._chunk_buffer(ws, 'out_chunk', (C_out, P), C_out * HW * chunk)
+            np.copyto(dout_col.reshape(C_out, H_out, W_out, m_c), dout[start:stop].transpose(1, 2, 3, 0))
+            dout_groups = dout_col.reshape(G, -1, P)
+
+            dx_col = self._chunk_buffer(ws, 'dx_col_chunk', (K, P), K * HW * chunk)
+            self._im2col_grads(W_row, dout_groups, x_col.reshape(G, -1, P), dW_chunk,
+                               dx_col.reshape(G, -1, P))
+
+            # dW parcalar uzerinden toplanir
+            dW_row += dW_chunk
+
+            # Parcanin ornekleri dx_padded'in son ekseninde ayri bir dilimdir
+            col2im(dx_col, (m_c, C_in, H, W), kH, kW, self.stride, self.padding,
+                   out=dx_padded[..., start:stop], dilation=self.dilation)
+
+        dW_row /= m
+        self.db /= m
+
+        # (C, H, W, m) -> (m, C, H, W), padding'i kaldir
+        dx = dx_padded.transpose(3, 0, 1, 2)
+        p = self.padding
+        if p > 0:
+            return dx[:, :, p:-p, p:-p]
+        return dx
+
+    # ==========================================================================
+    # NHWC (CHANNELS-LAST) im2col
+    # ==========================================================================
+    #
+    # NCHW yolunun tersine matris carpiminda pencereler satirdadir:
+    #
+    #     out = x_col @ W_col + b^T
+    #     (m*H_out*W_out, kH*kW*C_in) @ (kH*kW*C_in, C_out) = (m*H_out*W_out, C_out)
+    #
+    # Sonuc reshape ile (m, H_out, W_out, C_out) olur - ardisik, transpose yok.
+    # Backward'da ardisik dout da kopyasiz (m*H_out*W_out, C_out) matrisidir.
+    # ==========================================================================
+
+    def _nhwc_col_buffer(self, ws, name, rows, K, capacity=None):
+        """
+        (rows, K) x_col buffer'i; az kanalda (K, rows) buffer'in transpoz view'u.
+
+        capacity verilirse mikro-batch parcalari icin _chunk_buffer kullanilir.
+        """
+        transposed = self.in_channels < self.NHWC_COLUMN_CHANNELS
+        shape = (K, rows) if transposed else (rows, K)
+        if capacity is None:
+            buf = self._buffer(ws, name, shape)
+        else:
+            buf = self._chunk_buffer(ws, name, shape, capacity)
+        return buf.T if transposed else buf
+
+    def _add_bias_nhwc(self, out, W_out):
+        """
+        (m*H_out*W_out, C_out) ciktiya bias ekle.
+
+        Satir basina C_out elemanlik yayinlama (broadcast) kisa bir ic dongudur;
+        cikti (m*H_out, W_out*C_out) olarak ve bias W_out kez yan yana
+        eklenirse ic dongu W_out*C_out uzunlugunda olur (C_out=16'da ~2x hizli).
+        """
+        rows = out.reshape(-1, W_out * self.out_channels)
+        np.add(rows, np.tile(self.b.reshape(-1).astype(out.dtype, copy=False), W_out), out=rows)
+
+    def _weight_cols(self, dtype):
+        """W'yi (kH*kW*C_in, C_out) duzenine getir (x_col satir sirasi)."""
+        return self.W.transpose(2, 3, 1, 0).reshape(-1, self.out_channels).astype(dtype)
+
+    def _forward_im2col_nhwc(self, x, ws):
+        """NHWC girdi icin im2col + matris carpimi."""
+        m, H, W, C_in = x.shape
+        kH, kW = self.kernel_size
+        H_out, W_out = self._output_size(H, W)
+
+        x_padded = self._pad_input(ws, x, channels_last=True)
+        x_col = self._nhwc_col_buffer(ws, 'x_col', m * H_out * W_out, kH * kW * C_in)
+        im2col_nhwc(x_padded, kH, kW, self.stride, out=x_col, dilation=self.dilation)
+
+        W_col = self._weight_cols(ws['dtype'])
+
+        out = self._buffer(ws, 'out', (m * H_out * W_out, self.out_channels))
+        np.dot(x_col, W_col, out=out)
+        self._add_bias_nhwc(out, W_out)
+
+        self.cache['x_col'] = self._cache_cols(ws, x_col)
+        self.cache['W_col'] = W_col
+
+        return out.reshape(m, H_out, W_out, self.out_channels)
+
+    def _backward_im2col_nhwc(self, dout):
+        """_forward_im2col_nhwc'nin geri yayilimi."""
+        x_shape = self.cache['x_shape']
+        W_col = self.cache['W_col']
+        ws = self.cache['workspace']
+        x_col = self._restore_cols(ws, self.cache['x_col'])
+
+        m, H, W, C_in = x_shape
+        kH, kW = self.kernel_size
+        C_out = self.out_channels
+
+        # Ardisik dout icin reshape kopyasizdir
+        if dout.flags.c_contiguous and dout.dtype == ws['dtype']:
+            dout_rows = dout.reshape(-1, C_out)
+        else:
+            dout_rows = self._buffer(ws, 'dout_col', (x_col.shape[0], C_out))
+            np.copyto(dout_rows.reshape(dout.shape), dout)
+
+        # dW_col = x_col^T @ dout: (kH*kW*C_in, C_out) -> (C_out, C_in, kH, kW)
+        dW_col = np.dot(x_col.T, dout_rows)
+        np.copyto(self.dW, dW_col.reshape(kH, kW, C_in, C_out).transpose(3, 2, 0, 1))
+        self.dW /= m
+
+        np.sum(dout_rows, axis=0, out=self.db.reshape(-1))
+        self.db /= m
+
+        # dx_col = dout @ W_col^T: (m*H_out*W_out, kH*kW*C_in)
+        dx_col = self._grad_cols_buffer(ws, x_col)
+        np.dot(dout_rows, W_col.T, out=dx_col)
+
+        H_padded, W_padded = H + 2 * self.padding, W + 2 * self.padding
+        dx_padded = self._buffer(ws, 'dx_padded', (m, H_padded, W_padded, C_in))
+        return col2im_nhwc(dx_col, x_shape, kH, kW, self.stride, self.padding, out=dx_padded,
+                           dilation=self.dilation)
+
+    def _forward_im2col_nhwc_chunked(self, x, ws, chunk):
+        """_forward_im2col_nhwc'nin mikro-batch hali: parca = ardisik satir blogu."""
+        m, H, W, C_in = x.shape
+        kH, kW = self.kernel_size
+        H_out, W_out = self._output_size(H, W)
+        HW = H_out * W_out
+        K = kH * kW * C_in
+
+        x_padded = self._pad_input(ws, x, channels_last=True)
+        W_col = self._weight_cols(ws['dtype'])
+        out = self._buffer(ws, 'out', (m * HW, self.out_channels))
+
+        for start in range(0, m, chunk):
+            stop = min(start + chunk, m)
+            x_col = self._nhwc_col_buffer(ws, 'x_col_chunk', (stop - start) * HW, K, HW * chunk * K)
+            im2col_nhwc(x_padded[start:stop], kH, kW, self.stride, out=x_col, dilation=self.dilation)
+            np.dot(x_col, W_col, out=out[start * HW:stop * HW])
+        self._add_bias_nhwc(out, W_out)
+
+        self.cache['x_padded'] = self._to_cache(x_padded)
+        self.cache['W_col'] = W_col
+        self.cache['chunk'] = chunk
+
+        return out.reshape(m, H_out, W_out, self.out_channels)
+
+    def _backward_im2col_nhwc_chunked(self, dout):
+        """_forward_im2col_nhwc_chunked'in geri yayilimi (ayni parcalarla)."""
+        m, H, W, C_in = self.cache['x_shape']
+        x_padded = self.cache['x_padded']
+        W_col = self.cache['W_col']
+        chunk = self.cache['chunk']
+        ws = self.cache['workspace']
+
+        kH, kW = self.kernel_size
+        C_out = self.out_channels
+        _, H_out, W_out, _ = dout.shape
+        HW = H_out * W_out
+        K = kH * kW * C_in
+
+        if dout.flags.c_contiguous and dout.dtype == ws['dtype']:
+            dout_rows = dout.reshape(-1, C_out)
+        else:
+            dout_rows = self._buffer(ws, 'dout_col', (m * HW, C_out))
+            np.copyto(dout_rows.reshape(dout.shape), dout)
+
+        dW_col = self._buffer(ws, 'dW_col', (K, C_out))
+        dW_chunk = self._buffer(ws, 'dW_chunk', (K, C_out))
+        dW_col.fill(0)
+
+        H_padded, W_padded = H + 2 * self.padding, W + 2 * self.padding
+        dx_padded = self._buffer(ws, 'dx_padded', (m, H_padded, W_padded, C_in))
+
+        for start in range(0, m, chunk):
+            stop = min(start + chunk, m)
+            rows = slice(start * HW, stop * HW)
+
+            x_col = self._nhwc_col_buffer(ws, 'x_col_chunk', (stop - start) * HW, K, HW * chunk * K)
+            im2col_nhwc(x_padded[start:stop], kH, kW, self.stride, out=x_col, dilation=self.dilation)
+
+            # dW parcalar uzerinden toplanir
+            np.dot(x_col.T, dout_rows[rows], out=dW_chunk)
+            dW_col += dW_chunk
+
+            dx_col = self._chunk_buffer(ws, 'dx_col_chunk', x_col.shape, HW * chunk * K)
+            np.dot(dout_rows[rows], W_col.T, out=dx_col)
+            col2im_nhwc(dx_col, (stop - start, H, W, C_in), kH, kW, self.stride, self.padding,
+                        out=dx_padded[start:stop], dilation=self.dilation)
+
+        np.copyto(self.dW, dW_col.reshape(kH, kW, C_in, C_out).transpose(3, 2, 0, 1))
+        self.dW /= m
+
+        np.sum(dout_rows, axis=0, out=self.db.reshape(-1))
+        self.db /= m
+
+        p = self.padding
+        if p > 0:
+            return dx_padded[:, p:-p, p:-p]
+        return dx_padded
+
+    # ==========================================================================
+    # WINOGRAD F(2x2, 3x3)
+    # ==========================================================================
+    #
+    # 3x3 kernel ve stride=1 icin carpim sayisini ~2.25x azaltir
+    # (detaylar icin layers/winograd.py). Padding im2col yolundaki gibi
+    # workspace buffer'inda uygulanir.
+    # ==========================================================================
+
+    def _supports_winograd(self):
+        return self.kernel_size == (3, 3) and self.stride == 1
+
+    def _candidate_algorithms(self):
+        """Bu katmanda calisabilecek algoritmalar."""
+        if self.groups > 1:
+            return ['im2col']
+        candidates = ['im2col', 'fft']
+        if self._supports_winograd():
+            candidates.append('winograd')
+        return candidates
+
+    def _select_algorithm(self, x):
+        """
+        Kullanilacak algoritmayi dondur.
+
+        'auto' modunda her (girdi boyutu, dtype) icin ilk cagrida adaylar
+        olculur; sonuc katmanda, autotune bellek cache'inde ve (aciksa)
+        disk cache'inde saklanir.
+        """
+        if self.algorithm != 'auto':
+            return self.algorithm
+
+        shape_key = (x.shape, x.dtype)
+        algorithm = self._tuned_algorithms.get(shape_key)
+        if algorithm is None:
+            algorithm = self._autotune(x)
+            self._tuned_algorithms[shape_key] = algorithm
+        return algorithm
+
+    def _autotune(self, x):
+        """Adaylari batch'in bir kesitiyle olcup en hizlisini sec."""
+        names = self._candidate_algorithms()
+        if len(names) == 1:
+            return names[0]
+
+        key = autotune.make_key(
+            'conv2d', x_shape=x.shape, dtype=x.dtype, out_channels=self.out_channels,
+            kernel_size=self.kernel_size, stride=self.stride, padding=self.padding,
+            dilation=self.dilation, data_format=self.data_format)
+
+        x_probe = x[:self.AUTOTUNE_BATCH]
+        candidates = {name: self._tuning_step(name, x_probe) for name in names}
+        return autotune.tune(key, candidates)
+
+    def _tuning_step(self, algorithm, x):
+        """
+        algorithm ile tek bir forward+backward adimi calistiran fonksiyon.
+
+        Olcum katmanin bir kopyasi uzerinde yapilir: asil katmanin cache,
+        workspace ve gradyanlari degismez, global random state kullanilmaz.
+        """
+        probe = copy.copy(self)
+        probe.cache = {}
+        probe.algorithm = algorithm
+        probe.use_workspace = False
+        probe.memory_budget = None
+        probe._workspaces = {}
+        probe._fft_cache = None
+        probe.dW = probe.db = None
+        probe.accumulate_grads = False
+        probe.training = True       # cikarimda secilse de forward+backward olculur
+
+        dout = None
+
+        def step():
+            nonlocal dout
+            out = probe.forward(x)
+            if dout is None:
+                dout = np.random.default_rng(0).standard_normal(out.shape).astype(out.dtype)
+            probe.backward(dout)
+
+        return step
+
+    def _forward_winograd(self, x, ws):
+        x_padded = self._pad_input(ws, x)
+        U = winograd_weights(self.W.astype(ws['dtype'], copy=False))
+
+        d = self.dilation
+        if d > 1:
+            # d*d alt izgara batch'e katlanir, her biri yogun 3x3 konvolusyon
+            x_padded = split_phases(x_padded, d)
+
+        out, V = winograd_conv2d(x_padded, U)
+        if d > 1:
+            out = merge_phases(out, d, *self._output_size(*x.shape[2:]))
+        out += self.b.reshape(1, -1, 1, 1)
+
+        self.cache['winograd_U'] = U
+        self.cache['winograd_V'] = self._to_cache(V)
+        self.cache['x_padded_shape'] = x_padded.shape
+
+        return out
+
+    def _backward_winograd(self, dout):
+        m, _, H, W = self.cache['x_shape']
+        p = self.padding
+        d = self.dilation
+
+        dout_tiles = split_phases(dout, d) if d > 1 else dout
+        dx, dU = winograd_conv2d_backward(
+            dout_tiles, self.cache['winograd_V'], self.cache['winograd_U'], self.cache['x_padded_shape'])
+        if d > 1:
+            dx = merge_phases(dx, d, H + 2 * p, W + 2 * p)
+
+        np.copyto(self.dW, winograd_weight_grad(dU))
+        self.dW /= m
+        np.sum(dout, axis=(0, 2, 3), out=self.db.reshape(-1))
+        self.db /= m
+
+        if p > 0:
+            return dx[:, :, p:-p, p:-p]
+        return dx
+
+    # ==========================================================================
+    # FFT KONVOLUSYONU
+    # ==========================================================================
+    #
+    # Buyuk kernel'larda x_col'u hic olusturmadan frekans uzayinda calisir
+    # (detaylar icin layers/fft_conv.py). Kernel spektrumu, agirliklar
+    # degismedigi surece adimlar arasinda (ve forward -> backward arasinda)
+    # yeniden kullanilir. Girdi spektrumu karmasiktir; NumPy'da yarim
+    # hassasiyetli karmasik tip olmadigi icin cache_dtype burada uygulanmaz.
+    # ==========================================================================
+
+    def _kernel_spectrum(self, fft_size, dtype):
+        """Kernel spektrumunu dondur; W degismediyse cache'ten."""
+        cache = self._fft_cache
+        if (cache is not None and cache['size'] == fft_size and cache['dtype'] == dtype
+                and np.array_equal(cache['W'], self.W)):
+            return cache['K']
+
+        K = fft_kernel_spectrum(self.W.astype(dtype, copy=False), fft_size, self.dilation)
+        self._fft_cache = {'size': fft_size, 'dtype': dtype, 'W': self.W.copy(), 'K': K}
+        return K
+
+    def _forward_fft(self, x, ws):
+        x_padded = self._pad_input(ws, x)
+        K = self._kernel_spectrum(x_padded.shape[2:], ws['dtype'])
+
+        out, X = fft_conv2d(x_padded, K, self.kernel_size, self.stride, self.dilation)
+        out += self.b.reshape(1, -1, 1, 1)
+
+        self.cache['fft_X'] = X
+        self.cache['fft_K'] = K
+        self.cache['x_padded_shape'] = x_padded.shape
+
+        return out
+
+    def _backward_fft(self, dout):
+        m = self.cache['x_shape'][0]
+        p = self.padding
+
+        dx, dW = fft_conv2d_backward(
+            dout, self.cache['fft_X'], self.cache['fft_K'], self.cache['x_padded_shape'],
+            self.kernel_size, self.stride, self.dilation)
+
+        np.copyto(self.dW, dW)
+        self.dW /= m
+        np.sum(dout, axis=(0, 2, 3), out=self.db.reshape(-1))
+        self.db /= m
+
+        if p > 0:
+            return dx[:, :, p:-p, p:-p]
+        return dx
+
+    # ==========================================================================
+    # WORKSPACE (bkz. Layer)
+    # ==========================================================================
+    #
+    # Workspace girdi boyutu (x.shape) basinadir: x_col, dout, dx_col ve
+    # padding buffer'lari burada tutulur.
+    # ==========================================================================
+
+    def _pad_input(self, ws, x, channels_last=False):
+        """
+        x'i kenarlari sifir olan padding buffer'ina kopyala.
+
+        Kenarlar hic yazilmadigi icin buffer bir kez sifirlanir; sonraki
+        adimlarda sadece ic kisim kopyalanir.
+
+        channels_last=True ise x (m, H, W, C) duzenindedir.
+        """
+        p = self.padding
+        if p == 0:
+            return x
+
+        if channels_last:
+            m, H, W, C = x.shape
+            shape, inner = (m, H + 2 * p, W + 2 * p, C), (slice(None), slice(p, -p), slice(p, -p))
+        else:
+            m, C, H, W = x.shape
+            shape, inner = (m, C, H + 2 * p, W + 2 * p), (slice(None), slice(None), slice(p, -p), slice(p, -p))
+
+        x_padded = ws.get('x_padded')
+        if x_padded is None:
+            x_padded = np.zeros(shape, dtype=ws['dtype'])
+            if ws['persistent']:
+                ws['x_padded'] = x_padded
+        np.copyto(x_padded[inner], x)
+        return x_padded
+
+    def _cache_cols(self, ws, x_col):
+        """
+        x_col'u backward icin cache'e koyulacak hale getir.
+
+        Karisik hassasiyette matris carpimlari float32 x_col buffer'i ile
+        yapilir; cache'e sadece float16 kopyasi konur. float16 x_col'u
+        dogrudan np.matmul'a vermek her cagrida tam boy float32 gecici dizi
+        ayirir (cache kuculur ama tepe bellek ve adim suresi artar).
+        """
+        if self.cache_dtype is None or not self.training:
+            return x_col
+        cached = ws.get('x_col_cache')
+        if cached is None:
+            cached = np.empty_like(x_col, dtype=self.cache_dtype)  # ayni bellek duzeni
+            if ws['persistent']:
+                ws['x_col_cache'] = cached
+        np.copyto(cached, x_col)
+        ws['x_col_matmul'] = x_col
+        return cached
+
+    def _restore_cols(self, ws, x_col):
+        """_cache_cols'un tersi: float16 kopyayi forward'in float32 buffer'ina geri yaz."""
+        if x_col.dtype == ws['dtype']:
+            return x_col
+        buf = ws['x_col_matmul']
+        np.copyto(buf, x_col)
+        return buf
+
+    def _grad_cols_buffer(self, ws, x_col):
+        """
+        dx_col buffer'i.
+
+        Karisik hassasiyette x_col zaten _restore_cols'un float32 kopyasidir ve
+        dW hesaplandiktan sonra kullanilmaz; dx_col ayni bellege yazilir.
+        """
+        if x_col is ws.get('x_col_matmul') and x_col.flags.c_contiguous:
+            return x_col
+        return self._buffer(ws, 'dx_col', x_col.shape)
+
+    def set_dtype(self, dtype):
+        """Parametreleri dtype'a cevir; eski dtype'in FFT kernel cache'i de birakilir."""
+        super().set_dtype(dtype)
+        self._fft_cache = None
+        return self
+
     def get_params(self):
         return {'W': self.W, 'b': self.b}
 
@@ -499,7 +1480,119 @@ class Conv2D(Layer):
         return {'dW': self.dW, 'db': self.db}
 
     def __repr__(self):
-        return f"Conv2D({self.in_channels}, {self.out_channels}, kernel_size={self.kernel_size}, stride={self.stride}, padding={self.padding})"
+        return (f"Conv2D({self.in_channels}, {self.out_channels}, kernel_size={self.kernel_size}, "
+                f"stride={self.stride}, padding={self.padding}, algorithm='{self.algorithm}', "
+                f"data_format='{self.data_format}', groups={self.groups}, dilation={self.dilation})")
+
+
+# ==============================================================================
+# DEPTHWISE-SEPARABLE KONVOLUSYON (MobileNet)
+# ==============================================================================
+#
+# Standart 3x3 konvolusyon kanal karisimini ve uzamsal filtrelemeyi tek
+# adimda yapar:
+#
+#     Conv2D(C_in, C_out, 3):      C_in * C_out * 9   carpim / konum
+#
+# Depthwise-separable bunu iki ucuz adima boler:
+#
+#     DepthwiseConv2D(C_in, 3):    C_in * 9           carpim / konum
+#     PointwiseConv2D(C_in, C_out): C_in * C_out      carpim / konum
+#
+# Ornek: C_in = C_out = 64 -> 36864 yerine 576 + 4096 = 4672 (~7.9x az).
+#
+# Depthwise, groups=C_in olan Conv2D'dir: x_col (C_in, kH*kW, P) olarak
+# gruplanir ve her kanal kendi kH*kW agirligiyla tek batched matmul'da
+# carpilir (Python dongusu yok).
+# ==============================================================================
+
+class DepthwiseConv2D(Conv2D):
+    """
+    Depthwise Konvolusyon - her girdi kanali kendi filtresiyle.
+
+    Args:
+        in_channels: Girdi kanal sayisi
+        kernel_size: Filtre boyutu (int veya tuple)
+        depth_multiplier: Kanal basina cikti sayisi (default=1)
+        Diger argumanlar Conv2D ile ayni.
+
+    Boyutlar:
+        Input:  (m, C, H, W)
+        Output: (m, C * depth_multiplier, H_out, W_out)
+        Kernel: (C * depth_multiplier, 1, kH, kW)
+
+    Ornek:
+        dw = DepthwiseConv2D(32, kernel_size=3, padding=1)
+        pw = PointwiseConv2D(32, 64)
+        out = pw.forward(dw.forward(x))  # (m, 32, H, W) -> (m, 64, H, W)
+    """
+
+    def __init__(self, in_channels, kernel_size, depth_multiplier=1, stride=1, padding=0, seed=None,
+                 use_workspace=True, data_format='NCHW', dilation=1):
+        super().__init__(in_channels, in_channels * depth_multiplier, kernel_size, stride, padding, seed,
+                         use_workspace, algorithm='im2col', data_format=data_format, groups=in_channels,
+                         dilation=dilation)
+        self.depth_multiplier = depth_multiplier
+
+    def __repr__(self):
+        return (f"DepthwiseConv2D({self.in_channels}, kernel_size={self.kernel_size}, "
+                f"depth_multiplier={self.depth_multiplier}, stride={self.stride}, "
+                f"padding={self.padding}, dilation={self.dilation}, data_format='{self.data_format}')")
+
+
+class PointwiseConv2D(Conv2D):
+    """
+    Pointwise (1x1) Konvolusyon - sadece kanal karisimi.
+
+    Depthwise konvolusyonun ardindan kanallari birlestirmek icin kullanilir.
+
+    Args:
+        in_channels: Girdi kanal sayisi
+        out_channels: Cikti kanal sayisi
+        Diger argumanlar Conv2D ile ayni.
+
+    Boyutlar:
+        Input:  (m, C_in, H, W)
+        Output: (m, C_out, H, W)
+    """
+
+    def __init__(self, in_channels, out_channels, seed=None, use_workspace=True, data_format='NCHW',
+                 groups=1):
+        super().__init__(in_channels, out_channels, 1, seed=seed, use_workspace=use_workspace,
+                         algorithm='im2col', data_format=data_format, groups=groups)
+
+    def __repr__(self):
+        return (f"PointwiseConv2D({self.in_channels}, {self.out_channels}, "
+                f"data_format='{self.data_format}', groups={self.groups})")
+
+
+def pool_windows(x, pH, pW, stride):
+    """
+    Pooling pencerelerini kopyasiz bir view olarak dondur.
+
+    Args:
+        x: Girdi tensoru (m, C, H, W)
+        pH: Pencere yuksekligi
+        pW: Pencere genisligi
+        stride: Adim boyutu
+
+    Returns:
+        windows: (m, C, H_out, W_out, pH, pW) view
+    """
+    m, C, H, W = x.shape
+    H_out = (H - pH) // stride + 1
+    W_out = (W - pW) // stride + 1
+
+    s = x.strides
+    shape = (m, C, H_out, W_out, pH, pW)
+    strides = (s[0], s[1], s[2] * stride, s[3] * stride, s[2], s[3])
+
+    return np.lib.stride_tricks.as_strided(x, shape=shape, strides=strides, writeable=False)
+
+
+def _index_dtype(n):
+    """0..n-1 araligini tutabilecek en kucuk unsigned integer tipi."""
+    return np.uint8 if n <= 256 else np.uint16 if n <= 65536 else np.uint32
 
 
 # ==============================================================================
@@ -530,26 +1623,38 @@ class MaxPool2D(Layer):
     Args:
         pool_size: Pooling pencere boyutu (default=2)
         stride: Adim boyutu (default=pool_size)
+        data_format: 'NCHW' (default) veya 'NHWC' (bkz. Conv2D)
 
     Boyutlar:
-        Input:  (m, C, H, W)
-        Output: (m, C, H//pool_size, W//pool_size)
+        Input:  (m, C, H, W)  veya NHWC: (m, H, W, C)
+        Output: (m, C, H//pool_size, W//pool_size)  veya NHWC: (m, H//p, W//p, C)
+
+    Hizli yol:
+        stride == pool_size ve H, W pool_size'a tam bolunuyorsa pencereler
+        ortusmez ve girdiyi tam kaplar. Bu durumda pencere view'u yerine
+        pencere ici her ofset icin stride'li bir dilim kullanilir
+        (bkz. _forward_tiled).
 
     Ornek:
         pool = MaxPool2D(pool_size=2)
         out = pool.forward(x)  # x: (m, 32, 26, 26) -> out: (m, 32, 13, 13)
     """
 
-    def __init__(self, pool_size=2, stride=None):
+    def __init__(self, pool_size=2, stride=None, data_format='NCHW'):
         super().__init__()
         self.pool_size = pool_size
         self.stride = stride if stride is not None else pool_size
 
+        if data_format not in Conv2D.DATA_FORMATS:
+            raise ValueError(f"Bilinmeyen data_format: {data_format}. Secenekler: {Conv2D.DATA_FORMATS}")
+        self.data_format = data_format
+
     def forward(self, x):
         """
-        Max pooling islemi.
+        Max pooling islemi (pencere view'u ile, Python dongusu yok).
 
-        Her pencerede maksimum degeri secer.
+        Her pencerede maksimum degeri secer ve backward icin pencere ici
+        argmax indekslerini saklar.
 
         Args:
             x: Girdi (m, C, H, W)
@@ -557,28 +1662,40 @@ class MaxPool2D(Layer):
         Returns:
             out: Cikti (m, C, H_out, W_out)
         """
+        if self.data_format == 'NHWC':
+            return self._forward_nhwc(x)
+
         m, C, H, W = x.shape  # (32, 16, 26, 26)
         pH = pW = self.pool_size  # 2
 
+        if self._is_tiling(H, W):
+            return self._forward_tiled(x)
+
         H_out = (H - pH) // self.stride + 1  # 13
         W_out = (W - pW) // self.stride + 1  # 13
 
-        out = np.zeros((m, C, H_out, W_out))  # (32, 16, 13, 13)
+        # =======================================================================
+        # PENCERE VIEW'U (im2col ile ayni stride trick)
+        # (m, C, H_out, W_out, pH, pW) - bellek kopyalanmaz
+        # Son iki boyut pencere ici konum, onceki iki boyut pencere konumu
+        # =======================================================================
+        windows = pool_windows(x, pH, pW, self.stride)
+
+        # Pencereyi duzlestir: (m, C, H_out, W_out, pH*pW) = (32, 16, 13, 13, 4)
+        windows = windows.reshape(m, C, H_out, W_out, pH * pW)
 
-        for i in range(H_out):
-            for j in range(W_out):
-                h_start = i * self.stride
-                h_end = h_start + pH
-                w_start = j * self.stride
-                w_end = w_start + pW
+        if not self.training:
+            return windows.max(axis=-1)
 
-                # 2x2 pencere al: (32, 16, 2, 2)
-                x_slice = x[:, :, h_start:h_end, w_start:w_end]
+        # Pencere ici argmax (0..pH*pW-1) - kompakt tipte saklanir
+        argmax = np.argmax(windows, axis=-1).astype(_index_dtype(pH * pW))
 
-                # Her pencerede max bul
-                out[:, :, i, j] = np.max(x_slice, axis=(2, 3))
+        # Max degerleri argmax'tan oku: (32, 16, 13, 13)
+        out = np.take_along_axis(windows, argmax[..., None].astype(np.intp), axis=-1)[..., 0]
 
-        self.cache['x'] = x
+        self.cache['x_shape'] = x.shape
+        self.cache['argmax'] = argmax
+        self.cache['tiled'] = False
 
         return out
 
@@ -596,6 +1713,7 @@ class MaxPool2D(Layer):
                          0  aksi halde
 
         Gradyan sadece maksimum degerin konumuna iletilir.
+        Esit maksimumlar varsa gradyan sadece ilkine (argmax) gider.
 
         GORSEL:
             Forward:                         Backward:
@@ -604,6 +1722,9 @@ class MaxPool2D(Layer):
             +----+----+                      +----+----+
             | 5  | 6* |  (* = max konum)     | 0  |0.5 | <- gradyan sadece max'a
             +----+----+                      +----+----+
+
+        Forward'da saklanan argmax ile her cikti konumunun girdideki duz
+        (flat) indeksi hesaplanir ve dout tek seferde dx'e dagitilir.
         =========================================================================
 
         Args:
@@ -612,39 +1733,172 @@ class MaxPool2D(Layer):
         Returns:
             dx: Onceki katmana iletilecek gradyan (m, C, H, W)
         """
-        x = self.cache['x']
-        m, C, H, W = x.shape  # (32, 16, 26, 26)
-        pH = pW = self.pool_size  # 2
+        if self.data_format == 'NHWC':
+            return self._backward_nhwc(dout)
+        if self.cache['tiled']:
+            return self._backward_tiled(dout)
+
+        x_shape = self.cache['x_shape']
+        argmax = self.cache['argmax']
+        m, C, H, W = x_shape  # (32, 16, 26, 26)
+        pW = self.pool_size  # 2
         _, _, H_out, W_out = dout.shape  # (32, 16, 13, 13)
 
-        dx = np.zeros_like(x)  # (32, 16, 26, 26)
+        # =======================================================================
+        # DUZ INDEKS HESABI
+        # Pencere (i, j) girdide (i*stride, j*stride) konumundan baslar.
+        # Pencere ici argmax k -> satir ofseti k // pW, sutun ofseti k % pW
+        # =======================================================================
+        rows = np.arange(H_out) * self.stride  # (H_out,)
+        cols = np.arange(W_out) * self.stride  # (W_out,)
+        window_start = rows[:, None] * W + cols[None, :]  # (H_out, W_out)
+
+        # Her (n, c) duzleminin baslangic indeksi: (m, C, 1, 1)
+        plane_start = (np.arange(m * C) * (H * W)).reshape(m, C, 1, 1)
+
+        argmax = argmax.astype(np.intp)
+        flat_idx = plane_start + window_start + (argmax // pW) * W + argmax % pW
+
+        dx = np.zeros(m * C * H * W, dtype=dout.dtype)
+
+        if self.stride >= self.pool_size:
+            # Pencereler ortusmuyor -> her indeks tek bir kez gecer
+            dx[flat_idx.ravel()] = dout.ravel()
+        else:
+            # Ortusen pencereler ayni konumu secebilir -> topla
+            np.add.at(dx, flat_idx.ravel(), dout.ravel())
 
-        for i in range(H_out):
-            for j in range(W_out):
-                h_start = i * self.stride
-                h_end = h_start + pH
-                w_start = j * self.stride
-                w_end = w_start + pW
+        return dx.reshape(x_shape)
 
-                # 2x2 pencere al: (32, 16, 2, 2)
-                x_slice = x[:, :, h_start:h_end, w_start:w_end]
+    # ==========================================================================
+    # HIZLI YOL: ORTUSMEYEN, TAM KAPLAYAN PENCERELER
+    # ==========================================================================
+    #
+    # stride == p ve H % p == 0, W % p == 0 ise (orn: 26x26 -> 13x13)
+    # pencere ici her ofset (r, c) icin
+    #
+    #     x[:, :, r::p, c::p]     (m, C, H/p, W/p)
+    #
+    # tum pencerelerin o konumdaki degerlerini verir; p*p ofset uzerinden
+    # tam boy dizilerle max ve argmax tutulur.
+    #
+    # Dilimler girdinin bellek duzeninden bagimsiz olarak view'dur.
+    # (m, C, H/p, p, W/p, p) reshape'i ise sadece ardisik girdide kopyasizdir;
+    # Conv2D'nin dondurdugu NCHW view'unda (bkz. Flatten) tum girdiyi sessizce
+    # kopyalardi.
+    # ==========================================================================
+
+    def _is_tiling(self, H, W):
+        """Pencereler girdiyi ortusmeden ve artiksiz kapliyor mu?"""
+        p = self.pool_size
+        return self.stride == p and H % p == 0 and W % p == 0
+
+    def _forward_tiled(self, x):
+        """Ofset dilimleriyle max pooling (bkz. _is_tiling)."""
+        p = self.pool_size
+
+        # Ilk ofsetle basla, sonra her ofsette daha buyukse guncelle.
+        # Esitlikte (>) ilk konum korunur - genel yoldaki argmax ile ayni.
+        out = x[:, :, 0::p, 0::p].copy()
+        if not self.training:
+            # Cikarim: argmax gerekmez, sadece max
+            for k in range(1, p * p):
+                np.maximum(out, x[:, :, k // p::p, k % p::p], out=out)
+            return out
+
+        argmax = np.zeros(out.shape, dtype=_index_dtype(p * p))
+        for k in range(1, p * p):
+            values = x[:, :, k // p::p, k % p::p]
+            better = np.greater(values, out)
+            np.maximum(out, values, out=out)
+            argmax[better] = k
+
+        self.cache['x_shape'] = x.shape
+        self.cache['argmax'] = argmax
+        self.cache['tiled'] = True
 
-                # Max degerini bul: (32, 16, 1, 1)
-                max_vals = np.max(x_slice, axis=(2, 3), keepdims=True)
+        return out
+
+    def _backward_tiled(self, dout):
+        """Her pencere ici ofset icin dout'u argmax maskesiyle yerlestir."""
+        m, C, H, W = self.cache['x_shape']
+        argmax = self.cache['argmax']
+        p = self.pool_size
 
-                # Max konumlarinin maskesi (boolean): (32, 16, 2, 2)
-                # True sadece max degerin oldugu yerde
-                mask = (x_slice == max_vals)
+        # Her konum tam olarak bir ofsete ait -> np.zeros gerekmez
+        dx = np.empty((m, C, H // p, p, W // p, p), dtype=dout.dtype)
+        for k in range(p * p):
+            np.multiply(dout, argmax == k, out=dx[:, :, :, k // p, :, k % p])
 
-                # Gradyani sadece max konumuna ilet
-                # dout[:,:,i,j] shape: (32, 16)
-                # [:,:,None,None] ile (32, 16, 1, 1) yapiyoruz -> broadcast
-                dx[:, :, h_start:h_end, w_start:w_end] += mask * dout[:, :, i, j][:, :, None, None]
+        return dx.reshape(m, C, H, W)
+
+    # ==========================================================================
+    # NHWC (CHANNELS-LAST)
+    # ==========================================================================
+    #
+    # Hizli yoldaki ofset dongusu, reshape yerine stride'li dilimlerle her
+    # stride/pool_size icin calisir:
+    #
+    #     ofset (r, c) -> x[:, r::stride, c::stride, :]   (H_out x W_out konum)
+    #
+    # Kanal ekseni en icte oldugu icin her dilimin satirlari ardisik C
+    # degerden olusur; pencere view'u veya kopya gerekmez.
+    # ==========================================================================
+
+    def _offset_slices(self, r, c, H_out, W_out):
+        """Pencere ici (r, c) ofsetinin tum pencerelerdeki konumlari."""
+        s = self.stride
+        return (slice(None), slice(r, r + s * (H_out - 1) + 1, s),
+                slice(c, c + s * (W_out - 1) + 1, s), slice(None))
+
+    def _forward_nhwc(self, x):
+        """NHWC girdi icin ofset dongusuyle max pooling."""
+        m, H, W, C = x.shape
+        p = self.pool_size
+        H_out = (H - p) // self.stride + 1
+        W_out = (W - p) // self.stride + 1
+
+        out = x[self._offset_slices(0, 0, H_out, W_out)].copy()
+        if not self.training:
+            for k in range(1, p * p):
+                np.maximum(out, x[self._offset_slices(k // p, k % p, H_out, W_out)], out=out)
+            return out
+
+        argmax = np.zeros(out.shape, dtype=_index_dtype(p * p))
+        for k in range(1, p * p):
+            values = x[self._offset_slices(k // p, k % p, H_out, W_out)]
+            better = np.greater(values, out)
+            np.maximum(out, values, out=out)
+            argmax[better] = k
+
+        self.cache['x_shape'] = x.shape
+        self.cache['argmax'] = argmax
+        self.cache['tiled'] = self._is_tiling(H, W)
+
+        return out
+
+    def _backward_nhwc(self, dout):
+        """Her ofset icin dout'u argmax maskesiyle dx'e yerlestir."""
+        m, H, W, C = self.cache['x_shape']
+        argmax = self.cache['argmax']
+        p = self.pool_size
+        _, H_out, W_out, _ = dout.shape
+
+        if self.cache['tiled']:
+            # Her konum tam olarak bir ofsete ait -> atama yeterli
+            dx = np.empty((m, H, W, C), dtype=dout.dtype)
+            for k in range(p * p):
+                np.multiply(dout, argmax == k, out=dx[self._offset_slices(k // p, k % p, H_out, W_out)])
+        else:
+            # Ortusen pencereler veya kapsanmayan kenarlar -> sifirla ve topla
+            dx = np.zeros((m, H, W, C), dtype=dout.dtype)
+            for k in range(p * p):
+                dx[self._offset_slices(k // p, k % p, H_out, W_out)] += dout * (argmax == k)
 
         return dx
 
     def __repr__(self):
-        return f"MaxPool2D(pool_size={self.pool_size}, stride={self.stride})"
+        return f"MaxPool2D(pool_size={self.pool_size}, stride={self.stride}, data_format='{self.data_format}')"
 
 
 # ==============================================================================
@@ -660,6 +1914,14 @@ class MaxPool2D(Layer):
 # NOT: Dense katmanlar (features, samples) formati bekliyor,
 #      bu yuzden transpose yapiliyor.
 #
+# BELLEK DUZENI:
+#     Ayni (C*H*W, m) sonucu iki yoldan elde edilebilir:
+#         x.reshape(m, -1).T               - x ardisik ise kopyasiz (NHWC)
+#         moveaxis(x, 0, -1).reshape(-1, m) - x, (C, H, W, m) bellegi uzerinde
+#                                            bir view ise kopyasiz (NCHW Conv2D)
+#     Flatten girdinin bellek duzenine bakip kopyasiz olani secer. Katman
+#     duzenden bagimsizdir: NHWC girdide ozellik sirasi (H, W, C) olur.
+#
 # ==============================================================================
 
 class Flatten(Layer):
@@ -669,7 +1931,7 @@ class Flatten(Layer):
     Conv/Pool ciktilarini Dense katmana baglamak icin kullanilir.
 
     Boyutlar:
-        Input:  (m, C, H, W)
+        Input:  (m, C, H, W)  veya NHWC: (m, H, W, C)
         Output: (C*H*W, m)  <- Dense katman formatina uygun (features, samples)
 
     Ornek:
@@ -687,12 +1949,17 @@ class Flatten(Layer):
         Returns:
             out: Cikti (C*H*W, m) = (2704, 32)
         """
-        self.cache['input_shape'] = x.shape
+        if self.training:
+            self.cache['input_shape'] = x.shape
         m = x.shape[0]
 
         # (m, C, H, W) -> (m, C*H*W) -> (C*H*W, m)
         # (32, 16, 13, 13) -> (32, 2704) -> (2704, 32)
-        out = x.reshape(m, -1).T
+        if x.flags.c_contiguous:
+            out = x.reshape(m, -1).T
+        else:
+            # Ornek ekseni bellekte en icte olabilir (Conv2D NCHW ciktisi)
+            out = np.moveaxis(x, 0, -1).reshape(-1, m)
 
         return out
 
@@ -712,7 +1979,11 @@ class Flatten(Layer):
 
         # (C*H*W, m) -> (m, C*H*W) -> (m, C, H, W)
         # (2704, 32) -> (32, 2704) -> (32, 16, 13, 13)
-        dx = dout.T.reshape(input_shape)
+        if dout.flags.c_contiguous:
+            # (C*H*W, m) -> (C, H, W, m) kopyasiz, ornek eksenini one al
+            dx = np.moveaxis(dout.reshape(input_shape[1:] + (input_shape[0],)), -1, 0)
+        else:
+            dx = dout.T.reshape(input_shape)
 
         return dx
 
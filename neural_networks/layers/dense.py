@@ -16,10 +16,16 @@ Boyutlar:
     z:    (n_out, m)
     dout: (n_out, m)  - sonraki katmandan gelen gradyan
     dx:   (n_in, m)   - onceki katmana iletilecek gradyan
+
+Workspace:
+    z ve dx icin batch boyutu basina buffer tutulur; dW ve db tek sefer
+    ayrilir. Matris carpimlari np.dot(..., out=) ile bu buffer'lara yazilir,
+    bias ve 1/m olcegi yerinde uygulanir. Sabit batch boyutuyla egitimde
+    Dense her adimda yeni dizi ayirmaz.
 """
 
 import numpy as np
-from .base import Layer
+from .base import Layer, get_default_dtype
 
 
 class Dense(Layer):
@@ -30,6 +36,17 @@ class Dense(Layer):
         n_in: Girdi boyutu
         n_out: Cikti boyutu (noron sayisi)
         seed: Random seed (tekrarlanabilirlik icin)
+        use_workspace: Cikti ve gradyan buffer'larini batch boyutu basina
+            saklayip yeniden kullan (default=True). False ise her cagrida
+            yeni diziler ayrilir.
+
+    Workspace:
+        forward() ciktisi ve backward()'in dondurdugu dx workspace
+        buffer'laridir; ayni batch boyutuyla yapilan bir sonraki cagrida
+        uzerine yazilir (Sequential.forward son katmanin ciktisini
+        kopyalar). Son kullanilan MAX_WORKSPACES batch boyutunun
+        buffer'lari tutulur; eval()/no_grad() bunlari birakmaz,
+        clear_workspace() birakir.
 
     Ornek:
         layer = Dense(784, 128)
@@ -37,17 +54,19 @@ class Dense(Layer):
         dx = layer.backward(dout)   # dout: (128, m)
     """
 
-    def __init__(self, n_in, n_out, seed=None):
+    def __init__(self, n_in, n_out, seed=None, use_workspace=True):
         super().__init__()
         self.n_in = n_in
         self.n_out = n_out
+        self.use_workspace = use_workspace
 
         # He initialization
         if seed is not None:
             np.random.seed(seed)
 
-        self.W = np.random.randn(n_out, n_in) * np.sqrt(2.0 / n_in)
-        self.b = np.zeros((n_out, 1))
+        dtype = get_default_dtype()
+        self.W = (np.random.randn(n_out, n_in) * np.sqrt(2.0 / n_in)).astype(dtype)
+        self.b = np.zeros((n_out, 1), dtype=dtype)
 
         # Gradyanlar (backward'da hesaplanacak)
         self.dW = None
@@ -58,14 +77,27 @@ class Dense(Layer):
         Ileri yayilim: z = W · x + b
 
         Args:
-            x: Girdi (n_in, m)
+            x: Girdi (n_in, m) - parametre dtype'ina cevrilir
 
         Returns:
             z: Cikti (n_out, m)
         """
-        self.cache['x'] = x
-
-        z = np.dot(self.W, x) + self.b
+        x = x.astype(self.W.dtype, copy=False)
+        ws = self._get_workspace(x.shape[1], self.W.dtype)
+
+        if self.training:
+            if self.cache_dtype is None:
+                self.cache['x'] = x
+            else:
+                # Karisik hassasiyet: float16 kopya da buffer'a yazilir
+                x_cache = self._buffer(ws, 'x_cache', x.shape, self.cache_dtype)
+                np.copyto(x_cache, x)
+                self.cache['x'] = x_cache
+            self.cache['workspace'] = ws
+
+        z = self._buffer(ws, 'z', (self.n_out, x.shape[1]))
+        np.matmul(self.W, x, out=z)
+        np.add(z, self.b, out=z)
         return z
 
     def backward(self, dout):
@@ -79,14 +111,40 @@ class Dense(Layer):
             dx: Onceki katmana iletilecek gradyan (n_in, m)
         """
         x = self.cache['x']
+        ws = self.cache['workspace']
         m = x.shape[1]
-
-        # Parametre gradyanlari
-        self.dW = (1 / m) * np.dot(dout, x.T)
-        self.db = (1 / m) * np.sum(dout, axis=1, keepdims=True)
+        dtype = self.W.dtype
+        dout = dout.astype(dtype, copy=False)
+
+        # Gradyan dizileri bir kez ayrilir (dtype degisirse yeniden)
+        if self.dW is None or self.dW.dtype != dtype:
+            self.dW = np.empty_like(self.W)
+            self.db = np.empty_like(self.b)
+
+        # Biriktirmede batch ortalamasi gecici buffer'lara yazilip eklenir
+        accumulate = self._accumulating()
+        if accumulate:
+            dW = self._buffer(ws, 'dW_batch', self.W.shape)
+            db = self._buffer(ws, 'db_batch', self.b.shape)
+        else:
+            dW, db = self.dW, self.db
+
+        # Parametre gradyanlari (float16 cache'li x carpimda float32'ye cevrilir)
+        # 1/m ayri bir dizi olusturmadan yerinde uygulanir (dW kucuk: n_out x n_in)
+        np.matmul(dout, x.T, out=dW)
+        dW *= 1.0 / m
+        np.sum(dout, axis=1, keepdims=True, out=db)
+        db *= 1.0 / m
+
+        if accumulate:
+            self._merge_grads((dW, db), m)
+        else:
+            self.grad_samples = m
 
         # Onceki katmana iletilecek gradyan
-        dx = np.dot(self.W.T, dout)
+        # np.dot(W.T, ..., out=) transpoz W ile m=10000'de ~%20 yavas; matmul degil
+        dx = self._buffer(ws, 'dx', (self.n_in, m))
+        np.matmul(self.W.T, dout, out=dx)
 
         return dx
 
@@ -0,0 +1,175 @@
+"""
+FFT Konvolusyonu
+================
+Buyuk kernel'lar (7x7, 11x11...) icin frekans uzayinda konvolusyon.
+
+Boyut notasyonu: (batch, channels, height, width) - NCHW format
+
+================================================================================
+FIKIR
+================================================================================
+
+im2col her pencereyi bir sutuna acar: x_col boyutu kH*kW ile buyur.
+11x11 kernel'da girdinin 121 kopyasi olusur.
+
+Konvolusyon teoremi: uzayda konvolusyon = frekansta eleman bazli carpim.
+
+    x (*) k  =  irfft2( rfft2(x) * rfft2(k) )
+
+FFT boyutu padding uygulanmis girdi boyutu (Hp, Wp) secilir. Bu durumda
+carpim DAIRESEL konvolusyon verir; ama gecerli (valid) cikti bolgesi
+kenarlardan tasmadigi icin sonuc normal konvolusyonla aynidir.
+
+Conv2D aslinda korelasyon yapar (kernel ters cevrilmeden kayar). Bu yuzden
+kernel once 180 derece cevrilir (kf), sonra konvolusyon alinir:
+
+    z = x (*) kf               (dairesel, Hp x Wp)
+    y[i, j] = z[i*s + kH-1, j*s + kW-1]
+
+Cok kanalli durumda her frekans (u, v) icin kanal karisimi bir matris
+carpimidir:
+
+    Z[u,v] = X[u,v] @ K[u,v]
+    (m, C_in) @ (C_in, C_out) = (m, C_out)
+
+================================================================================
+GERI YAYILIM
+================================================================================
+
+Dairesel konvolusyonun eslenigi (adjoint) dairesel korelasyondur; frekansta
+karmasik eslenik (conj) ile carpim demektir:
+
+    dX[u,v] = dZ[u,v] @ conj(K[u,v])^T        -> dx = irfft2(dX)
+    dK[u,v] = conj(X[u,v])^T @ dZ[u,v]        -> dkf = irfft2(dK)[:kH, :kW]
+
+Tum frekans dizileri (u, v, ...) duzeninde tutulur: FFT ilk iki eksende
+alinir, kanal karisimi da frekans basina bir matris carpimi olur.
+
+================================================================================
+DILATION
+================================================================================
+
+Dilation d'li kernel, elemanlari arasina d-1 sifir konmus (d*(k-1) + 1)
+boyutlu yogun kernel'dir. FFT boyutu girdiye bagli oldugu icin buyuk kernel
+ek maliyet getirmez: spektrum bu genisletilmis kernel'dan alinir, dW de
+genisletilmis kernel gradyaninin d adimli orneklerinden okunur.
+================================================================================
+"""
+
+import numpy as np
+
+
+def dilated_size(kernel_size, dilation):
+    """Dilation'li kernel'in kapladigi alan (kH_eff, kW_eff)."""
+    kH, kW = kernel_size
+    return dilation * (kH - 1) + 1, dilation * (kW - 1) + 1
+
+
+def fft_kernel_spectrum(W, fft_size, dilation=1):
+    """
+    Ters cevrilmis kernel'in spektrumu.
+
+    Args:
+        W: Kernel (C_out, C_in, kH, kW)
+        fft_size: (Hp, Wp) FFT boyutu
+        dilation: Kernel elemanlari arasindaki adim (default=1)
+
+    Returns:
+        K: (Hp * (Wp//2 + 1), C_in, C_out) - frekans basina bir matris
+    """
+    C_out, C_in = W.shape[:2]
+
+    if dilation > 1:
+        # Elemanlar arasina sifir koyarak yogun kernel'a genislet
+        W_dilated = np.zeros((C_out, C_in) + dilated_size(W.shape[2:], dilation), dtype=W.dtype)
+        W_dilated[:, :, ::dilation, ::dilation] = W
+        W = W_dilated
+
+    # 180 derece cevir ve (kH, kW, C_in, C_out) duzenine getir
+    kf = W[:, :, ::-1, ::-1].transpose(2, 3, 1, 0)
+
+    K = np.fft.rfft2(kf, s=fft_size, axes=(0, 1))    # (Hp, Wr, C_in, C_out)
+    return K.reshape(-1, C_in, C_out)
+
+
+def fft_conv2d(x, K, kernel_size, stride=1, dilation=1):
+    """
+    FFT ile konvolusyon (bias haric).
+
+    Args:
+        x: Padding uygulanmis girdi (m, C_in, Hp, Wp)
+        K: fft_kernel_spectrum ciktisi (ayni dilation ile)
+        kernel_size: (kH, kW)
+        stride: Adim boyutu
+        dilation: Kernel elemanlari arasindaki adim (default=1)
+
+    Returns:
+        out: (m, C_out, H_out, W_out)
+        X: Girdi spektrumu (Hp*Wr, m, C_in) - backward icin
+    """
+    m, C_in, Hp, Wp = x.shape
+    C_out = K.shape[2]
+    kH, kW = dilated_size(kernel_size, dilation)
+    H_out = (Hp - kH) // stride + 1
+    W_out = (Wp - kW) // stride + 1
+
+    # (m, C, Hp, Wp) -> (Hp, Wp, m, C) duzeninde FFT
+    X = np.fft.rfft2(x.transpose(2, 3, 0, 1), axes=(0, 1))   # (Hp, Wr, m, C_in)
+    Wr = X.shape[1]
+    X = X.reshape(-1, m, C_in)
+
+    # Frekans basina kanal karisimi: (F, m, C_in) @ (F, C_in, C_out)
+    Z = np.matmul(X, K).reshape(Hp, Wr, m, C_out)
+
+    z = np.fft.irfft2(Z, s=(Hp, Wp), axes=(0, 1))            # (Hp, Wp, m, C_out)
+
+    # Gecerli bolge + stride
+    y = z[kH - 1::stride, kW - 1::stride][:H_out, :W_out]
+
+    out = y.transpose(2, 3, 0, 1).astype(x.dtype, copy=False)
+    return out, X
+
+
+def fft_conv2d_backward(dout, X, K, x_shape, kernel_size, stride=1, dilation=1):
+    """
+    fft_conv2d'nin geri yayilimi.
+
+    Args:
+        dout: Cikti gradyani (m, C_out, H_out, W_out)
+        X: Forward'daki girdi spektrumu (Hp*Wr, m, C_in)
+        K: Kernel spektrumu (Hp*Wr, C_in, C_out)
+        x_shape: Padding uygulanmis girdinin boyutu (m, C_in, Hp, Wp)
+        kernel_size: (kH, kW)
+        stride: Adim boyutu
+        dilation: Kernel elemanlari arasindaki adim (default=1)
+
+    Returns:
+        dx: Girdi gradyani (m, C_in, Hp, Wp)
+        dW: Kernel gradyani (C_out, C_in, kH, kW) - ortalama alinmamis
+    """
+    m, C_in, Hp, Wp = x_shape
+    _, C_out, H_out, W_out = dout.shape
+    kH, kW = dilated_size(kernel_size, dilation)
+
+    # y'nin z icinden okundugu konumlara dout'u yerlestir (digerleri sifir)
+    dz = np.zeros((Hp, Wp, m, C_out), dtype=dout.dtype)
+    dz[kH - 1:kH - 1 + stride * H_out:stride,
+       kW - 1:kW - 1 + stride * W_out:stride] = dout.transpose(2, 3, 0, 1)
+
+    dZ = np.fft.rfft2(dz, axes=(0, 1))                        # (Hp, Wr, m, C_out)
+    Wr = dZ.shape[1]
+    dZ = dZ.reshape(-1, m, C_out)
+
+    # dX = dZ @ conj(K)^T: (F, m, C_out) @ (F, C_out, C_in)
+    dX = np.matmul(dZ, K.conj().transpose(0, 2, 1)).reshape(Hp, Wr, m, C_in)
+    dx = np.fft.irfft2(dX, s=(Hp, Wp), axes=(0, 1))           # (Hp, Wp, m, C_in)
+
+    # dK = conj(X)^T @ dZ: (F, C_in, m) @ (F, m, C_out)
+    dK = np.matmul(X.conj().transpose(0, 2, 1), dZ).reshape(Hp, Wr, C_in, C_out)
+    dkf = np.fft.irfft2(dK, s=(Hp, Wp), axes=(0, 1))[:kH, :kW]  # (kH, kW, C_in, C_out)
+
+    # Kernel'i geri cevir: (kH, kW, C_in, C_out) -> (C_out, C_in, kH, kW)
+    # Dilation'da sadece gercek kernel elemanlarinin konumlari okunur
+    dW = dkf[::-1, ::-1][::dilation, ::dilation].transpose(3, 2, 0, 1)
+
+    return dx.transpose(2, 3, 0, 1).astype(dout.dtype, copy=False), dW.astype(dout.dtype, copy=False)
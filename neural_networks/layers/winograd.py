@@ -0,0 +1,282 @@
+"""
+Winograd Konvolusyonu
+=====================
+3x3 kernel ve stride=1 icin Winograd F(2x2, 3x3) minimal filtreleme.
+
+Boyut notasyonu: (batch, channels, height, width) - NCHW format
+
+================================================================================
+FIKIR
+================================================================================
+
+Ciktiyi 2x2'lik karolara (tile) boleriz. Her 2x2 cikti karosu, girdideki
+4x4'luk bir karodan hesaplanir (karolar 2 adimla kayar, 2 satir/sutun ortusur):
+
+    Y = A^T [ (G g G^T) * (B^T d B) ] A
+
+    d: 4x4 girdi karosu        g: 3x3 kernel
+    U = G g G^T  (4x4)         V = B^T d B  (4x4)
+    M = U * V    (eleman bazli carpim)
+    Y = A^T M A  (2x2 cikti karosu)
+
+Dogrudan hesap bir 2x2 karo icin 4*9 = 36 carpim yapar, Winograd 16 carpim
+yapar: ~2.25x daha az carpma.
+
+Cok kanalli durumda eleman bazli carpim kanallar uzerinden toplanir. Bu da
+karodaki 16 konumun her biri icin bir matris carpimidir:
+
+    M[k] = U[k] @ V[k]     k = 0..15
+    (C_out, C_in) @ (C_in, P) = (C_out, P)     P = m * karo sayisi
+
+================================================================================
+DONUSUMLER
+================================================================================
+
+(4, 4, ...) boyutlu bir diziye soldan ve sagdan matris carpimi, Kronecker
+carpimi ile tek bir BLAS matris carpimina indirgenir (bkz. _transform).
+Kucuk eksenler onde durdugu icin kopya gerekmez.
+
+Geri yayilim ayni formulun turevidir:
+    dM = A dY A^T
+    dU = dM @ V^T      -> dg = G^T dU G
+    dV = U^T @ dM      -> dd = B dV B^T  (karolar ortusuk -> toplanir)
+
+================================================================================
+GENISLETILMIS (DILATED) KONVOLUSYON
+================================================================================
+
+Dilation d ile cikti y[i, j] sadece x[i + p*d, j + q*d] degerlerini kullanir.
+Ciktiyi (i mod d, j mod d) alt izgaralarina ayirirsak:
+
+    y[a + t*d, b + u*d] = sum_{p,q} x[a + (t+p)*d, b + (u+q)*d] * g[p, q]
+
+yani her alt izgara, girdinin x[a::d, b::d] alt izgarasinin YOGUN (d=1)
+3x3 konvolusyonudur. split_phases d*d alt izgarayi batch eksenine katlar;
+tek bir F(2x2, 3x3) cagrisi hepsini isler, merge_phases ciktiyi geri
+dizer. Geri yayilimda ayni katlama dout ve dx icin yapilir.
+================================================================================
+"""
+
+import numpy as np
+
+
+# F(2x2, 3x3) donusum matrisleri
+B_T = np.array([
+    [1,  0, -1,  0],
+    [0,  1,  1,  0],
+    [0, -1,  1,  0],
+    [0,  1,  0, -1],
+], dtype=np.float64)
+
+G = np.array([
+    [1.0,  0.0, 0.0],
+    [0.5,  0.5, 0.5],
+    [0.5, -0.5, 0.5],
+    [0.0,  0.0, 1.0],
+])
+
+A_T = np.array([
+    [1, 1,  1,  0],
+    [0, 1, -1, -1],
+], dtype=np.float64)
+
+
+def _transform(left, right, t):
+    """
+    left @ t[:, :, r] @ right.T islemini tum r'ler icin hesapla.
+
+    Iki taraftan carpim, Kronecker carpimi ile tek bir matris carpimina
+    indirgenir: vec(L T R^T) = (L kron R) vec(T). Boylece buyuk dizi bellekten
+    sadece bir kez okunur.
+
+    Args:
+        left: (a, i) matris
+        right: (b, j) matris
+        t: (i, j, ...) dizi
+
+    Returns:
+        (a, b, ...) dizi
+    """
+    rest = t.shape[2:]
+    kron = np.kron(left, right).astype(t.dtype)       # (a*b, i*j)
+    out = np.dot(kron, t.reshape(kron.shape[1], -1))   # (a*b, R)
+    return out.reshape((left.shape[0], right.shape[0]) + rest)
+
+
+def winograd_tiles(H_out, W_out):
+    """Ciktiyi kaplayan 2x2 karo sayisi (T_h, T_w)."""
+    return (H_out + 1) // 2, (W_out + 1) // 2
+
+
+def winograd_weights(W):
+    """
+    Kernel donusumu: U = G g G^T.
+
+    Args:
+        W: Kernel (C_out, C_in, 3, 3)
+
+    Returns:
+        U: (16, C_out, C_in) - her karo konumu icin bir matris
+    """
+    C_out, C_in = W.shape[:2]
+    g = W.transpose(2, 3, 0, 1)                 # (3, 3, C_out, C_in)
+    U = _transform(G, G, g)                     # (4, 4, C_out, C_in)
+    return U.reshape(16, C_out, C_in)
+
+
+def winograd_weight_grad(dU):
+    """
+    Kernel donusumunun geri yayilimi: dg = G^T dU G.
+
+    Args:
+        dU: (16, C_out, C_in)
+
+    Returns:
+        dW: (C_out, C_in, 3, 3)
+    """
+    C_out, C_in = dU.shape[1:]
+    dg = _transform(G.T, G.T, dU.reshape(4, 4, C_out, C_in))   # (3, 3, C_out, C_in)
+    return dg.transpose(2, 3, 0, 1)
+
+
+def split_phases(x, dilation):
+    """
+    (m, C, H, W) tensorunu d*d alt izgaraya ayirip batch eksenine katla.
+
+    Boyutlar d'nin katina sifirla tamamlanir.
+
+    Args:
+        x: (m, C, H, W)
+        dilation: Alt izgara adimi d
+
+    Returns:
+        phases: (d*d*m, C, ceil(H/d), ceil(W/d)) - phases[(a*d + b)*m + n] = x[n, :, a::d, b::d]
+    """
+    d = dilation
+    m, C, H, W = x.shape
+    H_q, W_q = -(-H // d), -(-W // d)
+
+    padded = np.zeros((m, C, H_q * d, W_q * d), dtype=x.dtype)
+    padded[:, :, :H, :W] = x
+
+    # (m, C, H_q, d, W_q, d) -> (d, d, m, C, H_q, W_q)
+    phases = padded.reshape(m, C, H_q, d, W_q, d).transpose(3, 5, 0, 1, 2, 4)
+    return phases.reshape(d * d * m, C, H_q, W_q)
+
+
+def merge_phases(phases, dilation, H, W):
+    """
+    split_phases'in tersi: alt izgaralari (m, C, H, W) tensorune geri diz.
+
+    Args:
+        phases: (d*d*m, C, H_q, W_q)
+        dilation: Alt izgara adimi d
+        H, W: Sonucun boyutu (H <= H_q*d, W <= W_q*d); fazlasi atilir
+
+    Returns:
+        x: (m, C, H, W)
+    """
+    d = dilation
+    _, C, H_q, W_q = phases.shape
+    m = phases.shape[0] // (d * d)
+
+    # (d, d, m, C, H_q, W_q) -> (m, C, H_q, d, W_q, d)
+    x = phases.reshape(d, d, m, C, H_q, W_q).transpose(2, 3, 4, 0, 5, 1)
+    return x.reshape(m, C, H_q * d, W_q * d)[:, :, :H, :W]
+
+
+def winograd_conv2d(x, U):
+    """
+    Winograd F(2x2, 3x3) ile stride=1 konvolusyon (bias haric).
+
+    Args:
+        x: Padding uygulanmis girdi (m, C_in, H, W)
+        U: winograd_weights ciktisi (16, C_out, C_in)
+
+    Returns:
+        out: (m, C_out, H-2, W-2)
+        V: Donusturulmus girdi (16, C_in, P) - backward icin
+    """
+    m, C_in, H, W = x.shape
+    C_out = U.shape[1]
+    H_out, W_out = H - 2, W - 2
+    T_h, T_w = winograd_tiles(H_out, W_out)
+
+    # Tek sayili cikti boyutunda son karo girdinin disina tasar -> sifir ekle
+    extra_h, extra_w = 2 * T_h + 2 - H, 2 * T_w + 2 - W
+    if extra_h or extra_w:
+        x = np.pad(x, ((0, 0), (0, 0), (0, extra_h), (0, extra_w)))
+
+    # =======================================================================
+    # GIRDI KAROLARI
+    # (m, C, T_h, T_w, 4, 4) view, 2 adimla kayan 4x4 pencereler
+    # -> (4, 4, C, m, T_h, T_w) ardisik kopya
+    # =======================================================================
+    s = x.strides
+    tiles = np.lib.stride_tricks.as_strided(
+        x, shape=(m, C_in, T_h, T_w, 4, 4),
+        strides=(s[0], s[1], 2 * s[2], 2 * s[3], s[2], s[3]), writeable=False)
+    d = np.ascontiguousarray(tiles.transpose(4, 5, 1, 0, 2, 3))
+
+    # V = B^T d B: (4, 4, C_in, m, T_h, T_w) -> (16, C_in, P)
+    V = _transform(B_T, B_T, d).reshape(16, C_in, -1)
+
+    # 16 matris carpimi: (16, C_out, C_in) @ (16, C_in, P) = (16, C_out, P)
+    M = np.matmul(U.astype(V.dtype, copy=False), V)
+
+    # Y = A^T M A: (2, 2, C_out, m, T_h, T_w)
+    Y = _transform(A_T, A_T, M.reshape(4, 4, C_out, m, T_h, T_w))
+
+    # Karolari birlestir: (m, C_out, T_h, 2, T_w, 2) -> (m, C_out, 2*T_h, 2*T_w)
+    out = Y.transpose(3, 2, 4, 0, 5, 1).reshape(m, C_out, 2 * T_h, 2 * T_w)
+
+    return out[:, :, :H_out, :W_out], V
+
+
+def winograd_conv2d_backward(dout, V, U, x_shape):
+    """
+    winograd_conv2d'nin geri yayilimi.
+
+    Args:
+        dout: Cikti gradyani (m, C_out, H_out, W_out)
+        V: Forward'daki donusturulmus girdi (16, C_in, P)
+        U: Donusturulmus kernel (16, C_out, C_in)
+        x_shape: Padding uygulanmis girdinin boyutu (m, C_in, H, W)
+
+    Returns:
+        dx: Girdi gradyani (m, C_in, H, W)
+        dU: Donusturulmus kernel gradyani (16, C_out, C_in) - ortalama alinmamis
+    """
+    m, C_in, H, W = x_shape
+    _, C_out, H_out, W_out = dout.shape
+    T_h, T_w = winograd_tiles(H_out, W_out)
+
+    # dout'u karo duzenine getir: dY[r, c, :, :, i, j] = dout[:, :, 2i+r, 2j+c]
+    # Tek sayili cikti boyutunda son karonun tasan kismi sifir kalir
+    dY = np.zeros((2, 2, C_out, m, T_h, T_w), dtype=dout.dtype)
+    for r in range(2):
+        for c in range(2):
+            rows, cols = (H_out - r + 1) // 2, (W_out - c + 1) // 2
+            dY[r, c, :, :, :rows, :cols] = dout[:, :, r::2, c::2].transpose(1, 0, 2, 3)
+
+    # dM = A dY A^T: (4, 4, C_out, m, T_h, T_w) -> (16, C_out, P)
+    dM = _transform(A_T.T, A_T.T, dY).reshape(16, C_out, -1)
+
+    U = U.astype(dM.dtype, copy=False)
+
+    # dU = dM @ V^T: (16, C_out, P) @ (16, P, C_in) = (16, C_out, C_in)
+    dU = np.matmul(dM, V.transpose(0, 2, 1))
+
+    # dV = U^T @ dM: (16, C_in, C_out) @ (16, C_out, P) = (16, C_in, P)
+    dV = np.matmul(U.transpose(0, 2, 1), dM)
+
+    # dd = B dV B^T: (4, 4, C_in, m, T_h, T_w)
+    dd = _transform(B_T.T, B_T.T, dV.reshape(4, 4, C_in, m, T_h, T_w))
+
+    # Ortusen 4x4 karolari topla (col2im ile ayni fikir, 16 ofset)
+    dx = np.zeros((C_in, m, 2 * T_h + 2, 2 * T_w + 2), dtype=dd.dtype)
+    for i in range(4):
+        for j in range(4):
+            dx[:, :, i:i + 2 * T_h:2, j:j + 2 * T_w:2] += dd[i, j]
+
+    return dx.transpose(1, 0, 2, 3)[:, :, :H, :W], dU
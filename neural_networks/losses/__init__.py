@@ -1 +1 @@
-from .losses import Loss, CrossEntropyLoss
+from .losses import Loss, CrossEntropyLoss, SoftmaxCrossEntropy
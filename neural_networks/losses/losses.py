@@ -11,6 +11,18 @@ PyTorch tarzi kullanim:
     loss = loss_fn.forward(y_pred, y_true)
     dout = loss_fn.backward()
     model.backward(dout)
+
+Dtype: Loss, y_pred'in dtype'inda hesaplanir. y_true (orn: float64 one-hot)
+y_pred'in dtype'ina cevrilir, boylece float32 modelde dout da float32 olur.
+
+Softmax + loss birlesik (fused) kullanim:
+    model = Sequential([..., Dense(128, 10)])   # Softmax katmani YOK
+    loss_fn = SoftmaxCrossEntropy()
+    loss = loss_fn.forward(logits, labels)      # labels: (m,) tam sayi sinif
+
+Loss scaling: scaler verilirse (scale attribute'u olan herhangi bir nesne,
+orn: optimizers.DynamicLossScaler) backward() dout'u scaler.scale ile carpar.
+Dondurulen loss degeri olceklenmez.
 """
 
 import numpy as np
@@ -18,10 +30,16 @@ from abc import ABC, abstractmethod
 
 
 class Loss(ABC):
-    """Tum loss fonksiyonlari icin temel sinif."""
+    """
+    Tum loss fonksiyonlari icin temel sinif.
+
+    Args:
+        scaler: (Opsiyonel) Loss scaler - backward gradyani scaler.scale ile carpilir
+    """
 
-    def __init__(self):
+    def __init__(self, scaler=None):
         self.cache = {}
+        self.scaler = scaler
 
     @abstractmethod
     def forward(self, y_pred, y_true):
@@ -78,6 +96,9 @@ class CrossEntropyLoss(Loss):
         m = y_true.shape[1]
         epsilon = 1e-8  # log(0) onleme
 
+        # Etiketler tahminin dtype'ini izler (float32 dout'u yukseltmesin)
+        y_true = y_true.astype(y_pred.dtype, copy=False)
+
         # Loss hesapla
         log_probs = np.log(y_pred + epsilon)
         loss = -np.sum(y_true * log_probs) / m
@@ -104,7 +125,95 @@ class CrossEntropyLoss(Loss):
         # Softmax + CE turevi basitlesir
         dout = y_pred - y_true
 
+        if self.scaler is not None:
+            dout *= self.scaler.scale
+
         return dout
 
     def __repr__(self):
         return "CrossEntropyLoss()"
+
+
+class SoftmaxCrossEntropy(Loss):
+    """
+    Softmax + Cross-Entropy birlesik loss (ham logit ve tam sayi etiket ile).
+
+    Modelin son katmani Softmax OLMAMALI; loss ham skorlari (logit) alir.
+    Etiketler one-hot matris yerine sinif indeksleridir: 10 sinif icin
+    (10, m) float64 one-hot yerine (m,) uint8 dizi, yani 80 kat az bellek.
+
+    Formul (log-sum-exp ile):
+        log p_y = z_y - log(sum_j exp(z_j))
+        Forward:  L = -(1/m) * sum(log p_y)
+        Backward: dout = softmax(z) - onehot(y)
+
+    CrossEntropyLoss'tan farklari:
+        - log(softmax + eps) yerine log-sum-exp: epsilon gerekmez, tasma yok
+        - Her sutundan sadece dogru sinifin log-olasiligi fancy indexing ile secilir
+        - Gradyan, forward'da saklanan olasilik matrisi uzerinde yerinde
+          hesaplanir (tek (n_classes, m) dizi)
+
+    Ornek:
+        loss_fn = SoftmaxCrossEntropy()
+        loss = loss_fn.forward(logits, labels)  # logits: (10, m), labels: (m,)
+        dout = loss_fn.backward()
+    """
+
+    def forward(self, logits, y_true):
+        """
+        Loss hesapla.
+
+        Args:
+            logits: Ham skorlar (n_classes, m)
+            y_true: Sinif indeksleri (m,). One-hot (n_classes, m) de kabul edilir.
+
+        Returns:
+            loss: Ortalama loss (skaler)
+        """
+        m = logits.shape[1]
+
+        labels = y_true.argmax(axis=0) if y_true.ndim == 2 else y_true
+        if labels.shape != (m,):
+            raise ValueError(f"Etiket boyutu {y_true.shape}, logit boyutu {logits.shape} ile uyumsuz")
+
+        columns = np.arange(m)
+
+        # Numerical stability: sutun maksimumu cikar (logits degismez, yeni dizi)
+        probs = logits - np.max(logits, axis=0, keepdims=True)
+        correct = probs[labels, columns]  # (m,) dogru sinifin kaydirilmis logit'i
+
+        # Yerinde exp ve normalizasyon: probs = softmax(logits)
+        np.exp(probs, out=probs)
+        sums = np.sum(probs, axis=0)
+        loss = np.mean(np.log(sums) - correct)
+        probs /= sums
+
+        # Backward icin sakla
+        self.cache['probs'] = probs
+        self.cache['labels'] = labels
+
+        return loss
+
+    def backward(self):
+        """
+        Baslangic gradyanini hesapla: dL/dz = softmax(z) - onehot(y)
+
+        Gradyan saklanan olasilik matrisine yerinde yazilir; bu yuzden
+        her forward icin bir kez cagrilmalidir.
+
+        Returns:
+            dout: (n_classes, m) boyutunda gradyan
+        """
+        dout = self.cache.pop('probs')
+        labels = self.cache.pop('labels')
+
+        # One-hot cikarmak = her sutunda dogru sinifin olasiligindan 1 cikarmak
+        dout[labels, np.arange(dout.shape[1])] -= 1
+
+        if self.scaler is not None:
+            dout *= self.scaler.scale
+
+        return dout
+
+    def __repr__(self):
+        return "SoftmaxCrossEntropy()"
@@ -16,14 +16,52 @@ Ornek:
 
     # Geri yayilim
     model.backward(dout)
+
+    # float64 model (orn: gradyan kontrolu icin)
+    model = Sequential([...], dtype=np.float64)
+
+    # Karisik hassasiyet: float32 agirliklar, float16 aktivasyon cache'i
+    model = Sequential([...], mixed_precision=True)
+
+    # Degerlendirme: cache doldurulmaz, batch batch tahmin
+    labels = model.predict(x, batch_size=1000, output='labels')
+
+    with model.no_grad():
+        logits = model.forward(x)
+
+    # Tum parametreler/gradyanlar tek duz dizide (katman W/b'leri view)
+    params, grads = model.arena()
+
+    # Mini-batch egitim: karistirma, batch buffer'lari, ornek/sn raporu
+    history = model.fit(x, y, loss_fn, optimizer, batch_size=128, epochs=20,
+                        validation_data=(x_val, y_val))
+
+    # Gradyan biriktirme: 1024'luk etkin batch, 256'lik micro-batch'lerle
+    with model.accumulate_grads():
+        for start in range(0, 1024, 256):
+            loss_fn.forward(model.forward(x[:, start:start + 256]), y[start:start + 256])
+            model.backward(loss_fn.backward())
+    optimizer.step()
 """
 
+import time
+from contextlib import contextmanager
+import numpy as np
+
+
 class Sequential:
     """
     Katmanlari sirali tutan model container'i.
 
     Args:
         layers: Layer listesi
+        dtype: (Opsiyonel) Tum katmanlarin parametre dtype'i. None ise
+            katmanlar olusturulduklari dtype'i korur (bkz. set_default_dtype).
+            Verilirse sonradan add() ile eklenen katmanlar da cevrilir.
+        mixed_precision: True ise agirliklar (verilmediyse) float32,
+            backward icin saklanan aktivasyonlar float16 tutulur
+            (bkz. Layer.set_cache_dtype). Float cache yariya iner (olculen
+            sinirlar icin bkz. layers.base); loss scaling icin optimizers.DynamicLossScaler kullanilir.
 
     Ornek:
         model = Sequential([
@@ -34,8 +72,384 @@ class Sequential:
         ])
     """
 
-    def __init__(self, layers=None):
+    def __init__(self, layers=None, dtype=None, mixed_precision=False):
         self.layers = layers if layers is not None else []
+        self.training = True
+        self.dtype = None
+        self.cache_dtype = None
+
+        # Parametre arenasi (bkz. arena()) - ilk kullanimda kurulur
+        self.param_arena = None
+        self.grad_arena = None
+        self._arena_views = []
+        self._arena_layers = []
+
+        if mixed_precision:
+            dtype = dtype or np.float32
+            self.set_cache_dtype(np.float16)
+        if dtype is not None:
+            self.set_dtype(dtype)
+
+    def set_dtype(self, dtype):
+        """
+        Tum katmanlarin parametrelerini dtype'a cevir.
+
+        Args:
+            dtype: np.float32 veya np.float64
+        """
+        self.dtype = np.dtype(dtype)
+        for layer in self.layers:
+            # Duck typing: set_dtype'i olmayan katmanlar (orn: ozel katmanlar) atlanir
+            if hasattr(layer, 'set_dtype'):
+                layer.set_dtype(self.dtype)
+        return self
+
+    def set_cache_dtype(self, dtype):
+        """
+        Tum katmanlarin aktivasyon cache dtype'ini ayarla.
+
+        Args:
+            dtype: np.float16 (karisik hassasiyet) veya None
+        """
+        self.cache_dtype = None if dtype is None else np.dtype(dtype)
+        for layer in self.layers:
+            if hasattr(layer, 'set_cache_dtype'):
+                layer.set_cache_dtype(self.cache_dtype)
+        return self
+
+    def train(self, mode=True):
+        """
+        Tum katmanlari egitim (True) veya cikarim (False) moduna al.
+
+        Cikarim modunda katmanlar forward'da cache doldurmaz
+        (bkz. Layer.train).
+        """
+        self.training = mode
+        for layer in self.layers:
+            if hasattr(layer, 'train'):
+                layer.train(mode)
+        return self
+
+    def eval(self):
+        """Cikarim moduna gec (train(False))."""
+        return self.train(False)
+
+    def clear_cache(self):
+        """Tum katmanlarin backward icin sakladigi cache'i birak."""
+        for layer in self.layers:
+            if hasattr(layer, 'clear_cache'):
+                layer.clear_cache()
+        return self
+
+    def clear_workspace(self):
+        """
+        Tum katmanlarin workspace buffer'larini birak.
+
+        Buffer'lar egitim ve degerlendirme boyunca yeniden kullanilir; egitim
+        bittikten sonra bellegi geri vermek icin acikca cagrilir.
+        """
+        for layer in self.layers:
+            if hasattr(layer, 'clear_workspace'):
+                layer.clear_workspace()
+        return self
+
+    @contextmanager
+    def no_grad(self):
+        """
+        Blok boyunca cikarim modu; cikista onceki mod geri yuklenir.
+
+        Ornek:
+            with model.no_grad():
+                logits = model.forward(x_test)
+        """
+        was_training = self.training
+        self.eval()
+        try:
+            yield self
+        finally:
+            # Sadece cache birakilir; workspace buffer'lari (egitim batch'i
+            # ve degerlendirme batch'i icin ayri) sonraki adimlarda yeniden
+            # kullanilir (bkz. clear_workspace)
+            self.clear_cache()
+            self.train(was_training)
+
+    def zero_grad(self):
+        """Tum gradyanlari sifirla (bkz. Layer.zero_grad)."""
+        for layer in self.layers:
+            if hasattr(layer, 'zero_grad'):
+                layer.zero_grad()
+        return self
+
+    @contextmanager
+    def accumulate_grads(self):
+        """
+        Blok icindeki backward'lar gradyanlari biriktirir.
+
+        Girisle gradyanlar sifirlanir; her backward dW/db'yi o ana kadarki
+        tum orneklerin ortalamasi yapar (micro-batch boyutlari farkli
+        olabilir). Sonuc, micro-batch'lerin birlesimiyle tek bir backward'in
+        gradyanidir; ama aktivasyonlar sadece bir micro-batch icin tutulur.
+        optimizer.step() blok icinde veya sonra cagrilabilir; blok icinde
+        cagrildiysa yeni biriktirme zero_grad() ile baslar.
+
+        Ornek:
+            with model.accumulate_grads():
+                for x_mb, y_mb in micro_batches:
+                    loss_fn.forward(model.forward(x_mb), y_mb)
+                    model.backward(loss_fn.backward())
+            optimizer.step()
+        """
+        self.zero_grad()
+        previous = [getattr(layer, 'accumulate_grads', False) for layer in self.layers]
+        for layer in self.layers:
+            layer.accumulate_grads = True
+        try:
+            yield self
+        finally:
+            for layer, mode in zip(self.layers, previous):
+                layer.accumulate_grads = mode
+
+    def predict(self, x, batch_size=None, output=None):
+        """
+        Cikarim modunda tahmin.
+
+        Girdi batch_size'lik parcalarla islenir, boylece ara diziler (orn:
+        Conv2D x_col) tum veri icin degil bir batch icin ayrilir.
+
+        Ornek ekseni: 2D girdi/cikti (n_features, m) icin eksen 1, 4D girdi
+        (m, C, H, W) icin eksen 0.
+
+        Args:
+            x: Girdi verisi
+            batch_size: (Opsiyonel) Parca boyutu. None ise tek seferde.
+            output: None -> modelin ciktisi
+                    'logits' -> son katman Softmax ise atlanir
+                    'labels' -> logit'lerin argmax'i, (m,) sinif indeksleri
+                    (softmax siralamayi degistirmedigi icin hesaplanmaz)
+
+        Returns:
+            Modelin ciktisi, logit'ler veya etiketler
+        """
+        if output not in (None, 'logits', 'labels'):
+            raise ValueError(f"output None, 'logits' veya 'labels' olmali: {output!r}")
+
+        layers = self.layers
+        if output is not None and layers and getattr(layers[-1], 'is_softmax', False):
+            layers = layers[:-1]
+
+        in_axis = 1 if x.ndim == 2 else 0
+        m = x.shape[in_axis]
+        batch_size = batch_size or m
+
+        result = None
+        with self.no_grad():
+            for start in range(0, m, batch_size):
+                stop = min(start + batch_size, m)
+                out = x[:, start:stop] if in_axis == 1 else x[start:stop]
+                for layer in layers:
+                    out = layer.forward(out)
+
+                if output == 'labels':
+                    out = np.argmax(out, axis=0 if out.ndim == 2 else 1)
+
+                # Sonuc dizisi ilk batch'in sekil ve dtype'iyla bir kez ayrilir
+                out_axis = 1 if out.ndim == 2 else 0
+                if result is None:
+                    shape = list(out.shape)
+                    shape[out_axis] = m
+                    result = np.empty(shape, dtype=out.dtype)
+                if out_axis == 1:
+                    result[:, start:stop] = out
+                else:
+                    result[start:stop] = out
+
+        return result
+
+    # ==========================================================================
+    # MINI-BATCH EGITIM
+    # ==========================================================================
+    #
+    # Her epoch'ta veri kopyalanmaz, sadece indeks permutasyonu yerinde
+    # karistirilir. Batch'ler np.take(..., out=) ile batch boyutu basina bir
+    # kez ayrilan buffer'lara toplanir (en fazla iki boyut: tam batch ve son
+    # eksik batch). shuffle=False ise batch'ler verinin view'laridir.
+    #
+    # 2D veri icin en hizli duzen X_train.T'dir: (m, 784) ardisik dizinin
+    # (784, m) view'u. Toplama ornek satirlarini kopyalar; (784, m) ardisik
+    # dizide her ornek bir sutundur ve toplama yavas, dagilmis okumadir.
+    #
+    # Batch buffer'i bir sonraki batch'te uzerine yazilir; katmanlar girdiyi
+    # sadece ayni adimin backward'i icin tuttugu icin bu guvenlidir.
+    # ==========================================================================
+
+    def fit(self, x, y=None, loss_fn=None, optimizer=None, batch_size=32, epochs=1, shuffle=True, seed=None,
+            validation_data=None, scheduler=None, early_stopping=None, print_interval=1):
+        """
+        Mini-batch egitim dongusu.
+
+        Ornek ekseni predict() ile ayni: 2D dizi (n_features, m) icin eksen 1,
+        diger diziler (orn: (m, C, H, W) veya (m,) etiketler) icin eksen 0.
+
+        x bir veri yukleyici de olabilir (y=None): her iter() bir epoch'luk
+        (x_batch, y_batch) uretir ve num_samples saglar (bkz. data.DataLoader).
+        Batch hazirligi o zaman yukleyicinin thread'inde egitimle paralel
+        yapilir; batch_size, shuffle ve seed yukleyiciden gelir.
+
+        Args:
+            x: Egitim girdisi veya veri yukleyici
+            y: Etiketler (m,) veya one-hot (n_classes, m); yukleyicide None
+            loss_fn: forward(y_pred, y_true) ve backward() saglayan loss
+            optimizer: step() saglayan optimizer
+            batch_size: Batch boyutu
+            epochs: En fazla epoch sayisi
+            shuffle: Her epoch basinda ornek sirasini karistir
+            seed: Karistirma icin seed (tekrarlanabilirlik)
+            validation_data: (Opsiyonel) (x_val, y_val) veya veri yukleyici;
+                her epoch sonunda dogruluk (%) olculur (bkz. evaluate)
+            scheduler: (Opsiyonel) Epoch sonunda step() edilen LR scheduler;
+                needs_metric ise step(val_acc), per_step ise (orn: OneCycleLR)
+                her optimizer.step()'ten sonra step()
+            early_stopping: (Opsiyonel) EarlyStopping; validation_data gerekir.
+                Egitim bitince en iyi agirliklara donulur.
+            print_interval: Kac epoch'ta bir log yazilir (0: sessiz)
+
+        Returns:
+            history: {'loss', 'val_acc', 'lr', 'samples_per_sec'} epoch basina listeler
+        """
+        if early_stopping is not None and validation_data is None:
+            raise ValueError("early_stopping icin validation_data gerekli")
+        if scheduler is not None and getattr(scheduler, 'needs_metric', False) and validation_data is None:
+            raise ValueError(f"{scheduler.__class__.__name__} icin validation_data gerekli")
+
+        if loss_fn is None or optimizer is None:
+            raise ValueError("fit icin loss_fn ve optimizer gerekli")
+
+        if y is None:
+            # Veri yukleyici: batch'ler onun buffer'larindan gelir
+            loader = x
+            m = loader.num_samples
+            batch_size = getattr(loader, 'batch_size', batch_size)
+            return self._fit_epochs(lambda: iter(loader), m, batch_size, loss_fn, optimizer, epochs,
+                                    validation_data, scheduler, early_stopping, print_interval)
+
+        x_axis = 1 if x.ndim == 2 else 0
+        y_axis = 1 if y.ndim == 2 else 0
+        m = x.shape[x_axis]
+        if y.shape[y_axis] != m:
+            raise ValueError(f"x ve y ornek sayisi farkli: {m} != {y.shape[y_axis]}")
+
+        rng = np.random.default_rng(seed)
+        order = np.arange(m)
+        buffers = {}
+
+        def gather(a, axis, index, name):
+            """a'nin index orneklerini (batch boyutu, isim) basina tek buffer'a topla."""
+            # (n, m) dizi (m, n) verinin transpozu ise (orn: X_train.T) ornekler
+            # bellekte ardisik satirlardir: satir toplamak sutun toplamaktan
+            # ~10x hizli. Sonuc (b, n) buffer'inin transpoz view'u olur.
+            rows = axis == 1 and a.flags.f_contiguous and not a.flags.c_contiguous
+            if rows:
+                a, axis = a.T, 0
+            shape = list(a.shape)
+            shape[axis] = len(index)
+            key = (name, len(index))
+            buf = buffers.get(key)
+            if buf is None:
+                buf = buffers[key] = np.empty(shape, dtype=a.dtype)
+            np.take(a, index, axis=axis, out=buf)
+            return buf.T if rows else buf
+
+        def batch(a, axis, start, stop, name):
+            if shuffle:
+                return gather(a, axis, order[start:stop], name)
+            return a[:, start:stop] if axis == 1 else a[start:stop]
+
+        def epoch_batches():
+            if shuffle:
+                rng.shuffle(order)
+            for start in range(0, m, batch_size):
+                stop = min(start + batch_size, m)
+                yield batch(x, x_axis, start, stop, 'x'), batch(y, y_axis, start, stop, 'y')
+
+        return self._fit_epochs(epoch_batches, m, batch_size, loss_fn, optimizer, epochs,
+                                validation_data, scheduler, early_stopping, print_interval)
+
+    def _fit_epochs(self, epoch_batches, m, batch_size, loss_fn, optimizer, epochs,
+                    validation_data, scheduler, early_stopping, print_interval):
+        """fit()'in epoch dongusu; epoch_batches() bir epoch'luk (x, y) batch'leri uretir."""
+        self.train()
+        history = {'loss': [], 'val_acc': [], 'lr': [], 'samples_per_sec': []}
+        per_step = getattr(scheduler, 'per_step', False)
+        if print_interval:
+            print(f"{'Epoch':>6} | {'Loss':>10} | {'Val Acc':>8} | {'LR':>8} | {'Sure':>7} | {'ornek/sn':>9}")
+            print("-" * 64)
+
+        for epoch in range(1, epochs + 1):
+            start_time = time.perf_counter()
+            total_loss = 0.0
+            for x_batch, y_batch in epoch_batches():
+                loss = loss_fn.forward(self.forward(x_batch), y_batch)
+                self.backward(loss_fn.backward())
+                optimizer.step()
+                if per_step:
+                    scheduler.step()
+                total_loss += float(loss) * y_batch.shape[-1 if y_batch.ndim == 2 else 0]
+            epoch_time = time.perf_counter() - start_time
+
+            history['loss'].append(total_loss / m)
+            history['lr'].append(optimizer.lr)
+            history['samples_per_sec'].append(m / epoch_time)
+
+            val_acc = None
+            if validation_data is not None:
+                if isinstance(validation_data, tuple):
+                    val_acc = self.evaluate(*validation_data, batch_size=max(batch_size, 1000))
+                else:
+                    val_acc = self.evaluate(validation_data)
+            history['val_acc'].append(val_acc)
+
+            if scheduler is not None and not per_step:
+                if getattr(scheduler, 'needs_metric', False):
+                    scheduler.step(val_acc)
+                else:
+                    scheduler.step()
+            stop_training = early_stopping is not None and early_stopping.step(val_acc, self)
+
+            if print_interval and (epoch % print_interval == 0 or epoch == 1 or stop_training):
+                val_text = '-' if val_acc is None else f"{val_acc:.2f}%"
+                print(f"{epoch:>6} | {history['loss'][-1]:>10.4f} | {val_text:>8} | "
+                      f"{history['lr'][-1]:>8.4g} | {epoch_time:>6.2f}s | {m / epoch_time:>9.0f}")
+            if stop_training:
+                if print_interval:
+                    print(f"Early stopping: {early_stopping.patience} epoch iyilesme yok")
+                break
+
+        if early_stopping is not None:
+            early_stopping.restore(self)
+        return history
+
+    def evaluate(self, x, y=None, batch_size=None):
+        """
+        Siniflandirma dogrulugu (%).
+
+        Args:
+            x: Girdi verisi veya (x_batch, y_batch) ureten veri yukleyici (y=None).
+                Yukleyici ile girdi batch batch donusturulebilir (orn: uint8 ->
+                float32, bkz. data.DataLoader); tum veri float'a cevrilmez.
+            y: Etiketler (m,) veya one-hot (n_classes, m)
+            batch_size: (Opsiyonel) predict() parca boyutu
+
+        Returns:
+            Dogru tahmin yuzdesi (0-100)
+        """
+        batches = x if y is None else [(x, y)]
+        correct = total = 0
+        for x_batch, y_batch in batches:
+            labels = np.argmax(y_batch, axis=0) if y_batch.ndim == 2 else y_batch
+            predictions = self.predict(x_batch, batch_size=batch_size, output='labels')
+            correct += np.count_nonzero(predictions == labels)
+            total += len(labels)
+        return correct / total * 100
 
     def add(self, layer):
         """
@@ -47,21 +461,33 @@ class Sequential:
         # Duck typing: forward ve backward metodlari varsa kabul et
         if not (hasattr(layer, 'forward') and hasattr(layer, 'backward')):
             raise TypeError(f"Layer forward/backward metodlarina sahip olmali: {type(layer)}")
+        if self.dtype is not None and hasattr(layer, 'set_dtype'):
+            layer.set_dtype(self.dtype)
+        if self.cache_dtype is not None and hasattr(layer, 'set_cache_dtype'):
+            layer.set_cache_dtype(self.cache_dtype)
+        if hasattr(layer, 'train'):
+            layer.train(self.training)
         self.layers.append(layer)
 
     def forward(self, x):
         """
         Ileri yayilim - tum katmanlardan sirayla gecer.
 
+        Ara katmanlarin ciktilari workspace buffer'lari olabilir (Conv2D,
+        Dense); son katmaninki kopyalanir, boylece donen dizi sonraki
+        forward() cagrilarinda degismez.
+
         Args:
             x: Girdi verisi
 
         Returns:
-            Modelin ciktisi
+            Modelin ciktisi (yeni dizi)
         """
         out = x
         for layer in self.layers:
             out = layer.forward(out)
+        if self.layers and getattr(self.layers[-1], 'use_workspace', False):
+            out = out.copy()
         return out
 
     def backward(self, dout):
@@ -78,6 +504,89 @@ class Sequential:
             dout = layer.backward(dout)
         return dout
 
+    # ==========================================================================
+    # PARAMETRE ARENASI
+    # ==========================================================================
+    #
+    # Tum parametreler tek bir duz (1D, ardisik) diziye, gradyanlar ayni
+    # sekilde ikinci bir diziye paketlenir. Katmanlarin W/b ve dW/db
+    # attribute'lari bu dizilerin view'laridir:
+    #
+    #   param_arena: [ W1 (n1*n0) | b1 (n1) | W2 (n2*n1) | b2 (n2) ]
+    #   grad_arena:  [ dW1        | db1     | dW2        | db2     ]
+    #
+    # Katmanlar gradyanlari yerinde yazdigi (out=, copyto) icin backward
+    # dogrudan grad_arena'yi doldurur. Optimizer tum modeli tek vektorel
+    # yerinde islemle gunceller:  param_arena -= lr * grad_arena
+    # Ayni duzen checkpoint (tek dizi kaydet/yukle) ve gradyan toplama
+    # (all-reduce) icin de kullanilir.
+    #
+    # Bir katmanin parametresi yeniden atanirsa (orn: layer.set_dtype) veya
+    # katman listesi degisirse arena bir sonraki arena() cagrisinda yeniden
+    # kurulur.
+    # ==========================================================================
+
+    def arena(self):
+        """
+        Parametre ve gradyan arenalarini dondur (gerekirse kur).
+
+        Returns:
+            param_arena: Tum parametreler (toplam_boyut,) - None: parametre yok
+            grad_arena: Tum gradyanlar (toplam_boyut,)
+        """
+        if self._arena_stale():
+            self._build_arena()
+        return self.param_arena, self.grad_arena
+
+    def _arena_stale(self):
+        """Katman listesi veya parametre/gradyan attribute'lari arenadan koptu mu?"""
+        if self._arena_layers != self.layers:
+            return True
+        return any(getattr(layer, name) is not param or getattr(layer, grad_name) is not grad
+                   for layer, name, param, grad_name, grad in self._arena_views)
+
+    def _build_arena(self):
+        """Parametreleri ve gradyanlari duz dizilere kopyala, katmanlara view'lari ata."""
+        entries = []
+        for layer in self.layers:
+            # get_params/get_grads ayni sirada: {'W', 'b'} <-> {'dW', 'db'}
+            params = layer.get_params()
+            grad_names = list(layer.get_grads())
+            entries += [(layer, name, param, grad_name)
+                        for (name, param), grad_name in zip(params.items(), grad_names)]
+
+        self._arena_layers = list(self.layers)
+        self._arena_views = []
+        if not entries:
+            self.param_arena = self.grad_arena = None
+            return
+
+        dtypes = {param.dtype for _, _, param, _ in entries}
+        if len(dtypes) > 1:
+            raise ValueError(f"Parametre arenasi tek dtype gerektirir, bulunan: {sorted(map(str, dtypes))}")
+        dtype = dtypes.pop()
+
+        total = sum(param.size for _, _, param, _ in entries)
+        self.param_arena = np.empty(total, dtype=dtype)
+        self.grad_arena = np.zeros(total, dtype=dtype)
+
+        offset = 0
+        for layer, name, param, grad_name in entries:
+            size = param.size
+            param_view = self.param_arena[offset:offset + size].reshape(param.shape)
+            grad_view = self.grad_arena[offset:offset + size].reshape(param.shape)
+            np.copyto(param_view, param)
+
+            # Mevcut gradyan varsa korunur (orn: backward'dan sonra kurulduysa)
+            grad = getattr(layer, grad_name)
+            if grad is not None and grad.shape == param.shape:
+                np.copyto(grad_view, grad)
+
+            setattr(layer, name, param_view)
+            setattr(layer, grad_name, grad_view)
+            self._arena_views.append((layer, name, param_view, grad_name, grad_view))
+            offset += size
+
     def get_params(self):
         """
         Tum katmanlarin parametrelerini topla.
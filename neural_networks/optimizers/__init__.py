@@ -1 +1,4 @@
-from .optimizers import Optimizer, SGD
+from .optimizers import (Optimizer, SGD, Momentum, Nesterov, RMSProp, Adam, AdamW,
+                         DynamicLossScaler)
+from .schedulers import (LRScheduler, StepLR, CosineAnnealingLR, OneCycleLR, ReduceLROnPlateau,
+                         EarlyStopping)
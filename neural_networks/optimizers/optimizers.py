@@ -5,6 +5,7 @@ Parametre guncelleme algoritmalari - modelden AYRI.
 
 Kullanim:
     optimizer = SGD(model, lr=0.1)
+    optimizer = Adam(model, lr=0.001)   # Momentum, Nesterov, RMSProp, AdamW
 
     # Egitim dongusunde
     y_pred = model.forward(x)
@@ -12,23 +13,189 @@ Kullanim:
     dout = loss_fn.backward()
     model.backward(dout)
     optimizer.step()  # Parametreleri guncelle
+
+    # Gradyan biriktirme (bkz. Sequential.accumulate_grads)
+    with model.accumulate_grads():
+        for x_mb, y_mb in micro_batches:
+            ...                                  # forward, loss, backward
+    optimizer.step()                             # etkin batch icin tek adim
+
+Dtype: Guncellemeler parametrenin dtype'inda yapilir. lr Python float'a
+cevrilir; NumPy float64 skaleri float32 parametreyi float64'e yukseltirdi.
+
+Parametre arenasi: Model arena() saglarsa (Sequential), tum parametreler
+tek duz dizide guncellenir: param_arena -= lr * grad_arena. Katman katman
+dolasma, dict olusturma ve yeni agirlik dizisi ayirma olmaz.
+
+Optimizer durumu (momentum, ikinci moment...) ilk adimda parametrelerle ayni
+sekilde bir kez ayrilir. Guncellemeler out= ile bu buffer'lara yazilan
+birkac yerinde ufunc cagrisidir; adim basina gecici dizi olusmaz.
+
+Loss scaling (karisik hassasiyet):
+    scaler = DynamicLossScaler()
+    loss_fn = CrossEntropyLoss(scaler=scaler)   # dout * scale
+    optimizer = SGD(model, lr=0.1, scaler=scaler)  # grad / scale, inf/nan -> adim atla
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 
 
 class Optimizer(ABC):
     """Tum optimizer'lar icin temel sinif."""
 
-    def __init__(self, model, lr):
+    def __init__(self, model, lr, scaler=None):
         self.model = model
         self.lr = lr
+        self.scaler = scaler
+        self.state = {}  # {isim: [parametre basina buffer]}
 
     @abstractmethod
     def step(self):
         """Parametreleri guncelle."""
         pass
 
+    def zero_grad(self):
+        """Modelin gradyanlarini sifirla (yeni biriktirme baslat)."""
+        if hasattr(self.model, 'zero_grad'):
+            self.model.zero_grad()
+        else:
+            for layer in self.model.layers:
+                layer.zero_grad()
+
+    def _params_and_grads(self):
+        """
+        Guncellenecek (parametre, gradyan) ciftleri.
+
+        Model arena() saglarsa tek cift (param_arena, grad_arena) doner;
+        degilse katman katman, gradyani hesaplanmis her parametre.
+        """
+        if hasattr(self.model, 'arena'):
+            param_arena, grad_arena = self.model.arena()
+            return [] if param_arena is None else [(param_arena, grad_arena)]
+
+        pairs = []
+        for layer in self.model.layers:
+            # get_params/get_grads ayni sirada: {'W', 'b'} <-> {'dW', 'db'}
+            for param, grad in zip(layer.get_params().values(), layer.get_grads().values()):
+                if grad is not None:
+                    pairs.append((param, grad))
+        return pairs
+
+    def _buffers(self, name, pairs, fill=0.0):
+        """
+        Parametre basina name adli durum buffer'larini dondur.
+
+        Ilk cagrida (veya parametre sekli/dtype'i degistiyse, orn: arena
+        yeniden kuruldu) fill ile doldurularak ayrilir.
+        """
+        buffers = self.state.get(name)
+        if buffers is None or len(buffers) != len(pairs) or any(
+                buf.shape != param.shape or buf.dtype != param.dtype
+                for buf, (param, _) in zip(buffers, pairs)):
+            buffers = [np.full_like(param, fill) for param, _ in pairs]
+            self.state[name] = buffers
+        return buffers
+
+    def _unscale_grads(self, pairs):
+        """
+        scaler varsa gradyanlari olceksizlestir.
+
+        Args:
+            pairs: _params_and_grads() ciftleri
+
+        Returns:
+            bool: Adim atilabilir mi (gradyanlarda inf/nan yoksa True)
+        """
+        if self.scaler is None:
+            return True
+        return self.scaler.unscale([grad for _, grad in pairs])
+
+
+# ==============================================================================
+# DINAMIK LOSS SCALING
+# ==============================================================================
+#
+# Karisik hassasiyette kucuk gradyanlar float16'da sifira yuvarlanabilir
+# (float16'nin en kucuk normal degeri ~6e-5). Loss'un gradyani S ile
+# carpilarak geri yayilir, guncellemeden once S'ye bolunur:
+#
+#     dout_S = S * dL/dy  ->  grad_S = S * grad  ->  grad = grad_S / S
+#
+# S buyuk tutulur; gradyanlarda inf/nan gorulurse adim atlanir ve S
+# yariya iner. growth_interval adim boyunca tasma olmazsa S iki katina cikar.
+#
+# Bu framework'te gradyanlar parametre dtype'inda (float32) akar, sadece
+# aktivasyon cache'i float16'dir. Olcekleme yine de zararsizdir; asil katkisi
+# inf/nan iceren adimlari agirliklari bozmadan atlamaktir.
+# ==============================================================================
+
+class DynamicLossScaler:
+    """
+    Dinamik loss olcekleyici.
+
+    Loss (dout'u self.scale ile carpar) ve optimizer (gradyanlari bolup
+    kontrol eder) ayni nesneyi paylasir.
+
+    Args:
+        init_scale: Baslangic olcegi (default=2**15)
+        growth_factor: Tasmasiz growth_interval adim sonra carpan (default=2)
+        backoff_factor: Tasmada carpan (default=0.5)
+        growth_interval: Olcegi buyutmeden once gereken tasmasiz adim sayisi
+        min_scale: Olcegin inebilecegi en kucuk deger
+
+    Ornek:
+        scaler = DynamicLossScaler()
+        loss_fn = CrossEntropyLoss(scaler=scaler)
+        optimizer = SGD(model, lr=0.1, scaler=scaler)
+    """
+
+    def __init__(self, init_scale=2.0 ** 15, growth_factor=2.0, backoff_factor=0.5,
+                 growth_interval=2000, min_scale=1.0):
+        self.scale = float(init_scale)
+        self.growth_factor = growth_factor
+        self.backoff_factor = backoff_factor
+        self.growth_interval = growth_interval
+        self.min_scale = min_scale
+
+        self._good_steps = 0
+        self.skipped_steps = 0
+
+    def unscale(self, grads):
+        """
+        Gradyanlari yerinde 1/scale ile carp ve olcegi guncelle.
+
+        Args:
+            grads: Gradyan dizileri listesi
+
+        Returns:
+            bool: Tum gradyanlar sonluysa True; degilse adim atlanmali
+        """
+        inv_scale = 1.0 / self.scale
+        finite = True
+        for grad in grads:
+            grad *= inv_scale
+            finite = finite and bool(np.isfinite(grad).all())
+
+        self.update(finite)
+        return finite
+
+    def update(self, finite):
+        """Adim sonucuna gore olcegi buyut veya kucult."""
+        if not finite:
+            self.scale = max(self.scale * self.backoff_factor, self.min_scale)
+            self._good_steps = 0
+            self.skipped_steps += 1
+            return
+
+        self._good_steps += 1
+        if self._good_steps >= self.growth_interval:
+            self.scale *= self.growth_factor
+            self._good_steps = 0
+
+    def __repr__(self):
+        return f"DynamicLossScaler(scale={self.scale:g})"
+
 
 class SGD(Optimizer):
     """
@@ -41,6 +208,7 @@ class SGD(Optimizer):
     Args:
         model: Sequential model (veya get_params/get_grads olan herhangi bir model)
         lr: Learning rate (ogrenme orani)
+        scaler: (Opsiyonel) DynamicLossScaler - loss ile ayni nesne
 
     Ornek:
         optimizer = SGD(model, lr=0.1)
@@ -50,8 +218,8 @@ class SGD(Optimizer):
         optimizer.step()
     """
 
-    def __init__(self, model, lr=0.01):
-        super().__init__(model, lr)
+    def __init__(self, model, lr=0.01, scaler=None):
+        super().__init__(model, lr, scaler)
 
     def step(self):
         """
@@ -59,19 +227,275 @@ class SGD(Optimizer):
 
         Tum katmanlarin parametrelerini gunceller:
             param = param - lr * grad
-        """
-        for layer in self.model.layers:
-            params = layer.get_params()
-            grads = layer.get_grads()
 
-            if params and grads:
-                # W guncelle
-                if 'W' in params and 'dW' in grads:
-                    layer.W = layer.W - self.lr * grads['dW']
+        scaler varsa ve gradyanlarda inf/nan varsa adim atlanir.
+        """
+        pairs = self._params_and_grads()
+        if not self._unscale_grads(pairs):
+            return
 
-                # b guncelle
-                if 'b' in params and 'db' in grads:
-                    layer.b = layer.b - self.lr * grads['db']
+        lr = float(self.lr)
+        # Arenali modelde tek cift: tum model tek vektorel yerinde islem
+        for (param, grad), update in zip(pairs, self._buffers('update', pairs)):
+            np.multiply(grad, lr, out=update)
+            param -= update
 
     def __repr__(self):
         return f"SGD(lr={self.lr})"
+
+
+# ==============================================================================
+# MOMENTUM VE ADAPTIF OPTIMIZER'LAR
+# ==============================================================================
+#
+# Hepsi ayni kalibi izler:
+#   1. pairs = (parametre, gradyan) ciftleri (arenada tek cift)
+#   2. Durum buffer'lari (v, s, m) ilk adimda bir kez ayrilir
+#   3. Guncelleme out= ile yazilan yerinde ufunc'lar; 'update' buffer'i
+#      ara sonuc icin tekrar kullanilir
+#
+# Skalerler (lr, beta...) Python float'a cevrilir: float32 parametreler
+# float64'e yukselmez.
+# ==============================================================================
+
+class Momentum(Optimizer):
+    """
+    Momentum'lu SGD (heavy ball).
+
+    Formul:
+        v = momentum * v + dW
+        W = W - lr * v
+
+    nesterov=True ise Nesterov guncellemesi:
+        W = W - lr * (dW + momentum * v)
+
+    Args:
+        model: Sequential model
+        lr: Learning rate
+        momentum: Hiz katsayisi (default=0.9)
+        nesterov: Nesterov momentum kullan (default=False)
+        scaler: (Opsiyonel) DynamicLossScaler
+
+    Ornek:
+        optimizer = Momentum(model, lr=0.05, momentum=0.9)
+    """
+
+    def __init__(self, model, lr=0.01, momentum=0.9, nesterov=False, scaler=None):
+        super().__init__(model, lr, scaler)
+        self.momentum = momentum
+        self.nesterov = nesterov
+
+    def step(self):
+        """Momentum adimi (gradyanlarda inf/nan varsa atlanir)."""
+        pairs = self._params_and_grads()
+        if not self._unscale_grads(pairs):
+            return
+
+        lr, mu = float(self.lr), float(self.momentum)
+        velocities = self._buffers('velocity', pairs)
+        updates = self._buffers('update', pairs)
+
+        for (param, grad), v, update in zip(pairs, velocities, updates):
+            # v = mu * v + grad
+            v *= mu
+            v += grad
+
+            if self.nesterov:
+                # update = lr * (grad + mu * v)
+                np.multiply(v, mu, out=update)
+                update += grad
+                update *= lr
+            else:
+                np.multiply(v, lr, out=update)
+
+            param -= update
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(lr={self.lr}, momentum={self.momentum})"
+
+
+class Nesterov(Momentum):
+    """
+    Nesterov momentum: Momentum(nesterov=True).
+
+    Hiz, parametrenin 'ilerideki' konumundaki gradyanla duzeltilir; ayni
+    lr ile genelde daha kararli yakinsar.
+
+    Ornek:
+        optimizer = Nesterov(model, lr=0.05, momentum=0.9)
+    """
+
+    def __init__(self, model, lr=0.01, momentum=0.9, scaler=None):
+        super().__init__(model, lr, momentum, nesterov=True, scaler=scaler)
+
+
+class RMSProp(Optimizer):
+    """
+    RMSProp: gradyan karelerinin hareketli ortalamasiyla olceklenmis adim.
+
+    Formul:
+        s = rho * s + (1 - rho) * dW^2
+        W = W - lr * dW / (sqrt(s) + eps)
+
+    Args:
+        model: Sequential model
+        lr: Learning rate (default=0.001)
+        rho: Hareketli ortalama katsayisi (default=0.9)
+        eps: Sifira bolme onleme (default=1e-8)
+        scaler: (Opsiyonel) DynamicLossScaler
+
+    Ornek:
+        optimizer = RMSProp(model, lr=0.001)
+    """
+
+    def __init__(self, model, lr=0.001, rho=0.9, eps=1e-8, scaler=None):
+        super().__init__(model, lr, scaler)
+        self.rho = rho
+        self.eps = eps
+
+    def step(self):
+        """RMSProp adimi (gradyanlarda inf/nan varsa atlanir)."""
+        pairs = self._params_and_grads()
+        if not self._unscale_grads(pairs):
+            return
+
+        lr, rho, eps = float(self.lr), float(self.rho), float(self.eps)
+        squares = self._buffers('square_avg', pairs)
+        updates = self._buffers('update', pairs)
+
+        for (param, grad), sq, update in zip(pairs, squares, updates):
+            # s = rho * s + (1 - rho) * grad^2
+            sq *= rho
+            np.multiply(grad, grad, out=update)
+            update *= 1.0 - rho
+            sq += update
+
+            # update = lr * grad / (sqrt(s) + eps)
+            np.sqrt(sq, out=update)
+            update += eps
+            np.divide(grad, update, out=update)
+            update *= lr
+
+            param -= update
+
+    def __repr__(self):
+        return f"RMSProp(lr={self.lr}, rho={self.rho})"
+
+
+class Adam(Optimizer):
+    """
+    Adam: birinci (m) ve ikinci (v) moment tahminli adaptif optimizer.
+
+    Formul (t: adim sayisi):
+        m = beta1 * m + (1 - beta1) * dW
+        v = beta2 * v + (1 - beta2) * dW^2
+        m_hat = m / (1 - beta1^t)
+        v_hat = v / (1 - beta2^t)
+        W = W - lr * m_hat / (sqrt(v_hat) + eps)
+
+    Bias duzeltmesi m_hat/v_hat dizileri olusturmadan skalerlere katlanir:
+        W = W - (lr / bc1) * m / (sqrt(v) / sqrt(bc2) + eps)
+
+    Args:
+        model: Sequential model
+        lr: Learning rate (default=0.001)
+        beta1: Birinci moment katsayisi (default=0.9)
+        beta2: Ikinci moment katsayisi (default=0.999)
+        eps: Sifira bolme onleme (default=1e-8)
+        scaler: (Opsiyonel) DynamicLossScaler
+
+    Ornek:
+        optimizer = Adam(model, lr=0.001)
+    """
+
+    def __init__(self, model, lr=0.001, beta1=0.9, beta2=0.999, eps=1e-8, scaler=None):
+        super().__init__(model, lr, scaler)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.t = 0
+
+    def step(self):
+        """Adam adimi (gradyanlarda inf/nan varsa atlanir, t artmaz)."""
+        pairs = self._params_and_grads()
+        if not self._unscale_grads(pairs):
+            return
+
+        self.t += 1
+        lr, beta1, beta2 = float(self.lr), float(self.beta1), float(self.beta2)
+        bias_correction1 = 1.0 - beta1 ** self.t
+        bias_correction2 = 1.0 - beta2 ** self.t
+        step_size = lr / bias_correction1
+        inv_sqrt_bc2 = 1.0 / bias_correction2 ** 0.5
+        eps = float(self.eps)
+
+        moments = self._buffers('exp_avg', pairs)
+        squares = self._buffers('exp_avg_sq', pairs)
+        updates = self._buffers('update', pairs)
+
+        for (param, grad), m, v, update in zip(pairs, moments, squares, updates):
+            self._decay(param, lr)
+
+            # m = beta1 * m + (1 - beta1) * grad
+            m *= beta1
+            np.multiply(grad, 1.0 - beta1, out=update)
+            m += update
+
+            # v = beta2 * v + (1 - beta2) * grad^2
+            v *= beta2
+            np.multiply(grad, grad, out=update)
+            update *= 1.0 - beta2
+            v += update
+
+            # update = step_size * m / (sqrt(v) / sqrt(bc2) + eps)
+            np.sqrt(v, out=update)
+            update *= inv_sqrt_bc2
+            update += eps
+            np.divide(m, update, out=update)
+            update *= step_size
+
+            param -= update
+
+    def _decay(self, param, lr):
+        """Adam'da agirlik azaltma yok (bkz. AdamW)."""
+        pass
+
+    def __repr__(self):
+        return f"Adam(lr={self.lr}, betas=({self.beta1}, {self.beta2}))"
+
+
+class AdamW(Adam):
+    """
+    AdamW: agirlik azaltmasi gradyandan ayrilmis (decoupled) Adam.
+
+    Formul:
+        W = W - lr * weight_decay * W      (Adam adimindan once)
+        W = Adam adimi
+
+    L2 cezasi gradyana eklenseydi Adam'in olceklemesiyle zayiflardi;
+    AdamW azaltmayi dogrudan parametreye uygular.
+
+    Not: Arenali modelde azaltma tum parametrelere (bias dahil) uygulanir.
+
+    Args:
+        model: Sequential model
+        lr: Learning rate (default=0.001)
+        weight_decay: Agirlik azaltma katsayisi (default=0.01)
+        beta1, beta2, eps: Adam ile ayni
+        scaler: (Opsiyonel) DynamicLossScaler
+
+    Ornek:
+        optimizer = AdamW(model, lr=0.001, weight_decay=0.01)
+    """
+
+    def __init__(self, model, lr=0.001, beta1=0.9, beta2=0.999, eps=1e-8, weight_decay=0.01,
+                 scaler=None):
+        super().__init__(model, lr, beta1, beta2, eps, scaler)
+        self.weight_decay = weight_decay
+
+    def _decay(self, param, lr):
+        """param = param * (1 - lr * weight_decay), yerinde."""
+        param *= 1.0 - lr * float(self.weight_decay)
+
+    def __repr__(self):
+        return f"AdamW(lr={self.lr}, weight_decay={self.weight_decay})"
@@ -0,0 +1,326 @@
+"""
+Learning Rate Scheduler'lari ve Early Stopping
+==============================================
+Egitim boyunca optimizer.lr'yi degistiren nesneler ve iyilesme durdugunda
+egitimi bitiren kontrolcu - optimizer'dan AYRI.
+
+PyTorch tarzi kullanim:
+    optimizer = SGD(model, lr=0.1)
+    scheduler = CosineAnnealingLR(optimizer, T_max=num_epochs)
+    early_stopping = EarlyStopping(patience=10)
+
+    for epoch in range(num_epochs):
+        ...                                   # forward, backward, optimizer.step()
+        val_acc = ...
+        scheduler.step()                      # ReduceLROnPlateau: scheduler.step(val_acc)
+        if early_stopping.step(val_acc, model):
+            break
+    early_stopping.restore(model)             # en iyi agirliklara don
+
+Scheduler'lar sadece optimizer.lr attribute'unu kullanir; lr'si olan her
+optimizer ile calisir. step() epoch basina bir kez cagrilir; per_step
+True olanlarda (OneCycleLR) her optimizer.step()'ten sonra.
+"""
+
+import math
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class LRScheduler(ABC):
+    """
+    Tum scheduler'lar icin temel sinif.
+
+    Args:
+        optimizer: lr attribute'u olan optimizer. Baslangic lr'si base_lr olur.
+    """
+
+    # True ise step() dogrulama metrigini alir (bkz. Sequential.fit)
+    needs_metric = False
+
+    # True ise step() epoch sonunda degil her optimizer adimindan sonra cagrilir
+    per_step = False
+
+    def __init__(self, optimizer):
+        self.optimizer = optimizer
+        self.base_lr = optimizer.lr
+        self.epoch = 0
+
+    @abstractmethod
+    def get_lr(self):
+        """self.epoch icin learning rate."""
+        pass
+
+    def step(self):
+        """Bir epoch ilerle ve optimizer.lr'yi guncelle."""
+        self.epoch += 1
+        self.optimizer.lr = self.get_lr()
+        return self.optimizer.lr
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(lr={self.optimizer.lr:g})"
+
+
+class StepLR(LRScheduler):
+    """
+    Her step_size epoch'ta lr'yi gamma ile carpar.
+
+    Formul:
+        lr = base_lr * gamma ^ (epoch // step_size)
+
+    Ornek:
+        scheduler = StepLR(optimizer, step_size=30, gamma=0.1)
+    """
+
+    def __init__(self, optimizer, step_size, gamma=0.1):
+        super().__init__(optimizer)
+        if step_size < 1:
+            raise ValueError(f"step_size en az 1 olmali: {step_size}")
+        self.step_size = step_size
+        self.gamma = gamma
+
+    def get_lr(self):
+        return self.base_lr * self.gamma ** (self.epoch // self.step_size)
+
+
+class CosineAnnealingLR(LRScheduler):
+    """
+    lr'yi T_max epoch boyunca kosinus egrisiyle min_lr'ye indirir.
+
+    Formul:
+        lr = min_lr + (base_lr - min_lr) * (1 + cos(pi * epoch / T_max)) / 2
+
+    T_max'tan sonra lr min_lr'de kalir.
+
+    Ornek:
+        scheduler = CosineAnnealingLR(optimizer, T_max=100)
+    """
+
+    def __init__(self, optimizer, T_max, min_lr=0.0):
+        super().__init__(optimizer)
+        if T_max < 1:
+            raise ValueError(f"T_max en az 1 olmali: {T_max}")
+        self.T_max = T_max
+        self.min_lr = min_lr
+
+    def get_lr(self):
+        progress = min(self.epoch, self.T_max) / self.T_max
+        return self.min_lr + (self.base_lr - self.min_lr) * (1 + math.cos(math.pi * progress)) / 2
+
+
+class OneCycleLR(LRScheduler):
+    """
+    One-cycle politikasi: lr once max_lr'ye cikar, sonra cok kucuk bir
+    degere iner (her iki faz kosinus).
+
+        adim 0:                  max_lr / div_factor
+        adim pct_start*total:    max_lr
+        adim total_steps:        max_lr / (div_factor * final_div_factor)
+
+    Olusturuldugunda optimizer.lr baslangic degerine ayarlanir. step() her
+    optimizer adimindan sonra cagrilir (per_step: Sequential.fit batch
+    basina step() eder); total_steps toplam optimizer adimi sayisidir.
+
+    Ornek:
+        steps_per_epoch = math.ceil(m / batch_size)
+        scheduler = OneCycleLR(optimizer, max_lr=0.5, total_steps=num_epochs * steps_per_epoch)
+        model.fit(x, y, loss_fn, optimizer, batch_size, num_epochs, scheduler=scheduler)
+    """
+
+    per_step = True
+
+    def __init__(self, optimizer, max_lr, total_steps, pct_start=0.3, div_factor=25.0,
+                 final_div_factor=1e4):
+        super().__init__(optimizer)
+        if total_steps < 2:
+            raise ValueError(f"total_steps en az 2 olmali: {total_steps}")
+        if not 0 < pct_start < 1:
+            raise ValueError(f"pct_start 0 ile 1 arasinda olmali: {pct_start}")
+        self.max_lr = max_lr
+        self.total_steps = total_steps
+        self.initial_lr = max_lr / div_factor
+        self.final_lr = self.initial_lr / final_div_factor
+        self.warmup_steps = max(1, int(pct_start * total_steps))
+        optimizer.lr = self.initial_lr
+
+    @staticmethod
+    def _anneal(start, end, progress):
+        """progress 0 -> 1 iken start'tan end'e kosinus gecisi."""
+        return end + (start - end) * (1 + math.cos(math.pi * progress)) / 2
+
+    def get_lr(self):
+        step = min(self.epoch, self.total_steps)
+        if step <= self.warmup_steps:
+            return self._anneal(self.initial_lr, self.max_lr, step / self.warmup_steps)
+        progress = (step - self.warmup_steps) / (self.total_steps - self.warmup_steps)
+        return self._anneal(self.max_lr, self.final_lr, progress)
+
+
+class ReduceLROnPlateau(LRScheduler):
+    """
+    Izlenen metrik patience epoch boyunca iyilesmezse lr'yi factor ile carpar.
+
+    Args:
+        optimizer: Optimizer
+        mode: 'max' (dogruluk) veya 'min' (loss)
+        factor: Azaltma carpani (default=0.1)
+        patience: Iyilesmesiz beklenen epoch sayisi (default=10)
+        threshold: Iyilesme sayilmasi icin en kucuk fark (default=1e-4)
+        min_lr: lr'nin alt siniri
+
+    Ornek:
+        scheduler = ReduceLROnPlateau(optimizer, mode='max', patience=5)
+        scheduler.step(val_acc)
+    """
+
+    needs_metric = True
+
+    def __init__(self, optimizer, mode='max', factor=0.1, patience=10, threshold=1e-4, min_lr=0.0):
+        super().__init__(optimizer)
+        if mode not in ('min', 'max'):
+            raise ValueError(f"mode 'min' veya 'max' olmali: {mode!r}")
+        if not 0 < factor < 1:
+            raise ValueError(f"factor 0 ile 1 arasinda olmali: {factor}")
+        self.mode = mode
+        self.factor = factor
+        self.patience = patience
+        self.threshold = threshold
+        self.min_lr = min_lr
+
+        self.best = None
+        self.bad_epochs = 0
+
+    def _is_improvement(self, metric):
+        if self.best is None:
+            return True
+        if self.mode == 'max':
+            return metric > self.best + self.threshold
+        return metric < self.best - self.threshold
+
+    def get_lr(self):
+        return self.optimizer.lr
+
+    def step(self, metric):
+        """
+        Metrigi kaydet; patience asildiysa lr'yi azalt.
+
+        Args:
+            metric: Bu epoch'un dogrulama metrigi
+
+        Returns:
+            Guncel learning rate
+        """
+        self.epoch += 1
+        if self._is_improvement(metric):
+            self.best = metric
+            self.bad_epochs = 0
+        else:
+            self.bad_epochs += 1
+            if self.bad_epochs > self.patience:
+                self.optimizer.lr = max(self.optimizer.lr * self.factor, self.min_lr)
+                self.bad_epochs = 0
+        return self.optimizer.lr
+
+
+# ==============================================================================
+# EARLY STOPPING
+# ==============================================================================
+#
+# En iyi dogrulama metriginde agirliklar kopyalanir. Sequential'da bu tek
+# bir np.copyto'dur (parametre arenasi, bkz. Sequential.arena); arenasiz
+# modellerde katman katman kopyalanir. Buffer'lar ilk kayitta bir kez ayrilir.
+# ==============================================================================
+
+class EarlyStopping:
+    """
+    Dogrulama metrigi patience epoch boyunca iyilesmezse egitimi durdur.
+
+    Args:
+        patience: Iyilesmesiz beklenen epoch sayisi (default=10)
+        mode: 'max' (dogruluk) veya 'min' (loss)
+        min_delta: Iyilesme sayilmasi icin en kucuk fark (default=0)
+        restore_best: En iyi epoch'un agirliklarini sakla (default=True)
+
+    Ornek:
+        early_stopping = EarlyStopping(patience=10)
+        for epoch in range(num_epochs):
+            ...
+            if early_stopping.step(val_acc, model):
+                break
+        early_stopping.restore(model)
+    """
+
+    def __init__(self, patience=10, mode='max', min_delta=0.0, restore_best=True):
+        if mode not in ('min', 'max'):
+            raise ValueError(f"mode 'min' veya 'max' olmali: {mode!r}")
+        self.patience = patience
+        self.mode = mode
+        self.min_delta = min_delta
+        self.restore_best = restore_best
+
+        self.best = None
+        self.best_epoch = 0
+        self.epoch = 0
+        self.bad_epochs = 0
+        self.should_stop = False
+        self._best_weights = None
+
+    def _is_improvement(self, metric):
+        if self.best is None:
+            return True
+        if self.mode == 'max':
+            return metric > self.best + self.min_delta
+        return metric < self.best - self.min_delta
+
+    def step(self, metric, model=None):
+        """
+        Epoch sonu metrigini kaydet.
+
+        Args:
+            metric: Dogrulama metrigi
+            model: (Opsiyonel) En iyi agirliklari saklanacak model
+
+        Returns:
+            bool: Egitim durdurulmali mi
+        """
+        self.epoch += 1
+        if self._is_improvement(metric):
+            self.best = metric
+            self.best_epoch = self.epoch
+            self.bad_epochs = 0
+            if self.restore_best and model is not None:
+                self._save(model)
+        else:
+            self.bad_epochs += 1
+            self.should_stop = self.bad_epochs >= self.patience
+        return self.should_stop
+
+    def _weights(self, model):
+        """Modelin agirlik dizileri: arena varsa tek duz dizi."""
+        if hasattr(model, 'arena'):
+            param_arena, _ = model.arena()
+            return [] if param_arena is None else [param_arena]
+        return [param for layer in model.layers for param in layer.get_params().values()]
+
+    def _save(self, model):
+        weights = self._weights(model)
+        if self._best_weights is None or [w.shape for w in weights] != [b.shape for b in self._best_weights]:
+            self._best_weights = [np.empty_like(w) for w in weights]
+        for best, w in zip(self._best_weights, weights):
+            np.copyto(best, w)
+
+    def restore(self, model):
+        """
+        En iyi epoch'un agirliklarini modele geri yukle (yerinde).
+
+        Returns:
+            bool: Geri yukleme yapildi mi
+        """
+        if self._best_weights is None:
+            return False
+        for w, best in zip(self._weights(model), self._best_weights):
+            np.copyto(w, best)
+        return True
+
+    def __repr__(self):
+        return f"EarlyStopping(patience={self.patience}, best={self.best}, best_epoch={self.best_epoch})"
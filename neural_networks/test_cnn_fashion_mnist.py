@@ -9,14 +9,14 @@ im2col optimizasyonu veya GPU kullanilir.
 
 import os
 import numpy as np
-import pandas as pd
 import time
 
 # Framework importlari
-from layers import Dense, ReLU, Softmax, Conv2D, MaxPool2D, Flatten
+from layers import Dense, ReLU, Conv2D, MaxPool2D, Flatten, get_default_dtype
 from models import Sequential
-from losses import CrossEntropyLoss
-from optimizers import SGD
+from losses import SoftmaxCrossEntropy
+from optimizers import SGD, CosineAnnealingLR, EarlyStopping
+from data import DataLoader, load_fashion_mnist
 
 # Tekrarlanabilirlik
 np.random.seed(42)
@@ -28,20 +28,15 @@ TRAIN_CSV = os.path.join(DATA_DIR, "fashion-mnist_train.csv")
 TEST_CSV = os.path.join(DATA_DIR, "fashion-mnist_test.csv")
 
 print("Veri yukleniyor...")
-train_data = pd.read_csv(TRAIN_CSV)
-test_data = pd.read_csv(TEST_CSV)
+# uint8 .npy cache'i (ilk calistirmada CSV'den olusturulur), memory-map ile
+X_train, y_train = load_fashion_mnist(TRAIN_CSV)  # (m, 784) uint8, (m,) sinif indeksleri
+X_test, y_test = load_fashion_mnist(TEST_CSV)
 
-y_train = train_data.iloc[:, 0].values
-X_train = train_data.iloc[:, 1:].values
+# Normalizasyon (0-255 -> 0-1) batch batch yapilir: pikseller uint8 kalir,
+# her batch katmanlarin dtype'inda yeniden kullanilan bir buffer'a yazilir
+NORMALIZE = dict(dtype=get_default_dtype(), scale=1 / 255.0)
 
-y_test = test_data.iloc[:, 0].values
-X_test = test_data.iloc[:, 1:].values
-
-# Normalizasyon
-X_train = X_train / 255.0
-X_test = X_test / 255.0
-
-# CNN icin 4D format: (m, C, H, W)
+# CNN icin 4D format: (m, C, H, W) - uint8 view, kopya yok
 # (60000, 784) -> (60000, 1, 28, 28)
 X_train_cnn = X_train.reshape(-1, 1, 28, 28)
 X_test_cnn = X_test.reshape(-1, 1, 28, 28)
@@ -51,36 +46,27 @@ print(f"X_test_cnn:  {X_test_cnn.shape}")
 
 # CNN yavas oldugu icin kucuk subset kullanalim
 TRAIN_SIZE = 10000
+VAL_SIZE = 1000     # egitim setinden, TRAIN_SIZE orneginden sonra
 TEST_SIZE = 1000
 
 X_train_small = X_train_cnn[:TRAIN_SIZE]
 y_train_small = y_train[:TRAIN_SIZE]
+X_val_small = X_train_cnn[TRAIN_SIZE:TRAIN_SIZE + VAL_SIZE]
+y_val_small = y_train[TRAIN_SIZE:TRAIN_SIZE + VAL_SIZE]
 X_test_small = X_test_cnn[:TEST_SIZE]
 y_test_small = y_test[:TEST_SIZE]
 
 print(f"\nKucuk dataset (hiz icin):")
 print(f"  Train: {X_train_small.shape[0]} ornek")
+print(f"  Val:   {X_val_small.shape[0]} ornek")
 print(f"  Test:  {X_test_small.shape[0]} ornek")
 
 
-# ============== ONE-HOT ENCODING ==============
-def one_hot_encode(y, num_classes=10):
-    m = y.shape[0]
-    one_hot = np.zeros((num_classes, m))
-    one_hot[y, np.arange(m)] = 1
-    return one_hot
-
-Y_train_small = one_hot_encode(y_train_small)
-Y_test_small = one_hot_encode(y_test_small)
-
-
 # ============== ACCURACY ==============
-def compute_accuracy(model, X, Y):
-    y_pred = model.forward(X)
-    predictions = np.argmax(y_pred, axis=0)
-    labels = np.argmax(Y, axis=0)
-    accuracy = np.mean(predictions == labels) * 100
-    return accuracy
+def compute_accuracy(model, X, labels):
+    # Cikarim modu: cache doldurulmaz, veri 1000'lik parcalarla normalize edilip islenir
+    loader = DataLoader(X, labels, batch_size=1000, shuffle=False, prefetch=0, **NORMALIZE)
+    return model.evaluate(loader)
 
 
 # ============== MODEL ==============
@@ -115,8 +101,7 @@ Mimari:
     Flatten:  (2704, m)        -> 16 * 13 * 13 = 2704
     Dense:    (64, m)
     ReLU
-    Dense:    (10, m)
-    Softmax
+    Dense:    (10, m)          -> logit (Softmax loss icinde)
 """
 
 model = Sequential([
@@ -126,14 +111,21 @@ model = Sequential([
     Flatten(),
     Dense(FLATTEN_SIZE, HIDDEN_UNITS),
     ReLU(),
-    Dense(HIDDEN_UNITS, NUM_CLASSES),
-    Softmax()
+    Dense(HIDDEN_UNITS, NUM_CLASSES)
 ])
 
 print(model)
 
-loss_fn = CrossEntropyLoss()
-optimizer = SGD(model, lr=0.01)  # CNN icin daha dusuk lr
+loss_fn = SoftmaxCrossEntropy()
+optimizer = SGD(model, lr=0.05)
+
+num_epochs = 30  # en fazla; early stopping daha once bitirebilir
+batch_size = 64
+
+# lr num_epochs boyunca kosinusle azalir; dogrulama dogrulugu 5 epoch
+# iyilesmezse egitim durur ve en iyi agirliklara donulur
+scheduler = CosineAnnealingLR(optimizer, T_max=num_epochs)
+early_stopping = EarlyStopping(patience=5)
 
 print(f"\nLoss:      {loss_fn}")
 print(f"Optimizer: {optimizer}")
@@ -144,51 +136,43 @@ print("\n" + "="*60)
 print("EGITIM BASLIYOR (CNN yavas, sabir...)")
 print("="*60)
 
-num_epochs = 200  # CNN yavas oldugu icin az epoch
-print_interval = 10
-
 print(f"\nHiperparametreler:")
-print(f"  Epochs:        {num_epochs}")
+print(f"  Epochs (en fazla): {num_epochs}")
+print(f"  Batch size:    {batch_size}")
 print(f"  Learning rate: {optimizer.lr}")
 print(f"  Train ornekleri: {X_train_small.shape[0]}")
-print(f"  Test ornekleri:  {X_test_small.shape[0]}")
-
-print(f"\n{'Epoch':>6} | {'Loss':>10} | {'Train Acc':>10} | {'Test Acc':>10} | {'Sure':>10}")
-print("-" * 65)
+print(f"  Val ornekleri:   {X_val_small.shape[0]}")
+print(f"  Test ornekleri:  {X_test_small.shape[0]}\n")
 
 total_start = time.time()
 
-for epoch in range(num_epochs):
-    epoch_start = time.time()
-
-    # Forward
-    y_pred = model.forward(X_train_small)
-
-    # Loss
-    loss = loss_fn.forward(y_pred, Y_train_small)
-
-    # Backward
-    dout = loss_fn.backward()
-    model.backward(dout)
-
-    # Update
-    optimizer.step()
-
-    epoch_time = time.time() - epoch_start
-
-    # Log
-    if (epoch + 1) % print_interval == 0:
-        train_acc = compute_accuracy(model, X_train_small, Y_train_small)
-        test_acc = compute_accuracy(model, X_test_small, Y_test_small)
-        print(f"{epoch+1:>6} | {loss:>10.4f} | {train_acc:>9.2f}% | {test_acc:>9.2f}% | {epoch_time:>8.1f}s")
+# Batch'ler arka plan thread'inde hazirlanir (karistirma + toplama)
+train_loader = DataLoader(X_train_small, y_train_small, batch_size=batch_size, seed=42, prefetch=2,
+                          **NORMALIZE)
+val_loader = DataLoader(X_val_small, y_val_small, batch_size=VAL_SIZE, shuffle=False, prefetch=0,
+                        **NORMALIZE)
+
+# Mini-batch egitim: epoch sonunda dogrulama, lr plani ve early stopping
+# (en iyi agirliklar geri yuklenir)
+history = model.fit(
+    train_loader,
+    loss_fn=loss_fn,
+    optimizer=optimizer,
+    epochs=num_epochs,
+    validation_data=val_loader,
+    scheduler=scheduler,
+    early_stopping=early_stopping,
+)
 
 total_time = time.time() - total_start
-print("-" * 65)
+print("-" * 64)
 print(f"Egitim tamamlandi! Toplam sure: {total_time:.1f}s")
+print(f"En iyi val: {early_stopping.best:.2f}% (epoch {early_stopping.best_epoch})")
+print(f"Ortalama hiz: {np.mean(history['samples_per_sec']):.0f} ornek/sn")
 
 # Final sonuclar
-final_train_acc = compute_accuracy(model, X_train_small, Y_train_small)
-final_test_acc = compute_accuracy(model, X_test_small, Y_test_small)
+final_train_acc = compute_accuracy(model, X_train_small, y_train_small)
+final_test_acc = compute_accuracy(model, X_test_small, y_test_small)
 
 print(f"\n{'='*60}")
 print(f"SONUCLAR")
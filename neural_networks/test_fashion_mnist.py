@@ -9,13 +9,13 @@ Ayni veri, ayni hiperparametreler, benzer sonuclar olmali.
 import os
 import sys
 import numpy as np
-import pandas as pd
 
 # Framework importlari
-from layers import Dense, ReLU, Softmax
+from layers import Dense, ReLU, get_default_dtype
 from models import Sequential
-from losses import CrossEntropyLoss
-from optimizers import SGD
+from losses import SoftmaxCrossEntropy
+from optimizers import SGD, ReduceLROnPlateau, EarlyStopping
+from data import DataLoader, load_fashion_mnist
 
 # Tekrarlanabilirlik icin seed
 np.random.seed(42)
@@ -26,46 +26,38 @@ TRAIN_CSV = os.path.join(DATA_DIR, "fashion-mnist_train.csv")
 TEST_CSV = os.path.join(DATA_DIR, "fashion-mnist_test.csv")
 
 print("Veri yukleniyor...")
-train_data = pd.read_csv(TRAIN_CSV)
-test_data = pd.read_csv(TEST_CSV)
+# Ilk calistirmada CSV uint8 .npy cache'ine cevrilir, sonrakilerde
+# memory-map ile milisaniyede acilir (bkz. data/fashion_mnist.py)
+X_train, y_train = load_fashion_mnist(TRAIN_CSV)  # (m, 784) uint8, (m,) sinif indeksleri
+X_test, y_test = load_fashion_mnist(TEST_CSV)
 
-# Etiketler ve pikseller
-y_train = train_data.iloc[:, 0].values
-X_train = train_data.iloc[:, 1:].values
-
-y_test = test_data.iloc[:, 0].values
-X_test = test_data.iloc[:, 1:].values
-
-# Normalizasyon (0-255 -> 0-1)
-X_train = X_train / 255.0
-X_test = X_test / 255.0
+# Dogrulama seti: egitim setinin son VAL_SIZE ornegi (lr azaltma ve early
+# stopping kararlari test setine bakmadan verilir)
+VAL_SIZE = 5000
+X_val, y_val = X_train[-VAL_SIZE:], y_train[-VAL_SIZE:]
+X_train, y_train = X_train[:-VAL_SIZE], y_train[:-VAL_SIZE]
 
 # Transpose (m, 784) -> (784, m)
+# View olarak kalir: DataLoader ornekleri ardisik satirlardan toplar
 X_train = X_train.T
+X_val = X_val.T
 X_test = X_test.T
 
-print(f"X_train: {X_train.shape}")
+print(f"X_train: {X_train.shape} {X_train.dtype}")
+print(f"X_val:   {X_val.shape}")
 print(f"X_test:  {X_test.shape}")
 
-
-# ============== ONE-HOT ENCODING ==============
-def one_hot_encode(y, num_classes=10):
-    m = y.shape[0]
-    one_hot = np.zeros((num_classes, m))
-    one_hot[y, np.arange(m)] = 1
-    return one_hot
-
-Y_train = one_hot_encode(y_train)
-Y_test = one_hot_encode(y_test)
+# Normalizasyon (0-255 -> 0-1) batch batch yapilir: pikseller uint8 kalir,
+# her batch katmanlarin dtype'inda (varsayilan float32) yeniden kullanilan
+# bir buffer'a x * (1/255) olarak yazilir
+NORMALIZE = dict(dtype=get_default_dtype(), scale=1 / 255.0)
 
 
 # ============== ACCURACY HESAPLAMA ==============
-def compute_accuracy(model, X, Y):
-    y_pred = model.forward(X)
-    predictions = np.argmax(y_pred, axis=0)
-    labels = np.argmax(Y, axis=0)
-    accuracy = np.mean(predictions == labels) * 100
-    return accuracy
+def compute_accuracy(model, X, labels):
+    # Cikarim modu: cache doldurulmaz, veri 10000'lik parcalarla normalize edilip islenir
+    loader = DataLoader(X, labels, batch_size=10000, shuffle=False, prefetch=0, **NORMALIZE)
+    return model.evaluate(loader)
 
 
 # ============== MODEL OLUSTURMA ==============
@@ -75,17 +67,21 @@ print("="*60)
 
 model = Sequential([
     Dense(784, 128, seed=42),
-    ReLU(),
-    Dense(128, 10, seed=42),
-    Softmax()
+    ReLU(inplace=True),     # Dense ciktisi buffer'inda yerinde
+    Dense(128, 10, seed=42)
 ])
 
 print(model)
 
 # Loss ve Optimizer (PyTorch tarzi - ayri)
-loss_fn = CrossEntropyLoss()
+loss_fn = SoftmaxCrossEntropy()
 optimizer = SGD(model, lr=0.1)
 
+# Dogrulama dogrulugu 3 epoch iyilesmezse lr yariya iner,
+# 8 epoch iyilesmezse egitim durur ve en iyi agirliklara donulur
+scheduler = ReduceLROnPlateau(optimizer, mode='max', factor=0.5, patience=3)
+early_stopping = EarlyStopping(patience=8)
+
 print(f"\nLoss:      {loss_fn}")
 print(f"Optimizer: {optimizer}")
 
@@ -95,44 +91,40 @@ print("\n" + "="*60)
 print("EGITIM BASLIYOR")
 print("="*60)
 
-num_epochs = 200
-print_interval = 10
+num_epochs = 50
+batch_size = 128
 
 print(f"\nHiperparametreler:")
-print(f"  Epochs:        {num_epochs}")
+print(f"  Epochs (en fazla): {num_epochs}")
+print(f"  Batch size:    {batch_size}")
 print(f"  Learning rate: {optimizer.lr}")
 print(f"  Train ornekleri: {X_train.shape[1]}")
-print(f"  Test ornekleri:  {X_test.shape[1]}")
-
-print(f"\n{'Epoch':>6} | {'Loss':>10} | {'Train Acc':>10} | {'Test Acc':>10}")
-print("-" * 50)
-
-for epoch in range(num_epochs):
-    # Forward
-    y_pred = model.forward(X_train)
-
-    # Loss
-    loss = loss_fn.forward(y_pred, Y_train)
-
-    # Backward
-    dout = loss_fn.backward()
-    model.backward(dout)
-
-    # Update
-    optimizer.step()
-
-    # Log
-    if (epoch + 1) % print_interval == 0 or epoch == 0:
-        train_acc = compute_accuracy(model, X_train, Y_train)
-        test_acc = compute_accuracy(model, X_test, Y_test)
-        print(f"{epoch+1:>6} | {loss:>10.4f} | {train_acc:>9.2f}% | {test_acc:>9.2f}%")
-
-print("-" * 50)
-print("Egitim tamamlandi!")
+print(f"  Val ornekleri:   {X_val.shape[1]}")
+print(f"  Test ornekleri:  {X_test.shape[1]}\n")
+
+# Batch'ler arka plan thread'inde hazirlanir (karistirma + toplama)
+train_loader = DataLoader(X_train, y_train, batch_size=batch_size, seed=42, prefetch=2, **NORMALIZE)
+val_loader = DataLoader(X_val, y_val, batch_size=VAL_SIZE, shuffle=False, prefetch=0, **NORMALIZE)
+
+# Mini-batch egitim: epoch sonunda dogrulama, lr plani ve early stopping
+# (en iyi agirliklar geri yuklenir)
+history = model.fit(
+    train_loader,
+    loss_fn=loss_fn,
+    optimizer=optimizer,
+    epochs=num_epochs,
+    validation_data=val_loader,
+    scheduler=scheduler,
+    early_stopping=early_stopping,
+)
+
+print("-" * 64)
+print(f"Egitim tamamlandi! En iyi val: {early_stopping.best:.2f}% (epoch {early_stopping.best_epoch})")
+print(f"Ortalama hiz: {np.mean(history['samples_per_sec']):.0f} ornek/sn")
 
 # Final sonuclar
-final_train_acc = compute_accuracy(model, X_train, Y_train)
-final_test_acc = compute_accuracy(model, X_test, Y_test)
+final_train_acc = compute_accuracy(model, X_train, y_train)
+final_test_acc = compute_accuracy(model, X_test, y_test)
 
 print(f"\n{'='*60}")
 print(f"SONUCLAR")